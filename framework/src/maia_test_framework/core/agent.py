@@ -1,24 +1,31 @@
 # maia_test_framework/core/agent.py
+import asyncio
+import dataclasses
 import json
-from typing import List
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from maia_test_framework.core.message import Message, AgentResponse
 from maia_test_framework.providers.base import BaseProvider
 from maia_test_framework.core.tools.base import BaseTool
+from maia_test_framework.core.usage import TokenUsage
 
 class Agent:
-    def __init__(self, name: str, provider: BaseProvider, system_message: str = "", ignore_trigger_prompt: str = "", tools: List[BaseTool] = None):
+    def __init__(self, name: str, provider: BaseProvider, system_message: str = "", ignore_trigger_prompt: str = "", tools: List[BaseTool] = None, max_tool_steps: int = 5, tool_timeout: Optional[float] = None):
         self.name = name
         self.provider = provider
         self.system_message = system_message
         self.ignore_trigger_prompt = ignore_trigger_prompt
         self.tools = tools or []
+        # Rounds of tool calls per response, and seconds each tool call may take (None waits indefinitely)
+        self.max_tool_steps = max_tool_steps
+        self.tool_timeout = tool_timeout
 
     def _format_tools_prompt(self):
         if not self.tools:
             return ""
-        
+
         tool_schemas = [tool.get_schema() for tool in self.tools]
-        
+
         prompt = """
 You have access to the following tools. To use a tool, you must respond with a JSON object with the following structure:
 {
@@ -35,38 +42,138 @@ Here are the available tools:
         prompt += json.dumps(tool_schemas, indent=2)
         return prompt
 
-    async def generate_response(self, history: List[Message]) -> AgentResponse:
-        system_message = self.system_message + self._format_tools_prompt()
-        
-        response = await self.provider.base_generate(
-            history=history,
-            system_message=system_message,
-            ignore_trigger_prompt=self.ignore_trigger_prompt
-        )
+    def _get_tool_definitions(self) -> List[Dict[str, Any]]:
+        """Tool schemas in the OpenAI function calling format used by LiteLLM."""
+        definitions = []
+        for tool in self.tools:
+            schema = tool.get_schema()
+            definitions.append(schema if schema.get("type") == "function" else {"type": "function", "function": schema})
+        return definitions
 
+    def uses_native_tools(self) -> bool:
+        """Whether tools are passed to the provider's function calling API instead of the prompt."""
+        return bool(self.tools) and self.provider.supports_native_tools()
+
+    def _get_tool(self, name: str) -> Optional[BaseTool]:
+        return next((tool for tool in self.tools if tool.name == name), None)
+
+    @staticmethod
+    def _parse_prompt_tool_call(content: str) -> Optional[Dict[str, Any]]:
+        """The tool call requested in a JSON reply, following the prompt protocol."""
         try:
-            response_data = json.loads(response.content)
+            response_data = json.loads(content)
             if "tool_call" in response_data:
                 tool_call = response_data["tool_call"]
-                tool_name = tool_call["name"]
-                tool_params = tool_call["parameters"]
-
-                tool_to_use = next((tool for tool in self.tools if tool.name == tool_name), None)
-
-                if tool_to_use:
-                    tool_result = await tool_to_use.execute(**tool_params)
-                    
-                    history.append(Message(sender=self.name, sender_type="agent", receiver=tool_call["name"], receiver_type="tool", content=response.content))
-                    history.append(Message(sender=tool_call["name"], sender_type="tool", content=json.dumps({"tool_output": tool_result})))
-
-                    # Second call to LLM with tool result
-                    return await self.provider.base_generate(
-                        history=history,
-                        system_message=system_message,
-                        ignore_trigger_prompt=self.ignore_trigger_prompt
-                    )
-        except (json.JSONDecodeError, KeyError):
-            # Not a tool call, return original response
+                return {"name": tool_call["name"], "parameters": tool_call["parameters"]}
+        except (json.JSONDecodeError, KeyError, TypeError):
+            # Not a tool call
             pass
+        return None
+
+    async def _run_tool_call(self, tool_call: Dict[str, Any]) -> Tuple[Any, str]:
+        """Run one requested call, returning its result and outcome (ok, timeout or error)."""
+        tool = self._get_tool(tool_call["name"])
+        if tool is None:
+            return {"error": f"Unknown tool '{tool_call['name']}'"}, "error"
+        if not isinstance(tool_call["parameters"], dict):
+            return {"error": f"Invalid arguments for tool '{tool_call['name']}': {tool_call['parameters']}"}, "error"
+        try:
+            return await asyncio.wait_for(tool.execute(**tool_call["parameters"]), timeout=self.tool_timeout), "ok"
+        except asyncio.TimeoutError as e:
+            return {"error": str(e) or f"Tool '{tool_call['name']}' timed out after {self.tool_timeout} seconds"}, "timeout"
+        except Exception as e:
+            # Reported back to the model, which may retry or answer without the tool
+            return {"error": f"Tool '{tool_call['name']}' failed: {e}"}, "error"
+
+    async def _timed_tool_call(self, tool_call: Dict[str, Any]) -> Tuple[Any, str, float]:
+        start_time = time.perf_counter()
+        result, outcome = await self._run_tool_call(tool_call)
+        return result, outcome, time.perf_counter() - start_time
+
+    async def _generate(self, history: List[Message], system_message: str, tools: Optional[List[Dict[str, Any]]]) -> AgentResponse:
+        return await self.provider.base_generate(
+            history=history,
+            system_message=system_message,
+            ignore_trigger_prompt=self.ignore_trigger_prompt,
+            **({"tools": tools} if tools else {}),
+        )
+
+    def _requested_tool_calls(self, response: AgentResponse, native_tools: bool) -> List[Dict[str, Any]]:
+        if native_tools:
+            return response.metadata.get("tool_calls", [])
+        tool_call = self._parse_prompt_tool_call(response.content)
+        # Prompt protocol replies naming an unknown tool are treated as plain answers
+        return [tool_call] if tool_call and self._get_tool(tool_call["name"]) else []
+
+    async def generate_response(self, history: List[Message]) -> AgentResponse:
+        """Generate a reply, running the tools the model asks for.
+
+        Up to `max_tool_steps` rounds of tool calls are run, the calls of one round
+        concurrently. Each round adds the requesting message and one message per
+        tool result to `history`, with their step number and timings.
+        """
+        native_tools = self.uses_native_tools()
+        if native_tools:
+            system_message = self.system_message
+            tools = self._get_tool_definitions()
+        else:
+            system_message = self.system_message + self._format_tools_prompt()
+            tools = None
+
+        response = await self._generate(history, system_message, tools)
+        usage = TokenUsage.from_dict(response.metadata["usage"]) if "usage" in response.metadata else None
+
+        step = 0
+        unanswered_tool_calls = None
+        while True:
+            tool_calls = self._requested_tool_calls(response, native_tools)
+            if not tool_calls:
+                break
+            if step == self.max_tool_steps:
+                # Out of steps, further requests are left unanswered
+                unanswered_tool_calls = tool_calls
+                break
+            step += 1
+
+            metadata = {"tool_step": step, "processing_time": getattr(response, "processing_time", None)}
+            if native_tools:
+                metadata["tool_calls"] = tool_calls
+            history.append(Message(
+                sender=self.name,
+                sender_type="agent",
+                receiver=", ".join(call["name"] for call in tool_calls),
+                receiver_type="tool",
+                content=response.content,
+                metadata=metadata,
+            ))
+
+            start_time = time.perf_counter()
+            results = await asyncio.gather(*(self._timed_tool_call(tool_call) for tool_call in tool_calls))
+            step_duration = time.perf_counter() - start_time
+            for tool_call, (tool_result, outcome, duration) in zip(tool_calls, results):
+                metadata = {"tool_step": step, "outcome": outcome, "duration": duration, "step_duration": step_duration}
+                if native_tools:
+                    metadata["tool_call_id"] = tool_call["id"]
+                history.append(Message(
+                    sender=tool_call["name"],
+                    sender_type="tool",
+                    content=json.dumps({"tool_output": tool_result}, default=str),
+                    metadata=metadata,
+                ))
+
+            # Next call to LLM with the tool results
+            response = await self._generate(history, system_message, tools)
+            if usage is not None:
+                usage = usage + TokenUsage.from_dict(response.metadata.get("usage"))
 
-        return response
+        # The provider may share the response with its cache and coalesced callers,
+        # so the reply gets metadata of its own
+        metadata = {key: value for key, value in response.metadata.items() if key != "tool_calls"}
+        if unanswered_tool_calls:
+            metadata["unanswered_tool_calls"] = unanswered_tool_calls
+        if step:
+            metadata["tool_steps"] = step
+            # Account for the tool-selecting calls as well
+            if usage is not None:
+                metadata["usage"] = usage.to_dict()
+        return dataclasses.replace(response, metadata=metadata)
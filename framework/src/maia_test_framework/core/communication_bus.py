@@ -1,6 +1,7 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 from maia_test_framework.core.message import Message
 from maia_test_framework.core.agent import Agent
+from maia_test_framework.core.transcript import Transcript
 
 class CommunicationBus:
     """Handles low-level message exchange and history"""
@@ -8,6 +9,7 @@ class CommunicationBus:
     def __init__(self):
         self.message_history: List[Message] = []
         self.agents: Dict[str, Agent] = {}
+        self.transcript = Transcript(self.message_history)
     
     def register_agent(self, agent: Agent):
         """Register an agent with the bus"""
@@ -28,3 +30,7 @@ class CommunicationBus:
     def get_history(self) -> List[Message]:
         """Get the full message history"""
         return self.message_history
+
+    def get_transcript(self, format: str = "plain", max_chars: Optional[int] = None) -> str:
+        """Get the conversation as text, rendered incrementally per format"""
+        return self.transcript.get_text(format, max_chars)
@@ -2,3 +2,24 @@ class MaiaAssertionError(AssertionError):
     def __init__(self, message, result=None):
         super().__init__(message)
         self.result = result
+
+
+class CassetteMissError(LookupError):
+    """Raised by a strict cassette when a request has no recorded response."""
+    def __init__(self, message, key=None):
+        super().__init__(message)
+        self.key = key
+
+
+class BudgetExceededError(RuntimeError):
+    """Raised before a provider call once a token or cost budget is used up."""
+    def __init__(self, message, usage=None):
+        super().__init__(message)
+        self.usage = usage
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+    def __init__(self, message, endpoint=None):
+        super().__init__(message)
+        self.endpoint = endpoint
@@ -41,3 +41,10 @@ class AgentResponse:
 @dataclass
 class TimedAgentResponse(AgentResponse):
     processing_time: float = 0.0
+    time_to_first_token: Optional[float] = None  # Only measured for streamed responses
+
+@dataclass
+class ResponseChunk:
+    """A piece of a streamed response. The final chunk may carry metadata only."""
+    content: str = ""
+    metadata: Dict[str, Any] = field(default_factory=dict)
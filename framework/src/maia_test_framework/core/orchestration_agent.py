@@ -1,12 +1,27 @@
-from typing import List
+from collections import Counter
+from typing import Any, Dict, List, Optional
 from maia_test_framework.core.agent import Agent
 from maia_test_framework.core.message import Message, AgentResponse
+from maia_test_framework.core.routing import FastRouter
 from maia_test_framework.providers.base import BaseProvider
 
 
 class OrchestrationAgent(Agent):
-    def __init__(self, provider: BaseProvider, name: str = "Orchestrator"):
+    def __init__(self, provider: BaseProvider, name: str = "Orchestrator", routing: Optional[Dict[str, Any]] = None):
         super().__init__(name, provider)
+        # Optional cache, keyword rules and classifier consulted before the LLM, see FastRouter
+        self.router: Optional[FastRouter] = FastRouter.from_config(routing) if routing else None
+        # How often each agent was chosen, the likelihood estimate for speculative routing
+        self.routing_counts: Counter = Counter()
+
+    def record_route(self, agent_name: str):
+        self.routing_counts[agent_name] += 1
+
+    def get_likely_agents(self, agents: List[Agent], k: int) -> List[Agent]:
+        """The k agents most often routed to so far, ties broken by registration order."""
+        candidates = [agent for agent in agents if agent.name != self.name]
+        ranked = sorted(enumerate(candidates), key=lambda item: (-self.routing_counts[item[1].name], item[0]))
+        return [agent for _, agent in ranked[:k]]
 
     def _build_system_message(self, agents: List[Agent]) -> str:
         agent_descriptions = []
@@ -25,10 +40,26 @@ If no agent is suitable, you should respond with "None".
     async def generate_response(self, history: List[Message], agents: List[Agent] = None) -> AgentResponse:
         if not agents:
             agents = []
-            
-        self.system_message = self._build_system_message(agents)
+
         last_message = history[-1] if history else ""
-        return await self.provider.base_generate(
+        agent_names = [agent.name for agent in agents if agent.name != self.name]
+        message_text = last_message.content if last_message else ""
+        if self.router is not None:
+            decision = self.router.route(message_text, agent_names)
+            if decision is not None:
+                return AgentResponse(content=decision["agent"], metadata={"routing": decision})
+
+        self.system_message = self._build_system_message(agents)
+        response = await self.provider.base_generate(
             history=[last_message],
             system_message=self.system_message,
-        )
\ No newline at end of file
+        )
+        if self.router is not None and not response.metadata.get("error"):
+            agent_name = response.content.strip()
+            self.router.learn(message_text, agent_names, agent_name if agent_name in agent_names else None)
+            response.metadata["routing"] = {"agent": agent_name, "source": "llm"}
+        return response
+
+    def get_routing_stats(self) -> Dict[str, Any]:
+        """Routing decisions by source and the share answered without the LLM."""
+        return self.router.get_stats() if self.router is not None else {}
\ No newline at end of file
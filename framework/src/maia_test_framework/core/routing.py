@@ -0,0 +1,184 @@
+import math
+import re
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from maia_test_framework.utils.fingerprint import fingerprint
+
+ROUTING_SOURCES = ("cache", "rules", "classifier", "llm")
+
+
+def normalize_message(text: str) -> str:
+    """Lowercase, without punctuation and repeated whitespace, so near-identical messages match."""
+    return " ".join(re.findall(r"[\w']+", text.lower()))
+
+
+def tokenize(text: str) -> List[str]:
+    return normalize_message(text).split()
+
+
+class RoutingCache:
+    """LRU of routing decisions keyed by the normalized message and the agents to choose from."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+
+    @staticmethod
+    def make_key(message: str, agent_names: Iterable[str]) -> str:
+        return fingerprint({"message": normalize_message(message), "agents": sorted(agent_names)})
+
+    def get(self, message: str, agent_names: Iterable[str]) -> Optional[str]:
+        key = self.make_key(message, agent_names)
+        agent_name = self._entries.get(key)
+        if agent_name is not None:
+            self._entries.move_to_end(key)
+        return agent_name
+
+    def put(self, message: str, agent_names: Iterable[str], agent_name: str):
+        key = self.make_key(message, agent_names)
+        self._entries[key] = agent_name
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class KeywordRules:
+    """Routes messages matching the regular expressions of exactly one agent to it."""
+
+    def __init__(self, rules: Dict[str, List[str]]):
+        self.rules = {agent_name: [re.compile(pattern, re.IGNORECASE) for pattern in patterns] for agent_name, patterns in rules.items()}
+
+    def route(self, message: str, agent_names: Iterable[str]) -> Optional[str]:
+        matches = [
+            agent_name for agent_name in agent_names
+            if any(pattern.search(message) for pattern in self.rules.get(agent_name, []))
+        ]
+        # Several matching agents are ambiguous, leave the decision to the next layer
+        return matches[0] if len(matches) == 1 else None
+
+
+class CentroidClassifier:
+    """TF-IDF nearest-centroid classifier trained on past routing decisions.
+
+    Confidence is the margin of the closest centroid's cosine similarity over the
+    runner-up, so messages sitting between two agents are left to the LLM.
+    """
+
+    def __init__(self, min_examples: int = 5):
+        self.min_examples = min_examples
+        self.examples = 0
+        self.doc_freq: Counter = Counter()
+        # Per agent: summed length-normalized term frequencies and number of examples
+        self.term_sums: Dict[str, Counter] = {}
+        self.counts: Counter = Counter()
+
+    def learn(self, message: str, agent_name: str):
+        terms = Counter(tokenize(message))
+        if not terms:
+            return
+        self.examples += 1
+        self.doc_freq.update(terms.keys())
+        total = sum(terms.values())
+        sums = self.term_sums.setdefault(agent_name, Counter())
+        for term, count in terms.items():
+            sums[term] += count / total
+        self.counts[agent_name] += 1
+
+    def _idf(self, term: str) -> float:
+        return math.log((1 + self.examples) / (1 + self.doc_freq[term])) + 1
+
+    @staticmethod
+    def _cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+        dot = sum(weight * b.get(term, 0.0) for term, weight in a.items())
+        norm = math.sqrt(sum(w * w for w in a.values())) * math.sqrt(sum(w * w for w in b.values()))
+        return dot / norm if norm else 0.0
+
+    def predict(self, message: str, agent_names: Iterable[str]) -> Tuple[Optional[str], float]:
+        """Return the closest agent and the confidence of the choice."""
+        terms = Counter(tokenize(message))
+        candidates = [agent_name for agent_name in agent_names if self.counts[agent_name]]
+        if self.examples < self.min_examples or not terms or not candidates:
+            return None, 0.0
+
+        query = {term: count * self._idf(term) for term, count in terms.items()}
+        similarities = []
+        for agent_name in candidates:
+            n = self.counts[agent_name]
+            centroid = {term: value / n * self._idf(term) for term, value in self.term_sums[agent_name].items()}
+            similarities.append((self._cosine(query, centroid), agent_name))
+        similarities.sort(reverse=True)
+        best, agent_name = similarities[0]
+        runner_up = similarities[1][0] if len(similarities) > 1 else 0.0
+        return agent_name, best - runner_up
+
+
+class FastRouter:
+    """Routing layers tried before the orchestration agent's LLM call: cache, keyword rules, classifier.
+
+    Config:
+        cache: true or {max_entries} to reuse decisions for repeated messages.
+        rules: {agent_name: [regex, ...]} keyword rules.
+        classifier: true or {threshold, min_examples}; predictions below the
+                    confidence threshold (default 0.3) fall back to the LLM.
+    """
+
+    def __init__(self, cache: Optional[RoutingCache] = None, rules: Optional[KeywordRules] = None, classifier: Optional[CentroidClassifier] = None, threshold: float = 0.3):
+        self.cache = cache
+        self.rules = rules
+        self.classifier = classifier
+        self.threshold = threshold
+        self.decisions: Counter = Counter({source: 0 for source in ROUTING_SOURCES})
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "FastRouter":
+        cache_config = config.get("cache")
+        classifier_config = config.get("classifier")
+        classifier_config = classifier_config if isinstance(classifier_config, dict) else {}
+        return cls(
+            cache=RoutingCache(**(cache_config if isinstance(cache_config, dict) else {})) if cache_config else None,
+            rules=KeywordRules(config["rules"]) if config.get("rules") else None,
+            classifier=CentroidClassifier(classifier_config.get("min_examples", 5)) if config.get("classifier") else None,
+            threshold=classifier_config.get("threshold", 0.3),
+        )
+
+    def route(self, message: str, agent_names: List[str]) -> Optional[Dict[str, Any]]:
+        """A decision {agent, source, confidence}, or None when the LLM has to decide."""
+        decision = None
+        if self.cache is not None:
+            agent_name = self.cache.get(message, agent_names)
+            if agent_name is not None:
+                decision = {"agent": agent_name, "source": "cache", "confidence": 1.0}
+        if decision is None and self.rules is not None:
+            agent_name = self.rules.route(message, agent_names)
+            if agent_name is not None:
+                decision = {"agent": agent_name, "source": "rules", "confidence": 1.0}
+        if decision is None and self.classifier is not None:
+            agent_name, confidence = self.classifier.predict(message, agent_names)
+            if agent_name is not None and confidence >= self.threshold:
+                decision = {"agent": agent_name, "source": "classifier", "confidence": confidence}
+
+        if decision is None:
+            return None
+        self.decisions[decision["source"]] += 1
+        if self.cache is not None and decision["source"] != "cache":
+            self.cache.put(message, agent_names, decision["agent"])
+        return decision
+
+    def learn(self, message: str, agent_names: List[str], agent_name: Optional[str]):
+        """Record a decision made by the LLM, None when it chose no known agent."""
+        self.decisions["llm"] += 1
+        if agent_name is None:
+            return
+        if self.cache is not None:
+            self.cache.put(message, agent_names, agent_name)
+        if self.classifier is not None:
+            self.classifier.learn(message, agent_name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = sum(self.decisions.values())
+        return {
+            "decisions": total,
+            **{source: self.decisions[source] for source in ROUTING_SOURCES},
+            "hit_rate": (total - self.decisions["llm"]) / total if total else 0.0,
+        }
@@ -1,18 +1,33 @@
+import asyncio
+import functools
+import time
 import uuid
-from typing import Callable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from maia_test_framework.core.communication_bus import CommunicationBus
 from maia_test_framework.core.message import Message, AgentResponse, IGNORE_MESSAGE
 from maia_test_framework.core.agent import Agent
 from maia_test_framework.core.orchestration_agent import OrchestrationAgent
 from maia_test_framework.core.exceptions import MaiaAssertionError
 from maia_test_framework.core.judge_agent import JudgeAgent
+from maia_test_framework.core.types.broadcast_mode import BroadcastMode
 from maia_test_framework.core.types.judge_result import JudgeResult
 from maia_test_framework.core.types.orchestration_policy import OrchestrationPolicy
+from maia_test_framework.core.usage import TokenUsage, UsageLedger, usage_tracker
+
+
+def _records_usage(method):
+    """Record the usage of every provider call made by the method into the session's ledger."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        with usage_tracker.session_scope(self.usage_ledger):
+            return await method(self, *args, **kwargs)
+    return wrapper
+
 
 class Session:
     """High-level abstraction for a conversation session."""
     
-    def __init__(self, bus: CommunicationBus, assertions: List[Callable[[Message], None]] = None, session_id: str = None, orchestration_agent: OrchestrationAgent = None, orchestration_policy: OrchestrationPolicy = None, validators: List[Callable[['Session'], None]] = None, judge_agent: JudgeAgent = None):
+    def __init__(self, bus: CommunicationBus, assertions: List[Callable[[Message], None]] = None, session_id: str = None, orchestration_agent: OrchestrationAgent = None, orchestration_policy: OrchestrationPolicy = None, validators: List[Callable[['Session'], None]] = None, judge_agent: JudgeAgent = None, broadcast_mode: BroadcastMode = BroadcastMode.SEQUENTIAL, speculative_agents: int = 0):
         self.id = session_id or str(uuid.uuid4())
         self.bus = bus
         self.assertions = assertions or []
@@ -23,6 +38,15 @@ class Session:
         self.validator_results = []
         self.judge_agent = judge_agent
         self.judge_result = None
+        self.broadcast_mode = broadcast_mode
+        # One entry per broadcast: mode, winners, wall time and each agent's latency
+        self.broadcast_stats: List[Dict[str, Any]] = []
+        # Agents started alongside the orchestration agent, by likelihood of being routed to
+        self.speculative_agents = speculative_agents
+        # One entry per routed broadcast: routed agent, speculation outcome and wasted usage
+        self.routing_stats: List[Dict[str, Any]] = []
+        # Includes orchestration, judging and responses that were ignored or discarded
+        self.usage_ledger = UsageLedger(f"Session '{self.id}'")
     
     def add_participant(self, agent: Agent):
         """Add a participant (agent) to the session."""
@@ -34,6 +58,7 @@ class Session:
         self.bus.add_message(msg)
         return self
     
+    @_records_usage
     async def agent_responds(self, agent_name: str) -> Optional[AgentResponse]:
         """Have a specified agent respond to the conversation."""
 
@@ -42,7 +67,10 @@ class Session:
         history = self.bus.get_history()
 
         response = await agent.generate_response(history)
+        return self._accept_response(agent_name, response)
 
+    def _accept_response(self, agent_name: str, response: AgentResponse) -> Optional[AgentResponse]:
+        """Add an agent's response to the conversation and run the session assertions on it."""
         if IGNORE_MESSAGE in response.content.strip():
             return None
 
@@ -63,41 +91,193 @@ class Session:
         
         return response
 
-    async def user_says_and_broadcast(self, message: str) -> Tuple[Optional[AgentResponse], Optional[str]]:
-        """Broadcast a user message to all agents and get the first response."""
+    @_records_usage
+    async def user_says_and_broadcast(self, message: str, mode: Optional[BroadcastMode] = None) -> Tuple[Optional[AgentResponse], Optional[str]]:
+        """Broadcast a user message to all agents and get the first response.
+
+        `mode` overrides the session's broadcast mode. With COLLECT_ALL every
+        response that is not ignored is added to the conversation and the first
+        one in registration order is returned.
+        """
         msg = Message(content=message, sender="user", sender_type="user")
         self.bus.add_message(msg)
         history = self.bus.get_history()
 
         if self.orchestration_policy == OrchestrationPolicy.ORCHESTRATION_AGENT and self.orchestration_agent:
+            if self.speculative_agents:
+                return await self._route_speculatively(history)
+
             agents = list(self.bus.agents.values())
             response = await self.orchestration_agent.generate_response(history, agents)
 
             agent_name = response.content.strip()
             
             if agent_name in self.bus.agents:
+                self.orchestration_agent.record_route(agent_name)
                 agent_response = await self.agent_responds(agent_name)
                 return agent_response, agent_name
             else:
                 return None, None
         
-        for agent_name, agent in self.bus.agents.items():
-            if self.orchestration_agent and agent_name == self.orchestration_agent.name:
-                continue
+        mode = mode or self.broadcast_mode
+        if mode != BroadcastMode.SEQUENTIAL:
+            return await self._broadcast_concurrently(history, mode)
 
+        start_time = time.perf_counter()
+        latencies = {}
+        winner = None
+        for agent_name, agent in self._broadcast_candidates():
+            agent_start = time.perf_counter()
             response = await agent.generate_response(history)
-            if self.orchestration_policy == OrchestrationPolicy.IGNORE_MESSAGE and IGNORE_MESSAGE in response.content.strip() :
+            latencies[agent_name] = time.perf_counter() - agent_start
+            if self._is_ignored(response):
                 continue
-            response_msg = Message(
-                content=response.content,
-                sender=agent_name,
-                sender_type="agent",
-                metadata=response.metadata
-            )
-            self.bus.add_message(response_msg)
-            return response, agent_name
-        
-        return None, None
+            self._add_broadcast_response(agent_name, response, latencies[agent_name])
+            winner = (response, agent_name)
+            break
+
+        self._record_broadcast(mode, [winner[1]] if winner else [], start_time, latencies)
+        return winner or (None, None)
+
+    def _broadcast_candidates(self) -> List[Tuple[str, Agent]]:
+        return [
+            (agent_name, agent) for agent_name, agent in self.bus.agents.items()
+            if not (self.orchestration_agent and agent_name == self.orchestration_agent.name)
+        ]
+
+    def _is_ignored(self, response: AgentResponse) -> bool:
+        return self.orchestration_policy == OrchestrationPolicy.IGNORE_MESSAGE and IGNORE_MESSAGE in response.content.strip()
+
+    def _add_broadcast_response(self, agent_name: str, response: AgentResponse, latency: float):
+        response.metadata["broadcast_latency"] = latency
+        response_msg = Message(
+            content=response.content,
+            sender=agent_name,
+            sender_type="agent",
+            metadata=response.metadata
+        )
+        self.bus.add_message(response_msg)
+
+    def _record_broadcast(self, mode: BroadcastMode, winners: List[str], start_time: float, latencies: Dict[str, Optional[float]]):
+        self.broadcast_stats.append({
+            "mode": mode.value,
+            "winners": winners,
+            "wall_time": time.perf_counter() - start_time,
+            # None for agents cancelled before they answered
+            "latencies": latencies,
+        })
+
+    async def _route_speculatively(self, history: List[Message]) -> Tuple[Optional[AgentResponse], Optional[str]]:
+        """Run the orchestration agent and the most likely agents at the same time.
+
+        Only the routed agent's response is kept. Speculative calls still running
+        when the route is known are cancelled, the usage of finished ones is
+        reported as wasted.
+        """
+        start_time = time.perf_counter()
+        agents = list(self.bus.agents.values())
+        likely_agents = self.orchestration_agent.get_likely_agents(agents, self.speculative_agents)
+
+        async def respond(agent: Agent) -> Tuple[AgentResponse, List[Message]]:
+            agent_history = list(history)
+            response = await agent.generate_response(agent_history)
+            return response, agent_history[len(history):]
+
+        speculative = {agent.name: asyncio.create_task(respond(agent)) for agent in likely_agents}
+        try:
+            router_response = await self.orchestration_agent.generate_response(history, agents)
+            router_time = time.perf_counter() - start_time
+            agent_name = router_response.content.strip()
+            routed = agent_name in self.bus.agents and agent_name != self.orchestration_agent.name
+
+            result = None
+            if routed and agent_name in speculative:
+                result = await speculative.pop(agent_name)
+        finally:
+            for task in speculative.values():
+                task.cancel()
+            await asyncio.gather(*speculative.values(), return_exceptions=True)
+
+        # Speculative responses that finished but were not routed to
+        wasted_usage = TokenUsage()
+        for task in speculative.values():
+            if not task.cancelled() and task.exception() is None:
+                wasted_usage = wasted_usage + TokenUsage.from_dict(task.result()[0].metadata.get("usage"))
+
+        agent_response = None
+        if routed:
+            self.orchestration_agent.record_route(agent_name)
+            if result is not None:
+                response, tool_messages = result
+                for tool_message in tool_messages:
+                    self.bus.add_message(tool_message)
+                agent_response = self._accept_response(agent_name, response)
+            else:
+                agent_response = await self.agent_responds(agent_name)
+
+        self.routing_stats.append({
+            "routed_to": agent_name if routed else None,
+            "speculated": [agent.name for agent in likely_agents],
+            "hit": result is not None,
+            "cancelled": [name for name, task in speculative.items() if task.cancelled()],
+            "router_time": router_time,
+            "wall_time": time.perf_counter() - start_time,
+            "wasted_usage": wasted_usage.to_dict(),
+        })
+        return (agent_response, agent_name) if routed else (None, None)
+
+    async def _broadcast_concurrently(self, history: List[Message], mode: BroadcastMode) -> Tuple[Optional[AgentResponse], Optional[str]]:
+        """Ask all agents at once. Each works on its own copy of the history so that
+        tool steps of agents that lose do not end up in the conversation."""
+        start_time = time.perf_counter()
+        candidates = self._broadcast_candidates()
+        latencies: Dict[str, Optional[float]] = {agent_name: None for agent_name, _ in candidates}
+
+        async def respond(agent_name: str, agent: Agent) -> Tuple[AgentResponse, List[Message]]:
+            agent_history = list(history)
+            agent_start = time.perf_counter()
+            response = await agent.generate_response(agent_history)
+            latencies[agent_name] = time.perf_counter() - agent_start
+            return response, agent_history[len(history):]
+
+        tasks = {agent_name: asyncio.create_task(respond(agent_name, agent)) for agent_name, agent in candidates}
+        results: Dict[str, Tuple[AgentResponse, List[Message]]] = {}
+        winners: List[str] = []
+        try:
+            if mode == BroadcastMode.FIRST_RESPONSE:
+                pending = set(tasks.values())
+                while pending and not winners:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    # Agents finishing together are ranked by registration order
+                    for agent_name in [name for name in tasks if tasks[name] in done]:
+                        results[agent_name] = tasks[agent_name].result()
+                        if not winners and not self._is_ignored(results[agent_name][0]):
+                            winners.append(agent_name)
+            elif mode == BroadcastMode.REGISTRATION_ORDER:
+                for agent_name, task in tasks.items():
+                    results[agent_name] = await task
+                    if not self._is_ignored(results[agent_name][0]):
+                        winners.append(agent_name)
+                        break
+            else:
+                for agent_name, task in tasks.items():
+                    results[agent_name] = await task
+                winners = [agent_name for agent_name, (response, _) in results.items() if not self._is_ignored(response)]
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        for agent_name in winners:
+            response, tool_messages = results[agent_name]
+            for tool_message in tool_messages:
+                self.bus.add_message(tool_message)
+            self._add_broadcast_response(agent_name, response, latencies[agent_name])
+
+        self._record_broadcast(mode, winners, start_time, latencies)
+        if not winners:
+            return None, None
+        return results[winners[0]][0], winners[0]
 
     async def agent_says(self, from_agent: str, to_agent: str, message: str) -> "Session":
         """Send a message from one agent to another."""
@@ -109,12 +289,18 @@ class Session:
     def message_history(self) -> List[Message]:
         return self.bus.get_history()
 
-    def get_conversation_text(self) -> str:
-        """Get full conversation as text"""
-        lines = []
-        for msg in self.message_history:
-            lines.append(f"{msg.sender}: {msg.content}")
-        return "\n".join(lines)
+    def get_conversation_text(self, format: str = "plain", max_chars: Optional[int] = None) -> str:
+        """Get full conversation as text.
+
+        Formats: "plain" (sender: content), "tagged" (prefixed with the sender
+        type) and "truncated" (contents cut to max_chars, 500 by default).
+        Renderings are cached and only extended when new messages arrive.
+        """
+        return self.bus.get_transcript(format, max_chars)
+
+    def get_usage(self) -> TokenUsage:
+        """Total token usage and cost of the provider calls made for this session"""
+        return self.usage_ledger.usage
 
     async def run_agent_conversation(self, initiator: str, responder: str, initial_message: str, max_turns: int) -> List[Message]:
         """Run a multi-turn conversation between two agents."""
@@ -144,6 +330,7 @@ class Session:
         
         return conversation_log
 
+    @_records_usage
     async def judge(self) -> JudgeResult:
         """
         Evaluates the session using the attached JudgeAgent and returns the result.
@@ -155,6 +342,7 @@ class Session:
         self.judge_result = result
         return result
 
+    @_records_usage
     async def judge_and_assert(self):
         """
         Evaluates the session using the attached JudgeAgent and asserts the outcome.
@@ -1,23 +1,129 @@
+import asyncio
+import inspect
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, List, Optional, Union
+from maia_test_framework.core.tools.cache import ToolResultCache
+from maia_test_framework.core.tools.history import ToolCallLog, ToolCallStats
 
 class BaseTool(ABC):
-    """Base class for all tools that agents can use"""
+    """Base class for all tools that agents can use
+
+    Execution options, also settable later with `configure`:
+        timeout: seconds a call may take before it fails with asyncio.TimeoutError (None waits indefinitely).
+        max_concurrency: calls running at once, shared by every session using the tool.
+        offload: run a synchronous `_execute` in a worker thread instead of on the event loop (default True).
+        max_history: keep only the last N calls in `call_history`, aggregates in `stats` still cover all calls.
+        history_path: also append every call to this JSON Lines file.
+    A timed-out offloaded call is abandoned, its thread runs to completion.
+    """
     
-    def __init__(self, name: str, description: str):
+    def __init__(self, name: str, description: str, cache: Union[bool, Dict[str, Any], None] = None, timeout: Optional[float] = None, max_concurrency: Optional[int] = None, offload: bool = True, max_history: Optional[int] = None, history_path: Optional[str] = None):
         self.name = name
         self.description = description
-        self.call_history: List[Dict[str, Any]] = []
+        self.call_history: Union[List[Dict[str, Any]], Deque[Dict[str, Any]]] = []
+        self.stats = ToolCallStats()
+        self.max_history = None
+        self.history_log: Optional[ToolCallLog] = None
+        self._set_history_options(max_history, history_path)
+        # Opt-in memoization of results, see ToolResultCache for the config
+        self.cache: Optional[ToolResultCache] = None
+        if cache:
+            self.enable_cache(cache if isinstance(cache, dict) else {})
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.offload = offload
+        # Semaphores are bound to the event loop they are first used in
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def configure(self, **options: Any) -> "BaseTool":
+        """Set execution and history options on an existing tool."""
+        history_options = {option: options.pop(option) for option in ("max_history", "history_path") if option in options}
+        for option, value in options.items():
+            if option not in ("timeout", "max_concurrency", "offload"):
+                raise ValueError(f"Unknown tool option '{option}'")
+            setattr(self, option, value)
+        if history_options:
+            self._set_history_options(
+                history_options.get("max_history", self.max_history),
+                history_options.get("history_path", self.history_log.path if self.history_log else None),
+            )
+        return self
+
+    def _set_history_options(self, max_history: Optional[int], history_path: Optional[str]):
+        self.max_history = max_history
+        if max_history is not None:
+            self.call_history = deque(self.call_history, maxlen=max_history)
+        elif isinstance(self.call_history, deque):
+            self.call_history = list(self.call_history)
+        self.history_log = ToolCallLog(history_path) if history_path else None
+
+    def enable_cache(self, config: Optional[Dict[str, Any]] = None):
+        """Serve repeated calls with the same parameters from memory.
+
+        Only use it for tools whose results depend on their parameters alone.
+        """
+        self.cache = ToolResultCache.from_config(config or {})
     
     @abstractmethod
     async def _execute(self, **kwargs) -> Any:
-        """Execute the tool with given parameters"""
+        """Execute the tool with given parameters. May also be a plain (blocking) method."""
         pass
 
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        if not self.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run(self, **kwargs) -> Any:
+        if inspect.iscoroutinefunction(self._execute):
+            return await self._execute(**kwargs)
+        if self.offload:
+            return await asyncio.to_thread(self._execute, **kwargs)
+        return self._execute(**kwargs)
+
     async def execute(self, **kwargs) -> Any:
         """Execute the tool and record the call"""
-        result = await self._execute(**kwargs)
-        self.record_call(kwargs, result)
+        if self.cache is not None:
+            found, result = self.cache.get(kwargs)
+            if found:
+                self.record_call(kwargs, result, cached=True)
+                return result
+
+        queue_start = time.perf_counter()
+        semaphore = self._get_semaphore()
+        if semaphore:
+            await semaphore.acquire()
+        try:
+            started_at = datetime.now(timezone.utc)
+            start_time = time.perf_counter()
+            timing = {"started_at": started_at, "queue_wait": start_time - queue_start}
+            try:
+                result = await asyncio.wait_for(self._run(**kwargs), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                self.record_call(kwargs, None, outcome="timeout", duration=time.perf_counter() - start_time, **timing)
+                raise asyncio.TimeoutError(f"Tool '{self.name}' timed out after {self.timeout} seconds")
+            except asyncio.CancelledError:
+                self.record_call(kwargs, None, outcome="cancelled", duration=time.perf_counter() - start_time, **timing)
+                raise
+            except Exception as e:
+                self.record_call(kwargs, None, outcome="error", error=str(e), duration=time.perf_counter() - start_time, **timing)
+                raise
+        finally:
+            if semaphore:
+                semaphore.release()
+
+        if self.cache is not None:
+            self.cache.put(kwargs, result)
+        self.record_call(kwargs, result, duration=time.perf_counter() - start_time, **timing)
         return result
     
     @abstractmethod
@@ -25,17 +131,39 @@ class BaseTool(ABC):
         """Return the tool schema for LLM function calling"""
         pass
     
-    def record_call(self, parameters: Dict[str, Any], result: Any):
+    def record_call(self, parameters: Dict[str, Any], result: Any, cached: bool = False, outcome: str = "ok", error: Optional[str] = None, started_at: Optional[datetime] = None, duration: float = 0.0, queue_wait: float = 0.0):
         """Record a tool call for testing purposes"""
-        self.call_history.append({
+        started_at = started_at or datetime.now(timezone.utc)
+        call = {
             "parameters": parameters,
             "result": result,
-        })
+            "cached": cached,
+            "outcome": outcome,
+            "started_at": started_at.isoformat(),
+            "ended_at": (started_at + timedelta(seconds=duration)).isoformat(),
+            "duration": duration,
+            "queue_wait": queue_wait,
+        }
+        if error is not None:
+            call["error"] = error
+        self.call_history.append(call)
+        self.stats.record(call)
+        if self.history_log is not None:
+            self.history_log.append(self.name, call)
     
-    def get_call_count(self) -> int:
-        """Get number of times this tool was called"""
-        return len(self.call_history)
+    def get_call_count(self, include_cached: bool = True) -> int:
+        """Get number of times this tool was called, optionally leaving out calls served from the cache"""
+        return self.stats.count if include_cached else self.stats.executed
     
     def get_last_call(self) -> Optional[Dict[str, Any]]:
         """Get the last call made to this tool"""
-        return self.call_history[-1] if self.call_history else None
\ No newline at end of file
+        return self.call_history[-1] if self.call_history else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Runtime counters included in the Maia report."""
+        stats = self.stats.to_dict()
+        if self.history_log is not None:
+            stats["history_path"] = self.history_log.path
+        if self.cache is not None:
+            stats["cache"] = self.cache.get_stats()
+        return stats
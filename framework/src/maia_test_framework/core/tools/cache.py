@@ -0,0 +1,66 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from maia_test_framework.utils.fingerprint import fingerprint
+
+
+class ToolResultCache:
+    """In-memory LRU of tool results keyed by the call parameters.
+
+    Config:
+        max_entries: results kept, the least recently used are evicted first (default 128).
+        ttl: seconds a result stays valid, None keeps it until evicted.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ToolResultCache":
+        return cls(max_entries=config.get("max_entries", 128), ttl=config.get("ttl"))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(parameters: Dict[str, Any]) -> str:
+        """Canonical key, independent of parameter order."""
+        return fingerprint(parameters)
+
+    def get(self, parameters: Dict[str, Any]) -> Tuple[bool, Any]:
+        """Return (found, result) for the given parameters."""
+        key = self.make_key(parameters)
+        entry = self._entries.get(key)
+        if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def put(self, parameters: Dict[str, Any], result: Any):
+        key = self.make_key(parameters)
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import math
+import os
+from typing import Any, Dict, List, Optional
+
+from maia_test_framework.utils.fingerprint import fingerprint
+
+# Upper bounds in seconds of the tool latency histogram, slower calls go to a final overflow bucket
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+TOOL_CALL_OUTCOMES = ("ok", "timeout", "error", "cancelled")
+
+
+class DistinctCounter:
+    """Fixed-size estimate of the number of distinct values (HyperLogLog).
+
+    Uses 2**precision registers; the default of 10 keeps 1 KiB of state with a
+    typical error of about 3%, small counts are close to exact.
+    """
+
+    def __init__(self, precision: int = 10):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, key: str):
+        value = int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "big")
+        index = value >> (64 - self.precision)
+        remaining = value & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - remaining.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self) -> int:
+        m = len(self.registers)
+        estimate = (0.7213 / (1 + 1.079 / m)) * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate while most registers are empty
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+
+class ToolCallStats:
+    """Constant-size aggregates over every call of a tool, including calls no longer kept in its history."""
+
+    def __init__(self):
+        self.count = 0
+        self.cached = 0
+        self.outcomes: Dict[str, int] = {outcome: 0 for outcome in TOOL_CALL_OUTCOMES}
+        self.total_duration = 0.0
+        self.max_duration: Optional[float] = None
+        self.latency_histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.distinct_parameters = DistinctCounter()
+
+    def record(self, call: Dict[str, Any]):
+        self.count += 1
+        self.distinct_parameters.add(fingerprint(call["parameters"]))
+        if call.get("cached"):
+            # Served from memory, the tool itself was not run
+            self.cached += 1
+            return
+        outcome = call.get("outcome", "ok")
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        duration = call.get("duration", 0.0)
+        self.total_duration += duration
+        self.max_duration = duration if self.max_duration is None else max(self.max_duration, duration)
+        bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS) if duration <= bound), len(LATENCY_BUCKETS))
+        self.latency_histogram[bucket] += 1
+
+    @property
+    def executed(self) -> int:
+        return self.count - self.cached
+
+    @property
+    def errors(self) -> int:
+        return self.executed - self.outcomes.get("ok", 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.count,
+            "cached": self.cached,
+            "errors": self.errors,
+            "outcomes": dict(self.outcomes),
+            "mean_duration": self.total_duration / self.executed if self.executed else None,
+            "max_duration": self.max_duration,
+            # [upper_bound, count] pairs, the last bucket (None) holds slower calls
+            "latency_histogram": [[bound, count] for bound, count in zip((*LATENCY_BUCKETS, None), self.latency_histogram)],
+            "distinct_parameters": self.distinct_parameters.count(),
+        }
+
+
+class ToolCallLog:
+    """Append-only JSON Lines file receiving every recorded tool call."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def append(self, tool_name: str, call: Dict[str, Any]):
+        with open(self.path, "ab") as f:
+            f.write(json.dumps({"tool": tool_name, **call}, default=str).encode("utf-8") + b"\n")
+
+    def read(self, tool_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, "rb") as f:
+            calls = [json.loads(line) for line in f if line.strip()]
+        return [call for call in calls if tool_name is None or call["tool"] == tool_name]
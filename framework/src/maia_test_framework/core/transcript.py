@@ -0,0 +1,79 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+from maia_test_framework.core.message import Message
+
+TRANSCRIPT_FORMATS = ("plain", "tagged", "truncated")
+
+# Default length of a message's content in the truncated format
+DEFAULT_MAX_CHARS = 500
+
+
+def _plain(message: Message, max_chars: Optional[int]) -> str:
+    return f"{message.sender}: {message.content}"
+
+
+def _tagged(message: Message, max_chars: Optional[int]) -> str:
+    return f"[{message.sender_type}] {message.sender}: {message.content}"
+
+
+def _truncated(message: Message, max_chars: Optional[int]) -> str:
+    content = message.content
+    if len(content) > max_chars:
+        content = content[:max_chars] + "..."
+    return f"{message.sender}: {content}"
+
+
+RENDERERS: Dict[str, Callable[[Message, Optional[int]], str]] = {
+    "plain": _plain,
+    "tagged": _tagged,
+    "truncated": _truncated,
+}
+
+
+class _Rendering:
+    """Text of one format, covering the first `count` messages of the history."""
+
+    def __init__(self):
+        self.count = 0
+        self.last: Optional[Message] = None
+        self.text = ""
+
+
+class Transcript:
+    """Conversation text built incrementally from a message history.
+
+    Each format is rendered once per message: repeated reads return the cached
+    text and new messages only render themselves. Messages appended directly to
+    the history list (agents append tool steps that way) are picked up too; a
+    history that was shortened or had messages replaced is rendered again.
+    Messages are expected not to change once they are in the history.
+    """
+
+    def __init__(self, messages: List[Message]):
+        self.messages = messages
+        self._renderings: Dict[Tuple[str, Optional[int]], _Rendering] = {}
+
+    def get_text(self, format: str = "plain", max_chars: Optional[int] = None) -> str:
+        if format not in RENDERERS:
+            raise ValueError(f"Unknown transcript format '{format}', expected one of {', '.join(TRANSCRIPT_FORMATS)}")
+        if format == "truncated":
+            max_chars = DEFAULT_MAX_CHARS if max_chars is None else max_chars
+        else:
+            max_chars = None
+
+        rendering = self._renderings.setdefault((format, max_chars), _Rendering())
+        messages = self.messages
+        if rendering.count > len(messages) or (rendering.count and messages[rendering.count - 1] is not rendering.last):
+            rendering = self._renderings[(format, max_chars)] = _Rendering()
+        if rendering.count == len(messages):
+            return rendering.text
+
+        render = RENDERERS[format]
+        new_text = "\n".join(render(message, max_chars) for message in messages[rendering.count:])
+        rendering.text = f"{rendering.text}\n{new_text}" if rendering.count else new_text
+        rendering.count = len(messages)
+        rendering.last = messages[-1]
+        return rendering.text
+
+    def clear(self):
+        self._renderings.clear()
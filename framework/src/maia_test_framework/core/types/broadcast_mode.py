@@ -0,0 +1,11 @@
+from enum import Enum
+
+class BroadcastMode(Enum):
+    # Agents are asked one after another, in registration order
+    SEQUENTIAL = "sequential"
+    # All agents at once, the first response that is not ignored wins and the rest are cancelled
+    FIRST_RESPONSE = "first_response"
+    # All agents at once, the earliest registered agent that does not ignore the message wins
+    REGISTRATION_ORDER = "registration_order"
+    # All agents at once, every response that is not ignored is added to the conversation
+    COLLECT_ALL = "collect_all"
@@ -0,0 +1,137 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, Optional
+
+from maia_test_framework.core.exceptions import BudgetExceededError
+
+
+@dataclass
+class TokenUsage:
+    """Token counts and cost of one or more provider calls."""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    cost: float = 0.0
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        return TokenUsage(
+            prompt_tokens=self.prompt_tokens + other.prompt_tokens,
+            completion_tokens=self.completion_tokens + other.completion_tokens,
+            total_tokens=self.total_tokens + other.total_tokens,
+            cost=self.cost + other.cost,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "TokenUsage":
+        if not data:
+            return cls()
+        prompt_tokens = data.get("prompt_tokens") or 0
+        completion_tokens = data.get("completion_tokens") or 0
+        return cls(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=data.get("total_tokens") or prompt_tokens + completion_tokens,
+            cost=data.get("cost") or 0.0,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["cost"] = round(self.cost, 6)
+        return data
+
+
+class PriceTable:
+    """Token prices per model, in currency units per 1000 tokens.
+
+    Models without a price cost nothing. Register prices directly or replace
+    `usage_tracker.price_table` with a subclass overriding `cost`.
+    """
+
+    def __init__(self, prices: Optional[Dict[str, Dict[str, float]]] = None):
+        self.prices: Dict[str, Dict[str, float]] = dict(prices or {})
+
+    def register(self, model: str, prompt: float = 0.0, completion: float = 0.0):
+        self.prices[model] = {"prompt": prompt, "completion": completion}
+
+    def cost(self, model: Optional[str], usage: TokenUsage, prices: Optional[Dict[str, float]] = None) -> float:
+        prices = prices or self.prices.get(model)
+        if not prices:
+            return 0.0
+        return (usage.prompt_tokens * prices.get("prompt", 0.0)
+                + usage.completion_tokens * prices.get("completion", 0.0)) / 1000
+
+
+class UsageLedger:
+    """Accumulated usage with optional hard token and cost budgets."""
+
+    def __init__(self, name: str, max_tokens: Optional[int] = None, max_cost: Optional[float] = None):
+        self.name = name
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.usage = TokenUsage()
+
+    def record(self, usage: TokenUsage):
+        self.usage = self.usage + usage
+
+    def check(self):
+        """Raise BudgetExceededError once a budget has been used up."""
+        if self.max_tokens is not None and self.usage.total_tokens >= self.max_tokens:
+            raise BudgetExceededError(
+                f"{self.name} token budget exhausted: {self.usage.total_tokens} of {self.max_tokens} tokens used.",
+                usage=self.usage,
+            )
+        if self.max_cost is not None and self.usage.cost >= self.max_cost:
+            raise BudgetExceededError(
+                f"{self.name} cost budget exhausted: {self.usage.cost:.6f} of {self.max_cost} spent.",
+                usage=self.usage,
+            )
+
+
+class UsageTracker:
+    """Process-wide usage accounting for the current run, the current test and the session making the call."""
+
+    def __init__(self):
+        self.price_table = PriceTable()
+        self.run = UsageLedger("Run")
+        self.test: Optional[UsageLedger] = None
+        # Follows the asyncio task, so concurrent sessions record into their own ledgers
+        self._session: ContextVar[Optional[UsageLedger]] = ContextVar("maia_session_usage", default=None)
+
+    def configure_run(self, max_tokens: Optional[int] = None, max_cost: Optional[float] = None):
+        self.run = UsageLedger("Run", max_tokens=max_tokens, max_cost=max_cost)
+
+    def start_test(self, name: str, max_tokens: Optional[int] = None, max_cost: Optional[float] = None) -> UsageLedger:
+        self.test = UsageLedger(f"Test '{name}'", max_tokens=max_tokens, max_cost=max_cost)
+        return self.test
+
+    def end_test(self):
+        self.test = None
+
+    @contextmanager
+    def session_scope(self, ledger: UsageLedger) -> Iterator[UsageLedger]:
+        """Record the usage of provider calls made inside the block into a session's ledger."""
+        token = self._session.set(ledger)
+        try:
+            yield ledger
+        finally:
+            self._session.reset(token)
+
+    def check_budgets(self):
+        self.run.check()
+        if self.test:
+            self.test.check()
+        session = self._session.get()
+        if session:
+            session.check()
+
+    def record(self, usage: TokenUsage):
+        self.run.record(usage)
+        if self.test:
+            self.test.record(usage)
+        session = self._session.get()
+        if session:
+            session.record(usage)
+
+
+usage_tracker = UsageTracker()
@@ -1,35 +1,316 @@
 # maia_test_framework/providers/base.py
+import dataclasses
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, List
-from maia_test_framework.core.message import Message, AgentResponse, TimedAgentResponse
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from maia_test_framework.core.message import Message, AgentResponse, ResponseChunk, TimedAgentResponse
+from maia_test_framework.core.usage import TokenUsage, usage_tracker
+from maia_test_framework.logging_config import get_logger
+from maia_test_framework.providers.executor import ProviderExecutor
+from maia_test_framework.providers.limits import ProviderLimiter
+from maia_test_framework.providers.raw_response import RawResponsePolicy
+from maia_test_framework.providers.response_cache import ResponseCache
+from maia_test_framework.providers.retry import CircuitBreaker, RetryPolicy, circuit_breakers
+from maia_test_framework.providers.single_flight import SingleFlight
+from maia_test_framework.utils.fingerprint import fingerprint, serialize_history
+
+logger = get_logger(__name__)
+
+SAMPLING_PARAMS = ("temperature", "seed", "top_p", "max_tokens")
+
+# Set while the request token taken when a call was admitted has not been used by an attempt yet
+_request_token_taken: ContextVar[bool] = ContextVar("maia_request_token_taken", default=False)
+
 
 class BaseProvider(ABC):
     def __init__(self, config: Dict):
         self.config = config
+        self.response_cache = self._create_response_cache()
+        self.single_flight = self._create_single_flight()
+        # Shared by every agent and judge using this provider instance
+        self.limiter = ProviderLimiter.from_config(self.config["limits"]) if self.config.get("limits") else None
+        self.retry_policy = RetryPolicy.from_config(self.config.get("retry", {}))
+        self.raw_response_policy = RawResponsePolicy.from_config(self.config)
+        # Created on first use by providers wrapping blocking calls
+        self._executor: Optional[ProviderExecutor] = None
+        # Used when the provider has no endpoint shared with other instances
+        self._circuit_breaker: Optional[CircuitBreaker] = None
+        self.retries = 0
+
+    def _require_deterministic(self, feature: str) -> bool:
+        if self.is_deterministic():
+            return True
+        logger.warning(
+            f"{feature} disabled for {self.__class__.__name__}: set temperature to 0, "
+            f"a fixed seed or 'deterministic: true' in the provider config to enable it."
+        )
+        return False
+
+    def _create_response_cache(self) -> Optional[ResponseCache]:
+        cache_config = self.config.get("cache")
+        if not cache_config or not self._require_deterministic("Response cache"):
+            return None
+        return ResponseCache.from_config(cache_config if isinstance(cache_config, dict) else {})
+
+    def _create_single_flight(self) -> Optional[SingleFlight]:
+        if not self.config.get("single_flight") or not self._require_deterministic("Single-flight deduplication"):
+            return None
+        return SingleFlight()
 
     @abstractmethod
     async def generate(self, history: List[Message], system_message: str = "") -> AgentResponse:
         pass
 
-    async def base_generate(self, history: List[Message], system_message: str = "", ignore_trigger_prompt: str = "") -> TimedAgentResponse:
+    def supports_native_tools(self) -> bool:
+        """Whether `generate` accepts `tools` and reports requested calls in `metadata["tool_calls"]`.
+
+        Agents fall back to describing their tools in the system prompt otherwise.
+        """
+        return False
+
+    async def stream_generate(self, history: List[Message], system_message: str = "") -> AsyncIterator[ResponseChunk]:
+        """Yield the response in chunks. Providers without native streaming yield it whole."""
+        response = await self.generate(history, system_message)
+        yield ResponseChunk(content=response.content, metadata=response.metadata)
+
+    async def _generate_streamed(self, history: List[Message], system_message: str) -> AgentResponse:
+        """Consume stream_generate into a single response, measuring streaming latency."""
+        start_time = time.perf_counter()
+        chunk_times = []
+        content_parts = []
+        metadata = {}
+        try:
+            async for chunk in self.stream_generate(history, system_message):
+                if chunk.content:
+                    chunk_times.append(time.perf_counter())
+                    content_parts.append(chunk.content)
+                metadata.update(chunk.metadata)
+        except Exception as e:
+            # Keep whatever arrived before the stream broke
+            metadata.update({"error": True, "error_message": str(e) or e.__class__.__name__})
+        end_time = time.perf_counter()
+
+        streaming = {"chunks": len(chunk_times), "time_to_first_token": None, "inter_token_latency": None, "tokens_per_second": None}
+        if chunk_times:
+            streaming["time_to_first_token"] = chunk_times[0] - start_time
+            if len(chunk_times) > 1:
+                streaming["inter_token_latency"] = (chunk_times[-1] - chunk_times[0]) / (len(chunk_times) - 1)
+            generation_time = end_time - chunk_times[0]
+            if generation_time > 0:
+                # Prefer reported completion tokens, otherwise count each chunk as one token
+                tokens = metadata.get("usage", {}).get("completion_tokens") or len(chunk_times)
+                streaming["tokens_per_second"] = tokens / generation_time
+        metadata["streaming"] = streaming
+
+        return AgentResponse(content="".join(content_parts), metadata=metadata)
+
+    async def base_generate(self, history: List[Message], system_message: str = "", ignore_trigger_prompt: str = "", tools: Optional[List[Dict[str, Any]]] = None) -> TimedAgentResponse:
+        """Generate a response with caching, deduplication, limits and timing applied.
+
+        `tools` are OpenAI-style function definitions, only passed by agents when
+        the provider supports native tool calling.
+        """
         system_message = self.handle_ignore_trigger_prompt(system_message, ignore_trigger_prompt)
-        
+
+        request_key = None
+        if self.response_cache is not None or self.single_flight is not None:
+            request_key = self.get_request_fingerprint(history, system_message, tools)
+
+        if self.response_cache is not None:
+            cached_response = self.response_cache.get(request_key)
+            if cached_response:
+                return cached_response
+
+        if self.single_flight is not None:
+            response = await self._coalesced_generate(request_key, history, system_message, tools)
+            if response.metadata.get("single_flight") == "coalesced":
+                return response
+        else:
+            response = await self._timed_generate(history, system_message, tools)
+
+        if self.response_cache is not None and not response.metadata.get("error"):
+            self.response_cache.put(request_key, response)
+
+        return response
+
+    async def _coalesced_generate(self, request_key: str, history: List[Message], system_message: str, tools: Optional[List[Dict[str, Any]]] = None) -> TimedAgentResponse:
+        """Share one upstream call between concurrent identical requests."""
         start_time = time.time()
-        agent_response = await self.generate(history, system_message)
-        processing_time = time.time() - start_time
-        
+        response, shared = await self.single_flight.run(
+            request_key, lambda: self._timed_generate(history, system_message, tools)
+        )
+        if not shared:
+            # Callers arriving later copy the shared response, the first caller must not change it
+            return dataclasses.replace(response, metadata=dict(response.metadata))
+
+        metadata = {**response.metadata, "single_flight": "coalesced"}
+        # Only the first caller paid for the call, keep its usage for reference only
+        if "usage" in metadata:
+            metadata["saved_usage"] = metadata.pop("usage")
         return TimedAgentResponse(
-            content=agent_response.content,
-            metadata=agent_response.metadata,
-            raw_response=agent_response.raw_response,
-            processing_time=processing_time,
+            content=response.content,
+            metadata=metadata,
+            raw_response=response.raw_response,
+            processing_time=time.time() - start_time,
+            time_to_first_token=response.time_to_first_token,
         )
 
+    async def _timed_generate(self, history: List[Message], system_message: str, tools: Optional[List[Dict[str, Any]]] = None) -> TimedAgentResponse:
+        """Call the provider within its budgets and rate limits, timing the call itself."""
+        usage_tracker.check_budgets()
+
+        limiter_wait_time = await self.limiter.acquire() if self.limiter else 0.0
+        token_taken = _request_token_taken.set(self.limiter is not None)
+        response = None
+        try:
+            start_time = time.time()
+            if tools:
+                # Tool calls arrive whole at the end of a stream, so tool turns are not streamed
+                agent_response = await self.generate(history, system_message, tools=tools)
+            elif self.config.get("stream"):
+                agent_response = await self._generate_streamed(history, system_message)
+            else:
+                agent_response = await self.generate(history, system_message)
+            # Retry attempts wait for the limiter inside the call, that wait is reported as limiter_wait_time
+            processing_time = time.time() - start_time - agent_response.metadata.get("limiter_wait_time", 0.0)
+
+            response = TimedAgentResponse(
+                content=agent_response.content,
+                metadata=agent_response.metadata,
+                processing_time=processing_time,
+                time_to_first_token=agent_response.metadata.get("streaming", {}).get("time_to_first_token"),
+            )
+            self._record_usage(response)
+            response.raw_response = self.raw_response_policy.apply(
+                agent_response.raw_response, response.metadata, self.serialize_raw_response
+            )
+        finally:
+            _request_token_taken.reset(token_taken)
+            if self.limiter:
+                tokens_used = response.metadata.get("usage", {}).get("total_tokens", 0) if response else 0
+                self.limiter.release(tokens_used)
+
+        if self.limiter:
+            # Reported separately so processing_time stays pure provider latency
+            response.metadata["limiter_wait_time"] = limiter_wait_time + response.metadata.get("limiter_wait_time", 0.0)
+        return response
+
+    def get_executor(self) -> ProviderExecutor:
+        if self._executor is None:
+            name = f"maia-{self.get_provider_name()}".replace(" ", "_")
+            self._executor = ProviderExecutor.from_config(name, self.config.get("executor", {}))
+        return self._executor
+
+    async def run_blocking(self, func: Callable[..., Any], *args: Any, metadata: Optional[Dict[str, Any]] = None) -> Any:
+        """Run a blocking call in this provider's own pool instead of asyncio's shared default executor.
+
+        Time spent waiting for a free worker is added to `metadata["executor_queue_wait"]`.
+        """
+        result, queue_wait = await self.get_executor().run(func, *args)
+        if metadata is not None:
+            metadata["executor_queue_wait"] = metadata.get("executor_queue_wait", 0.0) + queue_wait
+        return result
+
+    def serialize_raw_response(self, raw_response: Any) -> Any:
+        """Form in which the raw response is kept. Providers returning native SDK objects override this."""
+        return raw_response
+
+    def _record_usage(self, response: AgentResponse):
+        """Price the token usage reported by the provider and add it to the run and test totals."""
+        if "usage" not in response.metadata:
+            return
+        usage = TokenUsage.from_dict(response.metadata["usage"])
+        usage.cost = usage_tracker.price_table.cost(getattr(self, "model", None), usage, self.config.get("pricing"))
+        response.metadata["usage"] = usage.to_dict()
+        usage_tracker.record(usage)
+
     @abstractmethod
     def get_provider_name(self) -> str:
         pass
 
+    def get_endpoint(self) -> Optional[str]:
+        """Backend identity used to share a circuit breaker between providers.
+
+        None, the default, gives each provider instance a breaker of its own:
+        wrapped agents and chains are separate backends even when of the same class.
+        """
+        return None
+
+    def get_circuit_breaker(self, endpoint: Optional[str] = None) -> Optional[CircuitBreaker]:
+        breaker_config = self.config.get("circuit_breaker", {})
+        if breaker_config is False:
+            return None
+        breaker_config = breaker_config if isinstance(breaker_config, dict) else {}
+        endpoint = endpoint or self.get_endpoint()
+        if endpoint is not None:
+            return circuit_breakers.get(endpoint, breaker_config)
+        if self._circuit_breaker is None:
+            self._circuit_breaker = CircuitBreaker.from_config(self.get_provider_name(), breaker_config)
+        return self._circuit_breaker
+
+    async def call_with_retry(self, func: Callable[[], Awaitable[Any]], metadata: Dict[str, Any], endpoint: Optional[str] = None) -> Any:
+        """Await `func()` under the retry policy and the endpoint's circuit breaker.
+
+        Subclasses wrap the backend call itself so that only the network round
+        trip is repeated. The retry count is written to `metadata["retries"]`.
+        Every attempt after the first one of a call takes its own request token
+        from the rate limiter.
+        """
+        async def attempt():
+            if self.limiter:
+                if _request_token_taken.get():
+                    _request_token_taken.set(False)
+                else:
+                    metadata["limiter_wait_time"] = metadata.get("limiter_wait_time", 0.0) + await self.limiter.acquire_request()
+            return await func()
+
+        try:
+            return await self.retry_policy.call(attempt, breaker=self.get_circuit_breaker(endpoint), metadata=metadata)
+        finally:
+            self.retries += metadata.get("retries", 0)
+
+    def get_sampling_params(self) -> Dict[str, Any]:
+        """Sampling parameters declared in the provider config."""
+        return {param: self.config[param] for param in SAMPLING_PARAMS if param in self.config}
+
+    def is_deterministic(self) -> bool:
+        """Whether identical requests are expected to produce identical responses."""
+        if "deterministic" in self.config:
+            return bool(self.config["deterministic"])
+        params = self.get_sampling_params()
+        return params.get("temperature") == 0 or params.get("seed") is not None
+
+    def normalize_messages(self, history: List[Message], system_message: str) -> Any:
+        """Provider-independent form of the request messages, used for request fingerprints."""
+        return {"system": system_message, "history": serialize_history(history)}
+
+    def get_request_fingerprint(self, history: List[Message], system_message: str, tools: Optional[List[Dict[str, Any]]] = None) -> str:
+        request = {
+            "provider": self.get_provider_name(),
+            "model": getattr(self, "model", None),
+            "messages": self.normalize_messages(history, system_message),
+            "sampling": self.get_sampling_params(),
+        }
+        if tools:
+            request["tools"] = tools
+        return fingerprint(request)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Runtime counters included in the Maia report."""
+        stats = {}
+        if self.response_cache is not None:
+            stats["cache"] = self.response_cache.get_stats()
+        if self.limiter:
+            stats["limiter"] = self.limiter.get_stats()
+        if self.single_flight is not None:
+            stats["single_flight"] = self.single_flight.get_stats()
+        if self.retries:
+            stats["retries"] = self.retries
+        if self._executor is not None:
+            stats["executor"] = self._executor.get_stats()
+        return stats
+
     def handle_ignore_trigger_prompt(self, system_message: str, ignore_trigger_prompt: str) -> str:
         if ignore_trigger_prompt:
             return f"{system_message}\n\n{ignore_trigger_prompt}"
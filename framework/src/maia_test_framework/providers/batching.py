@@ -0,0 +1,82 @@
+# maia_test_framework/providers/batching.py
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+
+class MicroBatcher:
+    """Groups concurrent single-item calls into batched calls.
+
+    The first item submitted opens a batch; the batch is flushed once it holds
+    `max_batch_size` items or `max_wait` seconds have passed. `batch_func`
+    receives the items and returns one result per item, in order; a result that
+    is an exception is raised to that item's caller only.
+    """
+
+    def __init__(self, batch_func: Callable[[List[Any]], Awaitable[List[Any]]], max_batch_size: int = 16, max_wait: float = 0.01):
+        self.batch_func = batch_func
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Running batches, referenced so they are not garbage collected mid-flight
+        self._tasks: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.items = 0
+        self.max_size_seen = 0
+
+    @classmethod
+    def from_config(cls, batch_func: Callable[[List[Any]], Awaitable[List[Any]]], config: Dict[str, Any]) -> "MicroBatcher":
+        return cls(batch_func, max_batch_size=config.get("max_batch_size", 16), max_wait=config.get("max_wait", 0.01))
+
+    async def submit(self, item: Any) -> Tuple[Any, int]:
+        """Return the item's result and the size of the batch it was sent in."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        # Callers cancelled while waiting are left out of the batch
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        self.batches += 1
+        self.items += len(batch)
+        self.max_size_seen = max(self.max_size_seen, len(batch))
+        try:
+            try:
+                results = await self.batch_func([item for item, _ in batch])
+            except Exception as e:
+                results = [e] * len(batch)
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result((result, len(batch)))
+        finally:
+            # A cancelled batch, or one returning too few results, must not leave callers waiting forever
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "max_batch_size": self.max_size_seen,
+            "mean_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+        }
@@ -0,0 +1,164 @@
+# maia_test_framework/providers/cassette.py
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from maia_test_framework.core.exceptions import CassetteMissError
+from maia_test_framework.core.message import AgentResponse, Message, TimedAgentResponse
+from maia_test_framework.providers.base import BaseProvider
+from maia_test_framework.utils.fingerprint import fingerprint, serialize_history
+
+CASSETTE_MODES = ("record", "replay")
+
+
+class Cassette:
+    """Append-only JSON Lines store of provider interactions.
+
+    Only an index of request key -> file offset is kept in memory; records are
+    read from disk on demand. Later records for the same key win.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._index: Dict[str, int] = {}
+        self._load_index()
+
+    def _load_index(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            offset = f.tell()
+            for line in iter(f.readline, b""):
+                try:
+                    self._index[json.loads(line)["key"]] = offset
+                except (json.JSONDecodeError, KeyError):
+                    # Tolerate a truncated trailing line from an interrupted run
+                    pass
+                offset = f.tell()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        offset = self._index.get(key)
+        if offset is None:
+            return None
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def append(self, key: str, request: Dict[str, Any], response: TimedAgentResponse):
+        record = {
+            "key": key,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "request": request,
+            "response": {
+                "content": response.content,
+                "metadata": response.metadata,
+                "raw_response": response.raw_response,
+                "processing_time": response.processing_time,
+            },
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "ab") as f:
+            offset = f.tell()
+            f.write(json.dumps(record, default=str).encode("utf-8") + b"\n")
+        self._index[key] = offset
+
+
+class CassetteProvider(BaseProvider):
+    """Wraps any provider to record its responses to, or replay them from, a cassette file.
+
+    Config:
+        provider: the BaseProvider instance to wrap.
+        path: cassette file location.
+        mode: "record" always calls the wrapped provider and appends the result;
+              "replay" serves recorded responses and records misses.
+        strict: in replay mode, raise CassetteMissError instead of calling the
+                wrapped provider on a miss.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.provider: BaseProvider = self.config.get("provider")
+        if not isinstance(self.provider, BaseProvider):
+            raise ValueError("The 'provider' parameter must be an instance of BaseProvider.")
+
+        self.mode = self.config.get("mode", "replay")
+        if self.mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode '{self.mode}', expected one of {CASSETTE_MODES}")
+        self.strict = self.config.get("strict", False)
+        self.cassette = Cassette(self.config["path"])
+        self.replayed = 0
+        self.recorded = 0
+
+    def get_provider_name(self) -> str:
+        return self.provider.get_provider_name()
+
+    async def generate(self, history: List[Message], system_message: str = "", **kwargs: Any) -> AgentResponse:
+        return await self.provider.generate(history, system_message, **kwargs)
+
+    def supports_native_tools(self) -> bool:
+        return self.provider.supports_native_tools()
+
+    def _build_request(self, history: List[Message], system_message: str, ignore_trigger_prompt: str, tools: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        request = {
+            "provider": self.provider.get_provider_name(),
+            "model": getattr(self.provider, "model", None),
+            "system_message": system_message,
+            "history": serialize_history(history),
+            "ignore_trigger_prompt": ignore_trigger_prompt,
+        }
+        if tools:
+            request["tools"] = tools
+        return request
+
+    async def base_generate(self, history: List[Message], system_message: str = "", ignore_trigger_prompt: str = "", tools: Optional[List[Dict[str, Any]]] = None) -> TimedAgentResponse:
+        request = self._build_request(history, system_message, ignore_trigger_prompt, tools)
+        key = fingerprint(request)
+
+        if self.mode == "replay":
+            start_time = time.time()
+            record = self.cassette.get(key)
+            if record is not None:
+                self.replayed += 1
+                recorded = record["response"]
+                metadata = {
+                    **recorded["metadata"],
+                    "cassette": "replayed",
+                    "recorded_processing_time": recorded["processing_time"],
+                }
+                # A replay costs nothing, keep the recorded usage for reference only
+                if "usage" in metadata:
+                    metadata["saved_usage"] = metadata.pop("usage")
+                return TimedAgentResponse(
+                    content=recorded["content"],
+                    metadata=metadata,
+                    raw_response=recorded["raw_response"],
+                    processing_time=time.time() - start_time,
+                )
+            if self.strict:
+                raise CassetteMissError(
+                    f"No recorded response in cassette '{self.cassette.path}' for request {key[:12]} "
+                    f"to provider '{request['provider']}'. Re-run in record mode to capture it.",
+                    key=key,
+                )
+
+        response = await self.provider.base_generate(history, system_message, ignore_trigger_prompt, tools=tools)
+        # Failed calls are not recorded, otherwise a transient error would be replayed forever
+        if not response.metadata.get("error"):
+            self.cassette.append(key, request, response)
+            self.recorded += 1
+        return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.provider.get_stats(),
+            "cassette": {"mode": self.mode, "replayed": self.replayed, "recorded": self.recorded},
+        }
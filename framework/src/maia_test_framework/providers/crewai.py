@@ -1,6 +1,5 @@
 # maia_test_framework/providers/crewai.py
 import time
-import asyncio
 from typing import Any, Dict, List, Optional, Callable
 from maia_test_framework.core.message import AgentResponse, Message
 from maia_test_framework.providers.base import BaseProvider
@@ -13,7 +12,10 @@ except ImportError:
 
 
 class CrewAIProvider(BaseProvider):
-    """Provider for CrewAI crews and agents."""
+    """Provider for CrewAI crews and agents.
+
+    Kickoffs run in the provider's thread pool ('executor' config); process mode is not supported.
+    """
 
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
@@ -25,6 +27,9 @@ class CrewAIProvider(BaseProvider):
         self.crew = self.config.get("crew")
         if not isinstance(self.crew, Crew):
             raise ValueError("The 'crew' parameter must be an instance of a CrewAI Crew.")
+        if self.config.get("executor", {}).get("mode") == "process":
+            # Process pools pickle the callable, i.e. the whole crew with its agents, LLM clients and tools
+            raise ValueError("CrewAIProvider does not support the 'process' executor mode, crews cannot be sent to worker processes.")
 
         # Hooks for customization
         self.input_mapper: Optional[Callable[[List[Message], str], Dict[str, Any]]] = self.config.get("input_mapper")
@@ -41,11 +46,16 @@ class CrewAIProvider(BaseProvider):
         else:
             input_dict = {"input": user_prompt, "system": system_message}
 
+        metadata = {"agent_type": "crewai", "crew_class": self.crew.__class__.__name__}
+
         start_time = time.perf_counter()
 
         try:
-            # CrewAI currently does not have async run, so wrap in thread
-            raw_response = await asyncio.to_thread(self.crew.kickoff, input_dict)
+            # CrewAI currently does not have async run, so run it in the provider's own pool
+            raw_response = await self.call_with_retry(
+                lambda: self.run_blocking(self.crew.kickoff, input_dict, metadata=metadata),
+                metadata,
+            )
 
             if self.output_parser:
                 content = self.output_parser(raw_response)
@@ -54,23 +64,17 @@ class CrewAIProvider(BaseProvider):
                 content = str(raw_response)
 
             elapsed = time.perf_counter() - start_time
+            metadata["elapsed_time"] = round(elapsed, 3)
 
             return AgentResponse(
                 content=content,
-                metadata={
-                    "agent_type": "crewai",
-                    "crew_class": self.crew.__class__.__name__,
-                    "elapsed_time": round(elapsed, 3),
-                },
+                metadata=metadata,
                 raw_response=raw_response,
             )
 
         except Exception as e:
+            metadata.update({"error": True, "error_message": str(e)})
             return AgentResponse(
                 content="",
-                metadata={
-                    "error": True,
-                    "error_message": str(e),
-                    "crew_class": self.crew.__class__.__name__,
-                },
+                metadata=metadata,
             )
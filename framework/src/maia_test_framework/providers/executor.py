@@ -0,0 +1,75 @@
+# maia_test_framework/providers/executor.py
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+EXECUTOR_MODES = ("thread", "process")
+
+
+def _timed_call(func: Callable[..., Any], args: Tuple[Any, ...], submitted_at: float) -> Tuple[float, Any]:
+    # Module level so process pools can pickle it; wall-clock time is comparable across processes
+    started_at = time.time()
+    return started_at - submitted_at, func(*args)
+
+
+class ProviderExecutor:
+    """Pool running one provider's blocking calls, separate from asyncio's default executor.
+
+    Config:
+        max_workers: pool size (default: Python's default for the pool type).
+        mode: "thread" (default) or "process" for CPU-heavy work; in process mode the
+              callable and its arguments must be picklable.
+        name: prefix of the worker thread names, shown in tracebacks and thread dumps.
+    """
+
+    def __init__(self, name: str, max_workers: Optional[int] = None, mode: str = "thread"):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode '{mode}', expected one of {EXECUTOR_MODES}")
+        self.name = name
+        self.max_workers = max_workers
+        self.mode = mode
+        self._pool: Optional[Executor] = None
+        self.calls = 0
+        self.total_queue_wait = 0.0
+        self.max_queue_wait = 0.0
+
+    @classmethod
+    def from_config(cls, name: str, config: Dict[str, Any]) -> "ProviderExecutor":
+        return cls(
+            name=config.get("name", name),
+            max_workers=config.get("max_workers"),
+            mode=config.get("mode", "thread"),
+        )
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.mode == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+        return self._pool
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+        """Run `func(*args)` in the pool and return its result and the time it queued for a worker."""
+        loop = asyncio.get_running_loop()
+        queue_wait, result = await loop.run_in_executor(self._get_pool(), _timed_call, func, args, time.time())
+        queue_wait = max(0.0, queue_wait)
+        self.calls += 1
+        self.total_queue_wait += queue_wait
+        self.max_queue_wait = max(self.max_queue_wait, queue_wait)
+        return result, queue_wait
+
+    def shutdown(self, wait: bool = True):
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "calls": self.calls,
+            "total_queue_wait": round(self.total_queue_wait, 3),
+            "max_queue_wait": round(self.max_queue_wait, 3),
+        }
@@ -1,51 +1,119 @@
 import asyncio
+import inspect
 import time
-from typing import Any, Dict, List
-from maia_test_framework.core.message import AgentResponse, Message
+from typing import Any, AsyncIterator, Callable, Dict, List
+from maia_test_framework.core.message import AgentResponse, Message, ResponseChunk
 from maia_test_framework.providers.base import BaseProvider
 
 
 class ExistingAgentProvider(BaseProvider):
-    """Provider for existing agent implementations (CrewAI, AutoGen, custom)"""
-    
+    """Provider for existing agent implementations (CrewAI, AutoGen, custom)
+
+    Synchronous agents run in the provider's own pool (see the 'executor' config,
+    'offload: false' calls them on the event loop instead). Agents that are async
+    generators are consumed as streams. 'timeout' bounds each call in seconds,
+    retries included; a timed-out synchronous call is abandoned, not interrupted.
+    """
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.agent_instance = config.get('agent_instance')
         self.call_method = config.get('call_method', 'run')
         self.response_extractor = config.get('response_extractor', lambda x: str(x))
+        self.offload = config.get('offload', True)
+        self.timeout = config.get('timeout')
 
     def get_provider_name(self) -> str:
         return "Existing"
-    
+
+    def _resolve_callable(self) -> Callable[[str], Any]:
+        # Call the existing agent however it needs to be called
+        if hasattr(self.agent_instance, self.call_method):
+            return getattr(self.agent_instance, self.call_method)
+        # Try to call the agent directly
+        if callable(self.agent_instance):
+            return self.agent_instance
+        raise ValueError(f"Don't know how to call agent: {self.agent_instance}")
+
+    def _is_streaming_agent(self) -> bool:
+        target = self._resolve_callable()
+        return inspect.isasyncgenfunction(target) or inspect.isasyncgenfunction(getattr(target, "__call__", None))
+
+    async def _call_agent(self, user_prompt: str, metadata: Dict[str, Any]) -> Any:
+        method = self._resolve_callable()
+        if asyncio.iscoroutinefunction(method) or inspect.isasyncgenfunction(method):
+            result = method(user_prompt)
+        elif self.offload:
+            result = await self.run_blocking(method, user_prompt, metadata=metadata)
+        else:
+            result = method(user_prompt)
+
+        # Callable objects with async __call__ only reveal themselves by their result
+        if inspect.isawaitable(result):
+            result = await result
+        if inspect.isasyncgen(result):
+            chunks = [chunk async for chunk in result]
+            metadata["chunks"] = len(chunks)
+            return chunks
+        return result
+
     async def generate(self, history: List[Message], system_message: str = "") -> AgentResponse:
         user_prompt = history[-1].content if history else ""
-        
+        metadata = {"agent_type": "existing"}
+
         try:
-            # Call the existing agent however it needs to be called
-            if hasattr(self.agent_instance, self.call_method):
-                method = getattr(self.agent_instance, self.call_method)
-                if asyncio.iscoroutinefunction(method):
-                    raw_response = await method(user_prompt)
-                else:
-                    raw_response = method(user_prompt)
-            else:
-                # Try to call the agent directly
-                if callable(self.agent_instance):
-                    raw_response = self.agent_instance(user_prompt)
-                else:
-                    raise ValueError(f"Don't know how to call agent: {self.agent_instance}")
-            
+            # The deadline covers the retries: a timed-out attempt still occupies its
+            # worker thread, so retrying it would only queue behind the hung call
+            raw_response = await asyncio.wait_for(
+                self.call_with_retry(lambda: self._call_agent(user_prompt, metadata), metadata),
+                timeout=self.timeout,
+            )
+
             # Extract content using the provided extractor function
-            content = self.response_extractor(raw_response)
-            
+            if "chunks" in metadata:
+                content = "".join(self.response_extractor(chunk) for chunk in raw_response)
+            else:
+                content = self.response_extractor(raw_response)
+
             return AgentResponse(
                 content=content,
-                metadata={"agent_type": "existing"},
+                metadata=metadata,
                 raw_response=raw_response,
             )
-            
+
+        except asyncio.TimeoutError:
+            message = f"Agent call timed out after {self.timeout} seconds"
+            return AgentResponse(
+                content="",
+                metadata={"error": True, "error_message": message, "retries": metadata.get("retries", 0)},
+            )
         except Exception as e:
             return AgentResponse(
                 content="",
-                metadata={"error": True, "error_message": str(e)},
-            )
\ No newline at end of file
+                metadata={"error": True, "error_message": str(e), "retries": metadata.get("retries", 0)},
+            )
+
+    async def stream_generate(self, history: List[Message], system_message: str = "") -> AsyncIterator[ResponseChunk]:
+        if not self._is_streaming_agent():
+            async for chunk in super().stream_generate(history, system_message):
+                yield chunk
+            return
+
+        user_prompt = history[-1].content if history else ""
+        stream = self._resolve_callable()(user_prompt)
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        try:
+            while True:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                try:
+                    chunk = await asyncio.wait_for(stream.__anext__(), timeout=remaining)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    raise asyncio.TimeoutError(f"Agent stream timed out after {self.timeout} seconds")
+                text = self.response_extractor(chunk)
+                if text:
+                    yield ResponseChunk(content=text)
+        finally:
+            await stream.aclose()
+        yield ResponseChunk(metadata={"agent_type": "existing"})
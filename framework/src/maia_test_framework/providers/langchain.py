@@ -1,11 +1,17 @@
 # maia_test_framework/providers/langchain.py
 import time
-import asyncio
-from typing import Any, Dict, List, Callable, Optional
-from maia_test_framework.core.message import AgentResponse, Message
+from typing import Any, AsyncIterator, Dict, List, Callable, Optional
+from maia_test_framework.core.message import AgentResponse, Message, ResponseChunk
 from maia_test_framework.providers.base import BaseProvider
 
+from maia_test_framework.providers.batching import MicroBatcher
+
 # Lazy import for langchain
+try:
+    from langchain_core.runnables import Runnable
+except ImportError:
+    Runnable = None
+
 try:
     from langchain.chains.base import Chain
 except ImportError:
@@ -13,18 +19,30 @@ except ImportError:
 
 
 class LangChainProvider(BaseProvider):
-    """Provider for LangChain chains and agents."""
+    """Provider for LangChain runnables (LCEL pipelines, chat models, agents) and legacy chains.
+
+    Config:
+        chain: a Runnable or legacy Chain.
+        batch: group concurrent calls into one `abatch` call, either `true` or
+               {max_batch_size, max_wait} (see MicroBatcher).
+    """
 
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        if Chain is None:
+        if Runnable is None and Chain is None:
             raise ImportError(
                 "langchain is not installed. Please install it with `pip install langchain`"
             )
 
         self.chain = self.config.get("chain")
-        if not isinstance(self.chain, Chain):
-            raise ValueError("The 'chain' parameter must be an instance of a LangChain Chain.")
+        supported = tuple(cls for cls in (Runnable, Chain) if cls is not None)
+        if not isinstance(self.chain, supported):
+            raise ValueError("The 'chain' parameter must be a LangChain Runnable or Chain.")
+
+        batch_config = self.config.get("batch")
+        self.batcher: Optional[MicroBatcher] = None
+        if batch_config and hasattr(self.chain, "abatch"):
+            self.batcher = MicroBatcher.from_config(self._batch_call, batch_config if isinstance(batch_config, dict) else {})
 
         # Hooks for customizing IO behavior
         self.input_mapper: Optional[Callable[[List[Message], str], Dict[str, Any]]] = self.config.get("input_mapper")
@@ -33,60 +51,101 @@ class LangChainProvider(BaseProvider):
     def get_provider_name(self) -> str:
         return f"LangChain-{self.chain.__class__.__name__}"
 
-    async def generate(self, history: List[Message], system_message: str = "") -> AgentResponse:
+    def _build_input(self, history: List[Message], system_message: str) -> Dict[str, Any]:
+        if self.input_mapper:
+            return self.input_mapper(history, system_message)
         user_prompt = history[-1].content if history else ""
+        return {"input": user_prompt, "system": system_message}
 
-        if self.input_mapper:
-            input_dict = self.input_mapper(history, system_message)
-        else:
-            input_dict = {"input": user_prompt, "system": system_message}
+    @staticmethod
+    def _chunk_to_text(chunk: Any) -> str:
+        """Extract text from a streamed chunk (str, message chunk or output dict)."""
+        if isinstance(chunk, str):
+            return chunk
+        if hasattr(chunk, "content"):
+            return str(chunk.content)
+        if isinstance(chunk, dict):
+            for key in ("output", "text"):
+                if isinstance(chunk.get(key), str):
+                    return chunk[key]
+        return ""
+
+    async def stream_generate(self, history: List[Message], system_message: str = "") -> AsyncIterator[ResponseChunk]:
+        if not hasattr(self.chain, "astream"):
+            async for chunk in super().stream_generate(history, system_message):
+                yield chunk
+            return
+
+        async for chunk in self.chain.astream(self._build_input(history, system_message)):
+            text = self._chunk_to_text(chunk)
+            if text:
+                yield ResponseChunk(content=text)
+        yield ResponseChunk(metadata={"agent_type": "langchain", "chain_class": self.chain.__class__.__name__})
+
+    async def _batch_call(self, inputs: List[Dict[str, Any]]) -> List[Any]:
+        # Per-input exceptions are returned so one failing input does not fail the batch
+        return await self.chain.abatch(inputs, return_exceptions=True)
+
+    async def _call_chain(self, input_dict: Dict[str, Any], metadata: Dict[str, Any]) -> Any:
+        # Run chain (async if available, else sync fallback)
+        if self.batcher is not None:
+            raw_response, batch_size = await self.batcher.submit(input_dict)
+            metadata["batch_size"] = batch_size
+            return raw_response
+        if hasattr(self.chain, "ainvoke"):
+            return await self.chain.ainvoke(input_dict)
+        if hasattr(self.chain, "acall"):
+            return await self.chain.acall(input_dict)
+        if hasattr(self.chain, "run"):
+            # Run in the provider's own pool to avoid blocking
+            return await self.run_blocking(self.chain.run, input_dict, metadata=metadata)
+        raise ValueError("Unsupported LangChain chain type: missing ainvoke/acall/run.")
+
+    def _parse_output(self, raw_response: Any) -> str:
+        if self.output_parser:
+            return self.output_parser(raw_response)
+        if isinstance(raw_response, dict):
+            if "output" in raw_response:
+                return raw_response["output"]
+            if "text" in raw_response:
+                return raw_response["text"]
+            # Take the first str-like value
+            str_values = [str(v) for v in raw_response.values() if isinstance(v, (str, int, float))]
+            return str_values[0] if str_values else str(raw_response)
+        if hasattr(raw_response, "content"):
+            # Chat model output (AIMessage)
+            return str(raw_response.content)
+        return str(raw_response)
+
+    async def generate(self, history: List[Message], system_message: str = "") -> AgentResponse:
+        input_dict = self._build_input(history, system_message)
+        metadata = {"agent_type": "langchain", "chain_class": self.chain.__class__.__name__}
 
         start_time = time.perf_counter()
 
         try:
-            # Run chain (async if available, else sync fallback)
-            if hasattr(self.chain, "acall"):
-                raw_response = await self.chain.acall(input_dict)
-            elif hasattr(self.chain, "run"):
-                # Run in thread to avoid blocking
-                raw_response = await asyncio.to_thread(self.chain.run, input_dict)
-            else:
-                raise ValueError("Unsupported LangChain chain type: missing acall/run.")
-
-            # Parse output
-            if self.output_parser:
-                content = self.output_parser(raw_response)
-            else:
-                if isinstance(raw_response, dict):
-                    if "output" in raw_response:
-                        content = raw_response["output"]
-                    elif "text" in raw_response:
-                        content = raw_response["text"]
-                    else:
-                        # Take the first str-like value
-                        str_values = [str(v) for v in raw_response.values() if isinstance(v, (str, int, float))]
-                        content = str_values[0] if str_values else str(raw_response)
-                else:
-                    content = str(raw_response)
+            raw_response = await self.call_with_retry(lambda: self._call_chain(input_dict, metadata), metadata)
+
+            content = self._parse_output(raw_response)
 
             elapsed = time.perf_counter() - start_time
+            metadata["elapsed_time"] = round(elapsed, 3)
 
             return AgentResponse(
                 content=content,
-                metadata={
-                    "agent_type": "langchain",
-                    "chain_class": self.chain.__class__.__name__,
-                    "elapsed_time": round(elapsed, 3),
-                },
+                metadata=metadata,
                 raw_response=raw_response,
             )
 
         except Exception as e:
+            metadata.update({"error": True, "error_message": str(e)})
             return AgentResponse(
                 content="",
-                metadata={
-                    "error": True,
-                    "error_message": str(e),
-                    "chain_class": self.chain.__class__.__name__,
-                },
+                metadata=metadata,
             )
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        if self.batcher is not None:
+            stats["batching"] = self.batcher.get_stats()
+        return stats
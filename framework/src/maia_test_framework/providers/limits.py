@@ -0,0 +1,131 @@
+# maia_test_framework/providers/limits.py
+import asyncio
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+
+class TokenBucket:
+    """Refills at `rate` units per second up to `capacity`.
+
+    The balance may go negative when usage is only known after the fact
+    (e.g. tokens of a completed request); callers then wait until it recovers.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, amount: float = 1.0):
+        """Wait until `amount` units are available and take them.
+
+        With amount=0 this only waits for a non-negative balance.
+        """
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def consume(self, amount: float):
+        self._refill()
+        self.tokens -= amount
+
+
+class ProviderLimiter:
+    """Concurrency cap plus request and token rate limits for one provider instance.
+
+    Config:
+        max_in_flight: maximum concurrent requests.
+        requests_per_second: sustained request rate.
+        burst: requests allowed back to back before the request rate applies (default 1).
+        tokens_per_minute: total tokens per minute, charged once a response reports its usage.
+    """
+
+    def __init__(self, max_in_flight: Optional[int] = None, requests_per_second: Optional[float] = None, tokens_per_minute: Optional[float] = None, burst: float = 1):
+        self.max_in_flight = max_in_flight
+        self.request_bucket = TokenBucket(requests_per_second, burst) if requests_per_second else None
+        self.token_bucket = TokenBucket(tokens_per_minute / 60, tokens_per_minute) if tokens_per_minute else None
+        # Semaphores are bound to the event loop they are first used in
+        self._semaphores = weakref.WeakKeyDictionary()
+        self.in_flight = 0
+        self.acquired = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ProviderLimiter":
+        return cls(
+            max_in_flight=config.get("max_in_flight"),
+            requests_per_second=config.get("requests_per_second"),
+            tokens_per_minute=config.get("tokens_per_minute"),
+            burst=config.get("burst", 1),
+        )
+
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        if not self.max_in_flight:
+            return None
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def acquire(self) -> float:
+        """Wait for a request slot and return the time spent waiting."""
+        start_time = time.perf_counter()
+        semaphore = self._get_semaphore()
+        if semaphore:
+            await semaphore.acquire()
+        try:
+            if self.request_bucket:
+                await self.request_bucket.acquire()
+            if self.token_bucket:
+                await self.token_bucket.acquire(0)
+        except BaseException:
+            if semaphore:
+                semaphore.release()
+            raise
+
+        wait_time = time.perf_counter() - start_time
+        self.in_flight += 1
+        self.acquired += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        return wait_time
+
+    async def acquire_request(self) -> float:
+        """Take a request token for a further attempt of an admitted call and return the time spent waiting."""
+        if not self.request_bucket:
+            return 0.0
+        start_time = time.perf_counter()
+        await self.request_bucket.acquire()
+        wait_time = time.perf_counter() - start_time
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        return wait_time
+
+    def release(self, tokens_used: int = 0):
+        """Free the request slot and charge the tokens the request used."""
+        self.in_flight -= 1
+        if self.token_bucket and tokens_used:
+            self.token_bucket.consume(tokens_used)
+        semaphore = self._get_semaphore()
+        if semaphore:
+            semaphore.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.acquired,
+            "total_wait_time": round(self.total_wait_time, 3),
+            "max_wait_time": round(self.max_wait_time, 3),
+        }
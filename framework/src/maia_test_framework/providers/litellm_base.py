@@ -1,27 +1,87 @@
 # maia_test_framework/providers/litellm_base.py
-import time
-from typing import Dict, Any, List
-from litellm import completion
-from maia_test_framework.core.message import AgentResponse, Message
+import asyncio
+import json
+from typing import AsyncIterator, Dict, Any, List, Optional
+from litellm import acompletion, supports_function_calling
+from maia_test_framework.core.exceptions import CircuitOpenError
+from maia_test_framework.core.message import AgentResponse, Message, ResponseChunk
 from .base import BaseProvider
-from maia_test_framework.utils.network import wait_for_service
+from .retry import CircuitBreaker, is_retryable
+from maia_test_framework.logging_config import get_logger
+from maia_test_framework.utils.network import service_registry, wait_for_service
+
+logger = get_logger(__name__)
 
 class LiteLLMBaseProvider(BaseProvider):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.model = self.config.get("model")
+        # Per-call timeout in seconds, None waits indefinitely
+        self.timeout = self.config.get("timeout")
+        # Seconds to wait for api_base to come up before a call
+        self.ready_timeout = self.config.get("ready_timeout", 60)
+        # Native function calling: true, false (tools described in the prompt) or "auto" (ask LiteLLM)
+        self.native_tools = self.config.get("native_tools", False)
         # Subclasses should set self.api_base if needed
         self.api_base = None
 
     def get_provider_name(self) -> str:
         return self.model
 
+    def get_endpoint(self) -> str:
+        return self.api_base or self.model
+
+    def supports_native_tools(self) -> bool:
+        if self.native_tools == "auto":
+            try:
+                return supports_function_calling(self.model)
+            except Exception:
+                return False
+        return bool(self.native_tools)
+
+    @staticmethod
+    def _tool_call_payload(tool_calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": call["id"],
+                "type": "function",
+                "function": {"name": call["name"], "arguments": json.dumps(call["parameters"])},
+            }
+            for call in tool_calls
+        ]
+
+    @staticmethod
+    def _parse_tool_calls(message: Any) -> List[Dict[str, Any]]:
+        """Requested tool calls as {id, name, parameters}, parameters stay a string if not valid JSON."""
+        tool_calls = []
+        for call in getattr(message, "tool_calls", None) or []:
+            arguments = call.function.arguments or "{}"
+            try:
+                parameters = json.loads(arguments)
+            except json.JSONDecodeError:
+                parameters = arguments
+            tool_calls.append({"id": call.id, "name": call.function.name, "parameters": parameters})
+        return tool_calls
+
     def _prepare_messages(self, history: List[Message], system_message: str) -> List[Dict[str, str]]:
         messages_payload = []
         if system_message.strip():
             messages_payload.append({"role": "system", "content": system_message.strip()})
         
         for message in history:
+            # Native tool calls and their results keep the shape the model produced
+            if message.metadata.get("tool_calls"):
+                messages_payload.append({
+                    "role": "assistant",
+                    "content": message.content or None,
+                    "tool_calls": self._tool_call_payload(message.metadata["tool_calls"]),
+                })
+                continue
+            if message.sender_type == "tool" and message.metadata.get("tool_call_id"):
+                messages_payload.append(
+                    {"role": "tool", "tool_call_id": message.metadata["tool_call_id"], "content": message.content}
+                )
+                continue
             role = message.sender_type
             if role not in ["user", "system", "tool"]:
                 # TODO: Assumption is that assistant becomes the user. Improve it.
@@ -32,28 +92,149 @@ class LiteLLMBaseProvider(BaseProvider):
         
         return messages_payload
 
+    def normalize_messages(self, history: List[Message], system_message: str) -> Any:
+        return self._prepare_messages(history, system_message)
+
     def _get_completion_kwargs(self, messages_payload: List[Dict[str, str]]) -> Dict[str, Any]:
-        """Subclasses must implement this to provide specific kwargs for litellm.completion."""
+        """Subclasses must implement this to provide specific kwargs for litellm.acompletion."""
         raise NotImplementedError
 
-    async def generate(self, history: List[Message], system_message: str = "") -> AgentResponse:
-        if self.api_base:
-            await wait_for_service(self.api_base)
+    def _get_call_kwargs(self, messages_payload: List[Dict[str, str]], api_base: Optional[str] = None) -> Dict[str, Any]:
+        kwargs = {
+            **self.get_sampling_params(),
+            **self._get_completion_kwargs(messages_payload),
+            # Retries are owned by the provider's retry policy, not the HTTP client
+            "max_retries": 0,
+        }
+        if api_base:
+            kwargs["api_base"] = api_base
+        return kwargs
+
+    @staticmethod
+    def _usage_to_dict(usage: Any) -> Dict[str, int]:
+        return {
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+            "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+            "total_tokens": getattr(usage, "total_tokens", 0) or 0,
+        }
+
+    def serialize_raw_response(self, raw_response: Any) -> Any:
+        if hasattr(raw_response, "model_dump_json"):
+            return raw_response.model_dump_json()
+        return raw_response
+
+    def _invalidate_service(self, api_base: Optional[str]):
+        """Force a readiness re-probe of api_base after a failed call.
+
+        Not while its circuit is open: calls fail fast until the trial call, which
+        goes straight to the endpoint if it was healthy before.
+        """
+        if not api_base:
+            return
+        breaker = self.get_circuit_breaker(api_base)
+        if breaker is not None and breaker.state == CircuitBreaker.OPEN:
+            return
+        service_registry.invalidate(api_base)
+
+    async def _call_endpoint(self, api_base: Optional[str], kwargs: Dict[str, Any]) -> Any:
+        """One attempt: wait for api_base to be ready, then complete.
 
+        Runs under the retry policy and circuit breaker, so an open circuit fails
+        before probing and a host that never comes up counts as a failure.
+        """
+        if api_base:
+            await wait_for_service(api_base, timeout=self.ready_timeout)
+        return await asyncio.wait_for(acompletion(**kwargs), timeout=self.timeout)
+
+    async def generate(self, history: List[Message], system_message: str = "", tools: Optional[List[Dict[str, Any]]] = None) -> AgentResponse:
+        return await self._generate_at(self.api_base, history, system_message, tools)
+
+    async def _generate_at(self, api_base: Optional[str], history: List[Message], system_message: str, tools: Optional[List[Dict[str, Any]]] = None) -> AgentResponse:
+        """Run one completion against the given api_base."""
         messages_payload = self._prepare_messages(history, system_message)
         
+        metadata = {"model": self.model}
         try:
-            kwargs = self._get_completion_kwargs(messages_payload)
-            response = completion(**kwargs)
-            content = response.choices[0].message.content
-            raw_response_data = response.model_dump_json()
+            kwargs = self._get_call_kwargs(messages_payload, api_base)
+            if tools:
+                kwargs["tools"] = tools
+            # Cancellation (e.g. of Session.agent_responds) propagates through
+            # wait_for and aborts the in-flight HTTP request.
+            response = await self.call_with_retry(
+                lambda: self._call_endpoint(api_base, kwargs),
+                metadata,
+                endpoint=api_base or self.model,
+            )
+            content = response.choices[0].message.content or ""
+            # Serialized according to the provider's raw_response retention policy
+            raw_response_data = response
+            metadata["finish_reason"] = response.choices[0].finish_reason
+            tool_calls = self._parse_tool_calls(response.choices[0].message)
+            if tool_calls:
+                metadata["tool_calls"] = tool_calls
+            if getattr(response, "usage", None):
+                metadata["usage"] = self._usage_to_dict(response.usage)
+        except asyncio.TimeoutError as e:
+            # Either the completion or the wait for api_base to come up
+            error_message = str(e) or f"Timed out after {self.timeout} seconds"
+            logger.warning(f"LiteLLM call timed out: {error_message}")
+            self._invalidate_service(api_base)
+            content = ""
+            raw_response_data = {"error": error_message}
+            metadata.update({"error": True, "error_message": raw_response_data["error"], "transient": True})
         except Exception as e:
-            print(f"Error using LiteLLM: {e}")
+            logger.error(f"Error using LiteLLM: {e}")
+            self._invalidate_service(api_base)
             content = ""
             raw_response_data = {"error": str(e)}
+            # Whether the endpoint rather than the request is at fault
+            transient = is_retryable(e) or isinstance(e, CircuitOpenError)
+            metadata.update({"error": True, "error_message": str(e), "transient": transient})
 
         return AgentResponse(
             content=content,
             raw_response=raw_response_data,
-            metadata={"model": self.model},
+            metadata=metadata,
         )
+
+    async def stream_generate(self, history: List[Message], system_message: str = "") -> AsyncIterator[ResponseChunk]:
+        async for chunk in self._stream_at(self.api_base, history, system_message):
+            yield chunk
+
+    async def _stream_at(self, api_base: Optional[str], history: List[Message], system_message: str) -> AsyncIterator[ResponseChunk]:
+        """Stream one completion from the given api_base."""
+        messages_payload = self._prepare_messages(history, system_message)
+        kwargs = {
+            **self._get_call_kwargs(messages_payload, api_base),
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+
+        metadata = {"model": self.model}
+        try:
+            # The timeout bounds the wait for the stream to open, not the whole generation.
+            # Only opening the stream is retried, chunks already yielded cannot be taken back.
+            stream = await self.call_with_retry(
+                lambda: self._call_endpoint(api_base, kwargs),
+                metadata,
+                endpoint=api_base or self.model,
+            )
+            finish_reason = None
+            usage = None
+            async for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    usage = self._usage_to_dict(chunk.usage)
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                finish_reason = choice.finish_reason or finish_reason
+                if choice.delta.content:
+                    yield ResponseChunk(content=choice.delta.content)
+        except Exception:
+            self._invalidate_service(api_base)
+            raise
+
+        metadata["finish_reason"] = finish_reason
+        if usage:
+            metadata["usage"] = usage
+        yield ResponseChunk(metadata=metadata)
@@ -1,29 +1,151 @@
-from typing import Dict, Any, Callable
-from maia_test_framework.core.message import AgentResponse
+import asyncio
+import bisect
+import itertools
+import random
+import re
+from typing import Dict, Any, Callable, AsyncIterator, List, Optional
+from maia_test_framework.core.message import AgentResponse, ResponseChunk
 from maia_test_framework.providers.base import BaseProvider
 
+LATENCY_DISTRIBUTIONS = ("fixed", "normal", "lognormal", "histogram")
+
+
+class MockProviderError(Exception):
+    """Injected provider failure, carries a 503 so it is classified as transient."""
+    status_code = 503
+
+
+class LatencyDistribution:
+    """Samples simulated provider latencies in seconds.
+
+    Config:
+        distribution: "fixed" (value), "normal" (mean, stddev), "lognormal" (mu, sigma of
+                      the underlying normal) or "histogram" (buckets: [[upper_bound, count], ...],
+                      sampled by count and uniformly within the bucket).
+        min / max: clamp sampled values (default 0 / no bound).
+    """
+
+    def __init__(self, config: Dict[str, Any], rng: random.Random):
+        self.distribution = config.get("distribution", "fixed")
+        if self.distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{self.distribution}', expected one of {LATENCY_DISTRIBUTIONS}")
+        self.config = config
+        self.rng = rng
+        self.min = config.get("min", 0.0)
+        self.max = config.get("max")
+        if self.distribution == "histogram":
+            buckets = sorted(config["buckets"])
+            self._bounds = [bound for bound, _ in buckets]
+            self._cumulative = list(itertools.accumulate(count for _, count in buckets))
+
+    def _sample_histogram(self) -> float:
+        index = bisect.bisect_right(self._cumulative, self.rng.random() * self._cumulative[-1])
+        index = min(index, len(self._bounds) - 1)
+        lower = self._bounds[index - 1] if index > 0 else 0.0
+        return self.rng.uniform(lower, self._bounds[index])
+
+    def sample(self) -> float:
+        if self.distribution == "fixed":
+            value = self.config.get("value", 0.0)
+        elif self.distribution == "normal":
+            value = self.rng.gauss(self.config.get("mean", 0.0), self.config.get("stddev", 0.0))
+        elif self.distribution == "lognormal":
+            value = self.rng.lognormvariate(self.config.get("mu", 0.0), self.config.get("sigma", 0.0))
+        else:
+            value = self._sample_histogram()
+        value = max(self.min, value)
+        return min(self.max, value) if self.max is not None else value
+
+
 class MockProvider(BaseProvider):
-    """A mock provider that returns pre-configured responses or generates them dynamically."""
+    """A mock provider that returns pre-configured responses or generates them dynamically.
+
+    Optionally simulates a real backend:
+        latency: LatencyDistribution config, the wait before the first token.
+        tokens_per_second: pace of the response, one word per token.
+        error_rate / timeout_rate: fraction of calls failing with a transient error or
+                                   hanging for `timeout` seconds (default 10) and timing out.
+        seed: seeds the random generator behind latencies and injected failures.
+
+    Injected failures are not retried and do not open a circuit unless 'retry' or
+    'circuit_breaker' is configured, so the rates are what a caller observes.
+    """
 
     def __init__(self, config: Dict[str, Any]):
+        config = {"retry": False, "circuit_breaker": False, **config}
         super().__init__(config)
         self.responses = self.config.get("responses", [])
         self.response_function: Callable[[str], str] = self.config.get("response_function")
         self.response_index = 0
+        # Delay between simulated chunks when streaming
+        self.chunk_delay = self.config.get("chunk_delay", 0.0)
+
+        self.rng = random.Random(self.config.get("seed"))
+        latency_config = self.config.get("latency")
+        self.latency: Optional[LatencyDistribution] = LatencyDistribution(latency_config, self.rng) if latency_config else None
+        self.tokens_per_second = self.config.get("tokens_per_second")
+        self.error_rate = self.config.get("error_rate", 0.0)
+        self.timeout_rate = self.config.get("timeout_rate", 0.0)
+        self.timeout = self.config.get("timeout", 10.0)
+        self.simulated = bool(self.latency or self.tokens_per_second or self.error_rate or self.timeout_rate)
 
     def get_provider_name(self) -> str:
         return "Mock"
 
-    async def generate(self, history: list, system_message: str = "") -> AgentResponse:
-        """Generates a response using a function or from a pre-configured list."""
+    def _next_content(self, history: list) -> str:
         user_prompt = history[-1].content if history else ""
 
         if self.response_function:
-            response_content = self.response_function(user_prompt)
-            return AgentResponse(content=response_content)
+            return self.response_function(user_prompt)
         elif self.response_index < len(self.responses):
             response_content = self.responses[self.response_index]
             self.response_index += 1
-            return AgentResponse(content=response_content)
+            return response_content
         else:
-            return AgentResponse(content="")
\ No newline at end of file
+            return ""
+
+    @staticmethod
+    def _tokenize(content: str) -> List[str]:
+        return re.findall(r"\s*\S+\s*", content)
+
+    async def _simulate_call(self):
+        """Wait out the simulated latency, failing as often as configured."""
+        roll = self.rng.random()
+        if roll < self.timeout_rate:
+            await asyncio.sleep(self.timeout)
+            raise asyncio.TimeoutError(f"Simulated timeout after {self.timeout} seconds")
+        if self.latency:
+            await asyncio.sleep(self.latency.sample())
+        if roll < self.timeout_rate + self.error_rate:
+            raise MockProviderError("Simulated provider error")
+
+    async def generate(self, history: list, system_message: str = "") -> AgentResponse:
+        """Generates a response using a function or from a pre-configured list."""
+        if not self.simulated:
+            return AgentResponse(content=self._next_content(history))
+
+        metadata = {}
+        try:
+            await self.call_with_retry(self._simulate_call, metadata)
+        except Exception as e:
+            metadata.update({"error": True, "error_message": str(e)})
+            return AgentResponse(content="", metadata=metadata)
+
+        content = self._next_content(history)
+        if self.tokens_per_second:
+            await asyncio.sleep(len(self._tokenize(content)) / self.tokens_per_second)
+        return AgentResponse(content=content, metadata=metadata)
+
+    async def stream_generate(self, history: list, system_message: str = "") -> AsyncIterator[ResponseChunk]:
+        """Streams the response word by word, one word per simulated token."""
+        metadata = {}
+        if self.simulated:
+            await self.call_with_retry(self._simulate_call, metadata)
+        chunk_delay = 1 / self.tokens_per_second if self.tokens_per_second else self.chunk_delay
+        for i, token in enumerate(self._tokenize(self._next_content(history))):
+            # Simulated latency already covers the first token
+            if i or not self.tokens_per_second:
+                await asyncio.sleep(chunk_delay)
+            yield ResponseChunk(content=token)
+        if metadata:
+            yield ResponseChunk(metadata=metadata)
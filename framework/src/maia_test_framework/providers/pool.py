@@ -0,0 +1,113 @@
+# maia_test_framework/providers/pool.py
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+ROUTING_STRATEGIES = ("least_outstanding", "ewma")
+
+
+class PoolEndpoint:
+    """Load and health of one endpoint in an EndpointPool."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+        self.ewma_latency: Optional[float] = None
+
+    def is_ejected(self, now: float) -> bool:
+        return self.ejected_until > now
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "ejections": self.ejections,
+            "in_flight": self.in_flight,
+            "ewma_latency": round(self.ewma_latency, 3) if self.ewma_latency is not None else None,
+            "ejected": self.is_ejected(time.monotonic()),
+        }
+
+
+class EndpointPool:
+    """Routes requests across endpoints and ejects the ones that keep failing.
+
+    Config:
+        endpoints: list of endpoint URLs.
+        routing: "least_outstanding" picks the endpoint with the fewest in-flight
+                 requests; "ewma" weighs in-flight requests by the endpoint's
+                 moving average latency (default "least_outstanding").
+        max_failures: consecutive failures before an endpoint is ejected (default 3).
+        eject_time: seconds an ejected endpoint is skipped before it gets traffic again (default 30).
+        ewma_alpha: weight of the latest latency in the moving average (default 0.3).
+    """
+
+    def __init__(self, urls: List[str], routing: str = "least_outstanding", max_failures: int = 3, eject_time: float = 30.0, ewma_alpha: float = 0.3):
+        if not urls:
+            raise ValueError("An endpoint pool needs at least one endpoint.")
+        if routing not in ROUTING_STRATEGIES:
+            raise ValueError(f"Unknown routing strategy '{routing}', expected one of {ROUTING_STRATEGIES}")
+        self.endpoints = [PoolEndpoint(url) for url in urls]
+        self.routing = routing
+        self.max_failures = max_failures
+        self.eject_time = eject_time
+        self.ewma_alpha = ewma_alpha
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "EndpointPool":
+        return cls(
+            urls=config.get("endpoints", []),
+            routing=config.get("routing", "least_outstanding"),
+            max_failures=config.get("max_failures", 3),
+            eject_time=config.get("eject_time", 30.0),
+            ewma_alpha=config.get("ewma_alpha", 0.3),
+        )
+
+    def _score(self, endpoint: PoolEndpoint):
+        if self.routing == "ewma":
+            # Endpoints without a measurement yet score 0 so each gets tried
+            return ((endpoint.ewma_latency or 0.0) * (endpoint.in_flight + 1), endpoint.requests)
+        return (endpoint.in_flight, endpoint.requests)
+
+    def acquire(self, exclude: Iterable[str] = ()) -> Optional[PoolEndpoint]:
+        """Pick an endpoint for the next request, or None when every endpoint is excluded.
+
+        When all remaining endpoints are ejected, the one due back first is used
+        rather than failing the request outright.
+        """
+        exclude = set(exclude)
+        candidates = [e for e in self.endpoints if e.url not in exclude]
+        if not candidates:
+            return None
+        now = time.monotonic()
+        healthy = [e for e in candidates if not e.is_ejected(now)]
+        if healthy:
+            endpoint = min(healthy, key=self._score)
+        else:
+            endpoint = min(candidates, key=lambda e: e.ejected_until)
+        endpoint.in_flight += 1
+        endpoint.requests += 1
+        return endpoint
+
+    def release(self, endpoint: PoolEndpoint, latency: Optional[float] = None, failed: bool = False):
+        endpoint.in_flight -= 1
+        if failed:
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            # Failures keep counting after an endpoint returns, so one more failure ejects it again
+            if endpoint.consecutive_failures >= self.max_failures:
+                endpoint.ejected_until = time.monotonic() + self.eject_time
+                endpoint.ejections += 1
+            return
+        endpoint.consecutive_failures = 0
+        if latency is not None:
+            if endpoint.ewma_latency is None:
+                endpoint.ewma_latency = latency
+            else:
+                endpoint.ewma_latency = self.ewma_alpha * latency + (1 - self.ewma_alpha) * endpoint.ewma_latency
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {endpoint.url: endpoint.get_stats() for endpoint in self.endpoints}
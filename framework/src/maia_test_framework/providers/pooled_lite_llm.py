@@ -0,0 +1,75 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+from maia_test_framework.core.message import AgentResponse, Message, ResponseChunk
+from .litellm_base import LiteLLMBaseProvider
+from .pool import EndpointPool
+
+
+class PooledLiteLLMProvider(LiteLLMBaseProvider):
+    """LiteLLM provider spreading calls over several hosts serving the same model.
+
+    Takes `model` like GenericLiteLLMProvider (e.g. "ollama/mistral") plus the
+    EndpointPool config (`endpoints`, `routing`, `max_failures`, `eject_time`).
+    A call failing on one endpoint is retried on the next best one.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        config = {"ready_timeout": 5, **config}
+        super().__init__(config)
+        self.pool = EndpointPool.from_config(self.config)
+
+    def get_provider_name(self) -> str:
+        return "PooledLiteLLM"
+
+    def _get_completion_kwargs(self, messages_payload: List[Dict[str, str]]) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "messages": messages_payload,
+        }
+
+    async def generate(self, history: List[Message], system_message: str = "", tools: Optional[List[Dict[str, Any]]] = None) -> AgentResponse:
+        tried = []
+        response = None
+        while True:
+            endpoint = self.pool.acquire(exclude=tried)
+            if endpoint is None:
+                return response
+            tried.append(endpoint.url)
+
+            start_time = time.perf_counter()
+            try:
+                response = await self._generate_at(endpoint.url, history, system_message, tools)
+            except asyncio.CancelledError:
+                self.pool.release(endpoint)
+                raise
+            except Exception as e:
+                # Failures _generate_at did not turn into an error response
+                response = AgentResponse(
+                    content="",
+                    raw_response={"error": str(e)},
+                    metadata={"model": self.model, "error": True, "error_message": str(e), "transient": True},
+                )
+            # Client errors are the request's fault, not the endpoint's
+            failed = bool(response.metadata.get("error") and response.metadata.get("transient"))
+            self.pool.release(endpoint, time.perf_counter() - start_time, failed=failed)
+            response.metadata["endpoint"] = endpoint.url
+            if not failed:
+                return response
+
+    async def stream_generate(self, history: List[Message], system_message: str = "") -> AsyncIterator[ResponseChunk]:
+        endpoint = self.pool.acquire()
+        start_time = time.perf_counter()
+        failed = False
+        try:
+            async for chunk in self._stream_at(endpoint.url, history, system_message):
+                yield chunk
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.pool.release(endpoint, time.perf_counter() - start_time, failed=failed)
+        yield ResponseChunk(metadata={"endpoint": endpoint.url})
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**super().get_stats(), "endpoints": self.pool.get_stats()}
@@ -0,0 +1,115 @@
+# maia_test_framework/providers/raw_response.py
+import gzip
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+RETENTION_MODES = ("none", "lazy", "summary", "full")
+
+
+class LazyRawResponse:
+    """Holds the provider's native response and serializes it only on first access."""
+
+    __slots__ = ("_raw", "_serializer", "_value", "_serialized")
+
+    def __init__(self, raw: Any, serializer: Callable[[Any], Any]):
+        self._raw = raw
+        self._serializer = serializer
+        self._value = None
+        self._serialized = False
+
+    def get(self) -> Any:
+        if not self._serialized:
+            self._value = self._serializer(self._raw)
+            self._serialized = True
+            # The serialized form replaces the native object
+            self._raw = None
+        return self._value
+
+    def __str__(self) -> str:
+        value = self.get()
+        return value if isinstance(value, str) else json.dumps(value, default=str)
+
+    def __repr__(self) -> str:
+        return f"LazyRawResponse(serialized={self._serialized})"
+
+
+class RawResponseSpill:
+    """Appends large raw payloads to a gzip sidecar file, one gzip member per payload."""
+
+    def __init__(self, path: str, min_bytes: int = 65536):
+        self.path = path
+        self.min_bytes = min_bytes
+        self.spilled = 0
+        self._lock = threading.Lock()
+
+    def maybe_spill(self, payload: Any) -> Any:
+        """Return a sidecar reference for payloads of at least `min_bytes`, otherwise the payload."""
+        data = (payload if isinstance(payload, str) else json.dumps(payload, default=str)).encode("utf-8")
+        if len(data) < self.min_bytes:
+            return payload
+        compressed = gzip.compress(data)
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "ab") as f:
+                offset = f.tell()
+                f.write(compressed)
+        self.spilled += 1
+        return {
+            "spilled_to": self.path,
+            "offset": offset,
+            "length": len(compressed),
+            "bytes": len(data),
+            "is_json": not isinstance(payload, str),
+        }
+
+
+def load_raw_response(reference: Dict[str, Any]) -> Any:
+    """Read back a raw response spilled by RawResponseSpill."""
+    with open(reference["spilled_to"], "rb") as f:
+        f.seek(reference["offset"])
+        data = gzip.decompress(f.read(reference["length"])).decode("utf-8")
+    return json.loads(data) if reference.get("is_json") else data
+
+
+class RawResponsePolicy:
+    """How much of each provider's raw response is kept on the returned response.
+
+    Config (provider config keys):
+        raw_response: "full" keeps the serialized response (default), "lazy" keeps the
+                      native object and serializes it on first access, "summary" keeps
+                      only usage and finish reason, "none" drops it.
+        raw_response_spill: {path, min_bytes} writes serialized payloads of at least
+                            min_bytes (default 64 KiB) to a gzip sidecar file and keeps
+                            a reference instead, see load_raw_response. Applies to "full".
+    """
+
+    def __init__(self, mode: str = "full", spill: Optional[RawResponseSpill] = None):
+        if mode not in RETENTION_MODES:
+            raise ValueError(f"Unknown raw_response retention '{mode}', expected one of {RETENTION_MODES}")
+        self.mode = mode
+        self.spill = spill
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RawResponsePolicy":
+        spill_config = config.get("raw_response_spill")
+        spill = None
+        if spill_config:
+            spill = RawResponseSpill(spill_config["path"], min_bytes=spill_config.get("min_bytes", 65536))
+        return cls(mode=config.get("raw_response", "full"), spill=spill)
+
+    def apply(self, raw: Any, metadata: Dict[str, Any], serializer: Callable[[Any], Any]) -> Any:
+        if raw is None or self.mode == "none":
+            return None
+        if self.mode == "summary":
+            summary = {key: metadata[key] for key in ("finish_reason", "usage", "error_message") if key in metadata}
+            return summary or None
+        if self.mode == "lazy":
+            return LazyRawResponse(raw, serializer)
+        payload = serializer(raw)
+        if self.spill is not None:
+            payload = self.spill.maybe_spill(payload)
+        return payload
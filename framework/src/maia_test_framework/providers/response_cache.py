@@ -0,0 +1,186 @@
+# maia_test_framework/providers/response_cache.py
+import dataclasses
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from maia_test_framework.core.message import TimedAgentResponse
+
+
+class MemoryResponseStore:
+    """Size-bounded in-memory LRU of responses."""
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, TimedAgentResponse]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[TimedAgentResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if self.ttl is not None and time.time() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: str, response: TimedAgentResponse, stored_at: Optional[float] = None):
+        self._entries[key] = (stored_at or time.time(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class SQLiteResponseStore:
+    """Persistent response store with TTL expiry and least-recently-used eviction."""
+
+    def __init__(self, path: str, ttl: Optional[float] = None, max_entries: Optional[int] = None):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                raw_response TEXT,
+                processing_time REAL NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self.purge_expired()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Tuple[float, TimedAgentResponse]]:
+        row = self._conn.execute(
+            "SELECT content, metadata, raw_response, processing_time, created_at FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        content, metadata, raw_response, processing_time, created_at = row
+        now = time.time()
+        if self.ttl is not None and now - created_at > self.ttl:
+            with self._conn:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        with self._conn:
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        response = TimedAgentResponse(
+            content=content,
+            metadata=json.loads(metadata),
+            raw_response=json.loads(raw_response) if raw_response is not None else None,
+            processing_time=processing_time,
+        )
+        return created_at, response
+
+    def put(self, key: str, response: TimedAgentResponse):
+        now = time.time()
+        raw_response = json.dumps(response.raw_response, default=str) if response.raw_response is not None else None
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, response.content, json.dumps(response.metadata, default=str), raw_response,
+                 response.processing_time, now, now),
+            )
+            if self.max_entries is not None:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def purge_expired(self):
+        if self.ttl is None:
+            return
+        with self._conn:
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl,))
+
+    def close(self):
+        self._conn.close()
+
+
+class ResponseCache:
+    """Two-tier cache of provider responses: an in-memory LRU backed by an optional SQLite file.
+
+    Config:
+        max_entries: size bound of the in-memory LRU (default 256).
+        ttl: seconds a cached response stays valid (default: no expiry).
+        path: SQLite file for the persistent tier, omitted to cache in memory only.
+        max_disk_entries: size bound of the persistent tier (default: unbounded).
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = None, path: Optional[str] = None, max_disk_entries: Optional[int] = None):
+        self.memory = MemoryResponseStore(max_entries=max_entries, ttl=ttl)
+        self.disk = SQLiteResponseStore(path, ttl=ttl, max_entries=max_disk_entries) if path else None
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.saved_latency = 0.0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ResponseCache":
+        return cls(
+            max_entries=config.get("max_entries", 256),
+            ttl=config.get("ttl"),
+            path=config.get("path"),
+            max_disk_entries=config.get("max_disk_entries"),
+        )
+
+    def get(self, key: str) -> Optional[TimedAgentResponse]:
+        start_time = time.time()
+        response = self.memory.get(key)
+        if response is None and self.disk is not None:
+            entry = self.disk.get(key)
+            if entry is not None:
+                stored_at, response = entry
+                self.memory.put(key, response, stored_at=stored_at)
+                self.disk_hits += 1
+
+        if response is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.saved_latency += response.processing_time
+        metadata = {**response.metadata, "cache": "hit"}
+        # Nothing was spent on a hit, keep the original usage for reference only
+        if "usage" in metadata:
+            metadata["saved_usage"] = metadata.pop("usage")
+        return TimedAgentResponse(
+            content=response.content,
+            metadata=metadata,
+            raw_response=response.raw_response,
+            processing_time=time.time() - start_time,
+        )
+
+    def put(self, key: str, response: TimedAgentResponse):
+        # The caller keeps the original and may annotate it
+        response = dataclasses.replace(response, metadata=dict(response.metadata))
+        self.memory.put(key, response)
+        if self.disk is not None:
+            self.disk.put(key, response)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "saved_latency": round(self.saved_latency, 3),
+            "memory_entries": len(self.memory),
+        }
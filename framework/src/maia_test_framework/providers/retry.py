@@ -0,0 +1,191 @@
+# maia_test_framework/providers/retry.py
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from maia_test_framework.core.exceptions import CircuitOpenError
+from maia_test_framework.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+RETRYABLE_STATUS_CODES = (408, 429)
+
+
+def get_status_code(error: BaseException) -> Optional[int]:
+    """HTTP status carried by an exception, as raised by LiteLLM, httpx or OpenAI clients."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Timeouts, connection failures, 5xx and 429 are transient; other client errors are not."""
+    if isinstance(error, CircuitOpenError):
+        return False
+    status_code = get_status_code(error)
+    if status_code is not None:
+        return status_code >= 500 or status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError))
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient provider failures.
+
+    Config:
+        max_attempts: total attempts including the first call (default 3, 1 disables retries).
+        initial_delay: backoff before the first retry in seconds (default 0.5).
+        max_delay: upper bound of a single backoff (default 10).
+        multiplier: backoff growth per attempt (default 2).
+        jitter: draw each delay uniformly from [0, backoff] (default true).
+    """
+
+    def __init__(self, max_attempts: int = 3, initial_delay: float = 0.5, max_delay: float = 10.0, multiplier: float = 2.0, jitter: bool = True):
+        self.max_attempts = max(1, max_attempts)
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    @classmethod
+    def from_config(cls, config: Any) -> "RetryPolicy":
+        if config is False:
+            return cls(max_attempts=1)
+        config = config if isinstance(config, dict) else {}
+        return cls(
+            max_attempts=config.get("max_attempts", 3),
+            initial_delay=config.get("initial_delay", 0.5),
+            max_delay=config.get("max_delay", 10.0),
+            multiplier=config.get("multiplier", 2.0),
+            jitter=config.get("jitter", True),
+        )
+
+    def get_delay(self, retry: int) -> float:
+        backoff = min(self.max_delay, self.initial_delay * self.multiplier ** (retry - 1))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    async def call(self, func: Callable[[], Awaitable[Any]], breaker: Optional["CircuitBreaker"] = None, metadata: Optional[Dict[str, Any]] = None) -> Any:
+        """Await `func()` until it succeeds, fails permanently or runs out of attempts.
+
+        The number of retries is written to `metadata["retries"]`; the last error is re-raised.
+        """
+        retries = 0
+        if metadata is not None:
+            metadata["retries"] = 0
+        while True:
+            if breaker is not None and not breaker.allow():
+                raise CircuitOpenError(
+                    f"Circuit open for endpoint '{breaker.endpoint}' after {breaker.failures} consecutive failures, "
+                    f"failing fast for {breaker.reset_timeout} seconds.",
+                    endpoint=breaker.endpoint,
+                )
+            try:
+                result = await func()
+            except Exception as e:
+                retryable = is_retryable(e)
+                if breaker is not None:
+                    # A permanent error still proves the backend is reachable
+                    breaker.record_failure() if retryable else breaker.record_success()
+                if not retryable or retries + 1 >= self.max_attempts:
+                    raise
+                retries += 1
+                if metadata is not None:
+                    metadata["retries"] = retries
+                delay = self.get_delay(retries)
+                logger.warning(f"Transient provider error ({e.__class__.__name__}: {e}), retry {retries} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled: says nothing about the endpoint, but a trial must not stay in flight
+                if breaker is not None:
+                    breaker.record_cancelled()
+                raise
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` consecutive transient failures of one endpoint.
+
+    While open every call fails fast. After `reset_timeout` seconds a single trial
+    call is let through; its success closes the circuit, its failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, endpoint: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._trial_in_flight = False
+
+    @classmethod
+    def from_config(cls, endpoint: str, config: Optional[Dict[str, Any]] = None) -> "CircuitBreaker":
+        config = config or {}
+        return cls(
+            endpoint,
+            failure_threshold=config.get("failure_threshold", 5),
+            reset_timeout=config.get("reset_timeout", 30.0),
+        )
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                self.rejected += 1
+                return False
+            self._trial_in_flight = True
+        return True
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_cancelled(self):
+        """Release the half-open trial of a call that was cancelled, the next call becomes the trial."""
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Circuit opened for endpoint '{self.endpoint}' after {self.failures} consecutive failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "failures": self.failures, "rejected": self.rejected}
+
+
+class CircuitBreakerRegistry:
+    """Process-wide circuit breakers keyed by endpoint, shared by all providers calling it."""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, endpoint: str, config: Optional[Dict[str, Any]] = None) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker.from_config(endpoint, config)
+            self._breakers[endpoint] = breaker
+        return breaker
+
+    def reset(self):
+        self._breakers.clear()
+
+
+circuit_breakers = CircuitBreakerRegistry()
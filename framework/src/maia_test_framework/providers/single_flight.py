@@ -0,0 +1,56 @@
+# maia_test_framework/providers/single_flight.py
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one upstream call.
+
+    The first caller for a key starts the call; callers arriving while it is
+    in flight wait for the same result. The upstream call is cancelled only
+    once every waiting caller has been cancelled.
+    """
+
+    def __init__(self):
+        # Tasks are bound to the event loop they were created in
+        self._in_flight = weakref.WeakKeyDictionary()
+        self.calls = 0
+        self.coalesced = 0
+
+    def _get_in_flight(self) -> Dict[str, list]:
+        loop = asyncio.get_running_loop()
+        in_flight = self._in_flight.get(loop)
+        if in_flight is None:
+            in_flight = {}
+            self._in_flight[loop] = in_flight
+        return in_flight
+
+    async def run(self, key: str, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Return the result of `func()` and whether it was shared with an earlier caller."""
+        in_flight = self._get_in_flight()
+        entry = in_flight.get(key)
+        shared = entry is not None
+        if shared:
+            self.coalesced += 1
+        else:
+            self.calls += 1
+            task = asyncio.ensure_future(func())
+            # [task, number of callers waiting on it]
+            entry = [task, 0]
+            in_flight[key] = entry
+            task.add_done_callback(lambda _: in_flight.pop(key, None) if in_flight.get(key) is entry else None)
+
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task), shared
+        except asyncio.CancelledError:
+            if not task.done() and entry[1] == 1:
+                task.cancel()
+            raise
+        finally:
+            entry[1] -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"calls": self.calls, "coalesced": self.coalesced}
@@ -17,6 +17,14 @@ def pytest_addoption(parser):
         "--maia-output-dir", action="store", default=None,
         help="Directory to save Maia test reports"
     )
+    parser.addoption(
+        "--maia-max-run-tokens", action="store", type=int, default=None,
+        help="Abort remaining provider calls once the run has used this many tokens"
+    )
+    parser.addoption(
+        "--maia-max-run-cost", action="store", type=float, default=None,
+        help="Abort remaining provider calls once the run has spent this much"
+    )
 
 def pytest_configure(config):
     """Setup run directory before tests start"""
@@ -31,6 +39,32 @@ def pytest_configure(config):
     timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
     _run_output_dir = os.path.join(base_output_dir, timestamp)
 
+    from maia_test_framework.core.usage import usage_tracker
+    usage_tracker.configure_run(
+        max_tokens=config.getoption("--maia-max-run-tokens"),
+        max_cost=config.getoption("--maia-max-run-cost"),
+    )
+
+@pytest.fixture(autouse=True)
+def maia_reset_circuit_breakers():
+    """Start every test with closed circuits, endpoint failures in one test must not fail the next."""
+    from maia_test_framework.providers.retry import circuit_breakers
+    circuit_breakers.reset()
+    yield
+    circuit_breakers.reset()
+
+@pytest.fixture
+def maia_stub_server():
+    """StubChatServer on a random local port, speaking the OpenAI and Ollama protocols.
+
+    Runs in a background thread. Point providers at `maia_stub_server.url` (OpenAI
+    clients at `.../v1`) and adjust `reply`, `rules`, `delay` or `failures` on the
+    yielded server as needed.
+    """
+    from maia_test_framework.testing.stub_server import StubChatServer
+    with StubChatServer() as server:
+        yield server
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Create test reports and attach them to items - keep this separate!"""
@@ -112,9 +146,24 @@ def pytest_runtest_call(item):
             pytest.fail(failure_message)
 
 
+def _collect_providers(test_instance):
+    """Unique providers used by the test's agents, orchestrators and judges."""
+    agents = list(test_instance.agents.values())
+    for s in test_instance.sessions:
+        agents.extend(a for a in (s.orchestration_agent, s.judge_agent) if a)
+
+    providers = {}
+    for agent in agents:
+        providers.setdefault(id(agent.provider), agent.provider)
+    return list(providers.values())
+
 def pytest_runtest_teardown(item):
     """Called after test teardown. Save test results here."""
     from maia_test_framework.testing.base import MaiaTest, TestResult, Participant
+    from maia_test_framework.utils.network import service_registry
+
+    # Readiness probes keep a pooled client per event loop, close it while the test's loop is still open
+    service_registry.close_clients()
 
     if not hasattr(item, 'instance') or not isinstance(item.instance, MaiaTest):
         return
@@ -146,7 +195,8 @@ def pytest_runtest_teardown(item):
                     agent = test_instance.agents[participant_id]
                     all_participants[participant_id] = Participant(id=participant_id, name=participant_id, type="agent", metadata={"model": agent.provider.__class__.__name__})
                 elif participant_id in test_instance.tools:
-                    all_participants[participant_id] = Participant(id=participant_id, name=participant_id, type="tool")
+                    tool = test_instance.tools[participant_id]
+                    all_participants[participant_id] = Participant(id=participant_id, name=participant_id, type="tool", metadata={"stats": tool.get_stats()})
 
         judge_result_data = None
         if hasattr(s, 'judge_result') and s.judge_result:
@@ -173,10 +223,19 @@ def pytest_runtest_teardown(item):
             "messages": history,
             "assertions": [{"id": ar.id, "assertion_name": ar.assertion_name, "description": ar.description, "status": ar.status, "metadata": ar.metadata} for ar in getattr(s, 'assertion_results', [])],
             "validators": [{"name": vr.name, "status": vr.status, "details": vr.details} for vr in getattr(s, 'validator_results', [])],
-            "judge_result": judge_result_data
+            "judge_result": judge_result_data,
+            "usage": s.get_usage().to_dict(),
+            "broadcasts": getattr(s, 'broadcast_stats', []),
+            "routing": getattr(s, 'routing_stats', []),
+            "router": s.orchestration_agent.get_routing_stats() if getattr(s, 'orchestration_agent', None) else {}
         })
     
     participants = list(all_participants.values())
+
+    provider_data = [
+        {"name": p.get_provider_name(), "class": p.__class__.__name__, "stats": p.get_stats()}
+        for p in _collect_providers(test_instance)
+    ]
     
     result = TestResult(
         test_name=test_instance.test_name,
@@ -184,13 +243,18 @@ def pytest_runtest_teardown(item):
         end_time=datetime.now().isoformat(),
         status=final_pytest_status,
         participants=participants,
-        sessions=session_data
+        sessions=session_data,
+        providers=provider_data,
+        usage=test_instance.usage_ledger.usage.to_dict()
     )
 
     if _run_output_dir:
         result.save(output_dir=_run_output_dir)
 
 def pytest_sessionfinish(session, exitstatus):
+    from maia_test_framework.utils.network import service_registry
+    service_registry.close_clients()
+
     report_path = session.config.getoption("--maia-report")
     if not report_path:
         return
@@ -218,9 +282,7 @@ def pytest_sessionfinish(session, exitstatus):
     with open(out_path, "w", encoding="utf-8") as f:
         json.dump(merged_results, f, indent=2)
 
-    # Write unified report
-    out_path = Path(report_path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(merged_results, f, indent=2)
+    # Run-wide figures go next to the report, which only lists test results
+    from maia_test_framework.core.usage import usage_tracker
+    with open(out_path.with_name(f"{out_path.stem}.run_summary.json"), "w", encoding="utf-8") as f:
+        json.dump({"usage": usage_tracker.run.usage.to_dict()}, f, indent=2)
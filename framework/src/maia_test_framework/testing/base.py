@@ -18,6 +18,8 @@ from maia_test_framework.testing.assertions.base import MaiaAssertion
 from maia_test_framework.core.exceptions import MaiaAssertionError
 from maia_test_framework.core.judge_agent import JudgeAgent
 from maia_test_framework.core.types.orchestration_policy import OrchestrationPolicy
+from maia_test_framework.core.types.broadcast_mode import BroadcastMode
+from maia_test_framework.core.usage import usage_tracker
 
 @dataclass
 class Participant:
@@ -48,6 +50,8 @@ class TestResult:
     status: Literal["passed", "failed"]
     participants: List[Participant]
     sessions: List[dict]
+    providers: List[dict] = field(default_factory=list)
+    usage: Dict[str, Any] = field(default_factory=dict)
 
     def save(self, output_dir):
         if not os.path.exists(output_dir):
@@ -58,11 +62,15 @@ class TestResult:
             json.dump(asdict(self), f, indent=2)
 
 class MaiaTest(ABC, ProviderMixin):
+    # Hard budgets for all provider calls made by a single test, None means unlimited
+    max_tokens_per_test: int | None = None
+    max_cost_per_test: float | None = None
 
     def setup_method(self, method):
         """Setup run before each test method"""
         self.test_name = method.__name__
         self.start_time = datetime.now().isoformat()
+        self.usage_ledger = usage_tracker.start_test(self.test_name, self.max_tokens_per_test, self.max_cost_per_test)
         self.agents: Dict[str, Agent] = {}
         self.sessions: List[Session] = []
         self.tools: Dict[str, BaseTool] = {}
@@ -73,6 +81,8 @@ class MaiaTest(ABC, ProviderMixin):
     def teardown_method(self, method):
         """Cleanup after each test method - validators are now handled by pytest plugin"""
         self.sessions.clear()
+        # Calls made after the test must not count against its budget
+        usage_tracker.end_test()
 
     def _execute_and_record_assertion(self, assertion: MaiaAssertion, assertion_name: str, metadata: Dict[str, Any], session: Session):
         assertion_id = f"assert_{len(session.assertion_results) + 1}"
@@ -124,14 +134,24 @@ class MaiaTest(ABC, ProviderMixin):
         """Override this method to define a common session for test suite"""
         pass
 
-    def create_agent(self, name, provider, system_message="", ignore_trigger_prompt="", tools: List[str] = None):
+    def create_agent(self, name, provider, system_message="", ignore_trigger_prompt="", tools: List[str] = None, max_tool_steps: int = 5, tool_timeout: float | None = None):
         agent_tools = [self.tools[tool_name] for tool_name in tools] if tools else []
-        agent = Agent(name, provider, system_message, ignore_trigger_prompt, tools=agent_tools)
+        agent = Agent(name, provider, system_message, ignore_trigger_prompt, tools=agent_tools, max_tool_steps=max_tool_steps, tool_timeout=tool_timeout)
         self.agents[name] = agent
         return agent
 
-    def create_tool(self, name: str, tool_class: BaseTool, *args, **kwargs) -> BaseTool:
+    def create_tool(self, name: str, tool_class: BaseTool, *args, cache: bool | Dict[str, Any] | None = None, tool_options: Dict[str, Any] | None = None, **kwargs) -> BaseTool:
+        """Create a tool shared by the test's agents.
+
+        `cache` enables the result cache, `tool_options` sets execution and history
+        options (timeout, max_concurrency, offload, max_history, history_path),
+        other arguments go to the tool class.
+        """
         tool = tool_class(name=name, *args, **kwargs)
+        if cache:
+            tool.enable_cache(cache if isinstance(cache, dict) else {})
+        if tool_options:
+            tool.configure(**tool_options)
         self.tools[name] = tool
         return tool
 
@@ -147,12 +167,12 @@ class MaiaTest(ABC, ProviderMixin):
             self._run_message_assertion(assertion_object, message=response_msg, session_id=session_id)
         return wrapper
 
-    def create_session(self, agent_names: List[str] = None, assertions: List[Callable[[Message], None]] = None, session_id: str = None, orchestration_agent: Agent = None, orchestration_policy: OrchestrationPolicy = None, validators: List[Callable[[Session], None]] = None, judge_agent: JudgeAgent = None) -> Session:
+    def create_session(self, agent_names: List[str] = None, assertions: List[Callable[[Message], None]] = None, session_id: str = None, orchestration_agent: Agent = None, orchestration_policy: OrchestrationPolicy = None, validators: List[Callable[[Session], None]] = None, judge_agent: JudgeAgent = None, broadcast_mode: BroadcastMode = BroadcastMode.SEQUENTIAL, speculative_agents: int = 0) -> Session:
         """Create a new session with specified agents"""
         bus = CommunicationBus()
 
         wrapped_assertions = []
-        session = Session(bus, wrapped_assertions, session_id, orchestration_agent, orchestration_policy, validators, judge_agent=judge_agent)
+        session = Session(bus, wrapped_assertions, session_id, orchestration_agent, orchestration_policy, validators, judge_agent=judge_agent, broadcast_mode=broadcast_mode, speculative_agents=speculative_agents)
 
         if assertions:
             for original_assertion in assertions:
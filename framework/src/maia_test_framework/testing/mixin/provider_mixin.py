@@ -1,10 +1,15 @@
+import os
 from maia_test_framework.testing.maia_config import MaiaConfig
 from maia_test_framework.providers.ollama import OllamaProvider
 from maia_test_framework.providers.generic_lite_llm import GenericLiteLLMProvider
+from maia_test_framework.providers.pooled_lite_llm import PooledLiteLLMProvider
+from maia_test_framework.providers.cassette import CassetteProvider
+from maia_test_framework.core.usage import usage_tracker
 
 PROVIDER_CLASSES = {
     "OllamaProvider": OllamaProvider,
     "GenericLiteLLMProvider": GenericLiteLLMProvider,
+    "PooledLiteLLMProvider": PooledLiteLLMProvider,
 }
 
 class ProviderMixin:
@@ -17,6 +22,10 @@ class ProviderMixin:
         config = MaiaConfig.get_instance()
         raw_providers = config.get_section("providers", {})
 
+        # Token prices per model, per 1000 tokens: {model: {prompt: x, completion: y}}
+        for model, prices in config.get_section("pricing", {}).items():
+            usage_tracker.price_table.register(model, **prices)
+
         providers = {}
         for name, entry in raw_providers.items():
             cls_name = entry.get("class")
@@ -24,7 +33,15 @@ class ProviderMixin:
             if not provider_cls:
                 raise ValueError(f"Unknown provider class '{cls_name}' for provider '{name}'")
 
-            providers[name] = provider_cls(config=entry.get("config", {}))
+            provider = provider_cls(config=entry.get("config", {}))
+
+            cassette = entry.get("cassette")
+            if cassette:
+                # MAIA_CASSETTE_MODE lets CI switch between record and replay without editing the config
+                mode = os.getenv("MAIA_CASSETTE_MODE", cassette.get("mode", "replay"))
+                provider = CassetteProvider(config={**cassette, "mode": mode, "provider": provider})
+
+            providers[name] = provider
 
         self._provider_registry = providers
         return providers
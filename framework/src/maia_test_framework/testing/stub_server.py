@@ -0,0 +1,326 @@
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from maia_test_framework.providers.mock import LatencyDistribution
+
+Reply = Union[str, Dict[str, Any]]
+Replies = Union[Reply, Sequence[Reply], Callable[[List[Dict[str, Any]]], Reply]]
+
+STATUS_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class StubChatServer:
+    """Local chat server speaking the OpenAI and Ollama protocols, for offline end-to-end tests.
+
+    Serves POST .../chat/completions (OpenAI, SSE streaming), POST /api/chat and
+    POST /api/generate (Ollama, NDJSON streaming) plus a minimal /api/show, and
+    answers any GET with 200 so readiness probes succeed. Word counts stand in for token counts.
+
+    Replies are chosen per request: the first matching `rules` entry (regex searched
+    in the last message, reply) wins, otherwise `reply` is used. `reply` may be a
+    string, a list served in order (the last one repeats) or a callable receiving
+    the request messages. A reply given as a dict {"content": ..., "tool_calls":
+    [{"name": ..., "arguments": {...}}]} answers non-streamed requests with native
+    tool calls.
+
+    Run it on the test's event loop with `async with`, or on its own loop in a
+    background thread with a plain `with` block. The thread mode is required for
+    clients that make blocking HTTP calls from the event loop (LiteLLM's Ollama
+    integration looks up model info synchronously) and keeps server work out of
+    client-side timings.
+
+    Latency: `delay` seconds before the first byte, or a sample of `latency`
+    (a LatencyDistribution config, seeded by `seed`), then `chunk_delay` between
+    streamed chunks. `failures` lists HTTP status codes returned, in order, by the
+    next chat requests. Chat request bodies are kept in `requests`.
+    """
+
+    def __init__(
+        self,
+        reply: Replies = "stub reply",
+        rules: Optional[List[Tuple[str, Reply]]] = None,
+        delay: float = 0.0,
+        chunk_delay: float = 0.0,
+        latency: Optional[Dict[str, Any]] = None,
+        seed: Optional[int] = None,
+        failures: Optional[List[int]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.reply = reply
+        self.rules = [(re.compile(pattern), rule_reply) for pattern, rule_reply in (rules or [])]
+        self.delay = delay
+        self.chunk_delay = chunk_delay
+        self.latency = LatencyDistribution(latency, random.Random(seed)) if latency else None
+        self.failures = list(failures or [])
+        self.host = host
+        self.port: Optional[int] = port
+        self.request_counts: Counter = Counter()
+        self.requests: List[Dict[str, Any]] = []
+        self._reply_index = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers = set()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> "StubChatServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            # Idle keep-alive connections would otherwise outlive the server
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    def start_in_thread(self) -> "StubChatServer":
+        """Serve from a background thread running its own event loop."""
+        self._thread_loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._thread_loop.run_forever, name="maia-stub-server", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.start(), self._thread_loop).result()
+        return self
+
+    def stop_thread(self):
+        if self._thread_loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), self._thread_loop).result()
+        self._thread_loop.call_soon_threadsafe(self._thread_loop.stop)
+        self._thread.join()
+        self._thread_loop.close()
+        self._thread_loop = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start_in_thread()
+
+    def __exit__(self, *exc_info):
+        self.stop_thread()
+
+    def _next_reply(self, messages: List[Dict[str, Any]]) -> Reply:
+        last_message = str(messages[-1].get("content", "")) if messages else ""
+        for pattern, rule_reply in self.rules:
+            if pattern.search(last_message):
+                return rule_reply
+        if callable(self.reply):
+            return self.reply(messages)
+        if isinstance(self.reply, (str, dict)):
+            return self.reply
+        reply = self.reply[min(self._reply_index, len(self.reply) - 1)]
+        self._reply_index += 1
+        return reply
+
+    async def _wait_first_byte(self):
+        await asyncio.sleep(self.latency.sample() if self.latency else self.delay)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._writers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, value = line.decode().split(":", 1)
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                self.request_counts[(method, path)] += 1
+                await self._respond(writer, method, path, json.loads(body or b"{}") if method == "POST" else {})
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, method: str, path: str, request: Dict[str, Any]):
+        if method == "GET":
+            return await self._write_json(writer, 200, {"status": "ok"})
+        if path == "/api/show":
+            return await self._write_json(writer, 200, {"details": {}, "model_info": {}, "template": ""})
+
+        if path.endswith("/chat/completions"):
+            protocol = "openai"
+        elif path in ("/api/chat", "/api/generate"):
+            protocol = "ollama"
+        else:
+            return await self._write_json(writer, 404, {"error": "not found"})
+
+        self.requests.append(request)
+        if self.failures:
+            status_code = self.failures.pop(0)
+            message = f"stub failure {status_code} {STATUS_REASONS.get(status_code, 'Error')}"
+            return await self._write_json(writer, status_code, {"error": {"message": message, "type": "stub_error", "code": status_code}})
+
+        messages = request.get("messages") or [{"role": "user", "content": request.get("prompt", "")}]
+        reply = self._next_reply(messages)
+        if isinstance(reply, dict):
+            reply, tool_calls = reply.get("content", ""), reply.get("tool_calls", [])
+        else:
+            tool_calls = []
+        usage = self._usage(messages, reply)
+
+        if protocol == "openai":
+            if request.get("stream"):
+                return await self._write_stream(writer, "text/event-stream", self._openai_events(request, reply, usage))
+            await self._wait_first_byte()
+            return await self._write_json(writer, 200, self._openai_completion(request, reply, usage, tool_calls))
+
+        # Ollama streams unless told otherwise
+        if request.get("stream", True):
+            return await self._write_stream(writer, "application/x-ndjson", self._ollama_events(request, path, reply, usage))
+        await self._wait_first_byte()
+        return await self._write_json(writer, 200, self._ollama_message(request, path, reply, usage, done=True, tool_calls=tool_calls))
+
+    @staticmethod
+    def _usage(messages: List[Dict[str, Any]], reply: str) -> Dict[str, int]:
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in messages)
+        completion_tokens = len(reply.split())
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    @staticmethod
+    def _words(reply: str) -> List[str]:
+        words = reply.split(" ")
+        return [word if i == 0 else f" {word}" for i, word in enumerate(words)]
+
+    def _openai_completion(self, request: Dict[str, Any], reply: str, usage: Dict[str, int], tool_calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+        message = {"role": "assistant", "content": reply or None}
+        if tool_calls:
+            message["tool_calls"] = [
+                {
+                    "id": f"call_{i}",
+                    "type": "function",
+                    "function": {"name": call["name"], "arguments": json.dumps(call.get("arguments", {}))},
+                }
+                for i, call in enumerate(tool_calls)
+            ]
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if tool_calls else "stop",
+            }],
+            "usage": usage,
+        }
+
+    async def _openai_events(self, request: Dict[str, Any], reply: str, usage: Dict[str, int]) -> AsyncIterator[bytes]:
+        words = self._words(reply)
+        for i, word in enumerate(words):
+            event = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": request.get("model", "stub"),
+                "choices": [{
+                    "index": 0,
+                    "delta": {"content": word},
+                    "finish_reason": "stop" if i == len(words) - 1 else None,
+                }],
+            }
+            yield f"data: {json.dumps(event)}\n\n".encode()
+        if request.get("stream_options", {}).get("include_usage"):
+            event = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": request.get("model", "stub"),
+                "choices": [],
+                "usage": usage,
+            }
+            yield f"data: {json.dumps(event)}\n\n".encode()
+        yield b"data: [DONE]\n\n"
+
+    @staticmethod
+    def _ollama_message(request: Dict[str, Any], path: str, content: str, usage: Dict[str, int], done: bool, tool_calls: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        message = {
+            "model": request.get("model", "stub"),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "done": done,
+        }
+        if path == "/api/chat":
+            message["message"] = {"role": "assistant", "content": content}
+            if tool_calls:
+                message["message"]["tool_calls"] = [
+                    {"function": {"name": call["name"], "arguments": call.get("arguments", {})}} for call in tool_calls
+                ]
+        else:
+            message["response"] = content
+        if done:
+            message.update({
+                "done_reason": "stop",
+                "prompt_eval_count": usage["prompt_tokens"],
+                "eval_count": usage["completion_tokens"],
+            })
+        return message
+
+    async def _ollama_events(self, request: Dict[str, Any], path: str, reply: str, usage: Dict[str, int]) -> AsyncIterator[bytes]:
+        for word in self._words(reply):
+            yield json.dumps(self._ollama_message(request, path, word, usage, done=False)).encode() + b"\n"
+        yield json.dumps(self._ollama_message(request, path, "", usage, done=True)).encode() + b"\n"
+
+    async def _write_json(self, writer: asyncio.StreamWriter, status_code: int, payload: Dict[str, Any]):
+        data = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status_code} {STATUS_REASONS.get(status_code, 'Error')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+        )
+        await writer.drain()
+
+    async def _write_stream(self, writer: asyncio.StreamWriter, content_type: str, events: AsyncIterator[bytes]):
+        """Send events using chunked transfer encoding, pausing between them."""
+        writer.write(
+            f"HTTP/1.1 200 OK\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Transfer-Encoding: chunked\r\n\r\n".encode()
+        )
+        await self._wait_first_byte()
+        first = True
+        async for event in events:
+            if not first:
+                await asyncio.sleep(self.chunk_delay)
+            first = False
+            writer.write(f"{len(event):x}\r\n".encode() + event + b"\r\n")
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
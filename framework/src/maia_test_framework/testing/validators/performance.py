@@ -2,20 +2,22 @@ from typing import Callable
 from maia_test_framework.core.session import Session
 from datetime import timedelta
 
+def _to_timedelta(threshold: int, unit: str) -> timedelta:
+    if unit == "milliseconds":
+        return timedelta(milliseconds=threshold)
+    elif unit == "seconds":
+        return timedelta(seconds=threshold)
+    elif unit == "minutes":
+        return timedelta(minutes=threshold)
+    raise ValueError("unit must be one of 'milliseconds', 'seconds', or 'minutes'")
+
 def performance_validator(threshold: int, unit: str = "seconds") -> Callable[[Session], None]:
     """
     Returns a validator that asserts that the latency between user and agent messages is below a threshold.
     """
     def latency_validator(session: Session):
         """Asserts that the latency between user and agent messages is below a threshold."""
-        if unit == "milliseconds":
-            delta = timedelta(milliseconds=threshold)
-        elif unit == "seconds":
-            delta = timedelta(seconds=threshold)
-        elif unit == "minutes":
-            delta = timedelta(minutes=threshold)
-        else:
-            raise ValueError("unit must be one of 'milliseconds', 'seconds', or 'minutes'")
+        delta = _to_timedelta(threshold, unit)
 
         messages = session.message_history
         for i in range(1, len(messages)):
@@ -25,3 +27,34 @@ def performance_validator(threshold: int, unit: str = "seconds") -> Callable[[Se
                     raise AssertionError(f"Latency of {latency} between user and agent {messages[i].sender} exceeded the threshold of {delta}.")
 
     return latency_validator
+
+
+def time_to_first_token_validator(threshold: int, unit: str = "milliseconds") -> Callable[[Session], None]:
+    """
+    Returns a validator that asserts that the time to first token of every streamed agent turn is below a threshold.
+    Only turns generated by providers configured with `stream: True` are checked.
+    """
+    def ttft_validator(session: Session):
+        """Asserts that the time to first token of streamed agent turns is below a threshold."""
+        delta = _to_timedelta(threshold, unit)
+        for message in session.message_history:
+            ttft = message.metadata.get("streaming", {}).get("time_to_first_token")
+            if ttft is not None and timedelta(seconds=ttft) > delta:
+                raise AssertionError(f"Time to first token of {timedelta(seconds=ttft)} for agent {message.sender} exceeded the threshold of {delta}.")
+
+    return ttft_validator
+
+
+def tool_latency_validator(threshold: int, unit: str = "milliseconds") -> Callable[[Session], None]:
+    """
+    Returns a validator that asserts that every tool call made during the session took less than a threshold.
+    """
+    def tool_validator(session: Session):
+        """Asserts that the duration of tool calls is below a threshold."""
+        delta = _to_timedelta(threshold, unit)
+        for message in session.message_history:
+            duration = message.metadata.get("duration")
+            if message.sender_type == "tool" and duration is not None and timedelta(seconds=duration) > delta:
+                raise AssertionError(f"Call to tool {message.sender} took {timedelta(seconds=duration)}, exceeding the threshold of {delta}.")
+
+    return tool_validator
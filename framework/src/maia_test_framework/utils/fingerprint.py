@@ -0,0 +1,35 @@
+import hashlib
+import json
+from typing import Any, Dict, List
+
+from maia_test_framework.core.message import Message
+
+TOOL_METADATA_KEYS = ("tool_calls", "tool_call_id")
+
+
+def serialize_history(history: List[Message]) -> List[Dict[str, Any]]:
+    """Stable representation of the message fields that shape a provider request.
+
+    Timestamps, ids and metadata are left out so identical conversations hash equally,
+    except for native tool call details, which are part of the request.
+    """
+    serialized = []
+    for message in history:
+        entry = {
+            "sender": message.sender,
+            "sender_type": message.sender_type,
+            "receiver": message.receiver,
+            "receiver_type": message.receiver_type,
+            "content": message.content,
+        }
+        for key in TOOL_METADATA_KEYS:
+            if key in message.metadata:
+                entry[key] = message.metadata[key]
+        serialized.append(entry)
+    return serialized
+
+
+def fingerprint(payload: Dict[str, Any]) -> str:
+    """Content hash of a JSON-like payload, independent of key order."""
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
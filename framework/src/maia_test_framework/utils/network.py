@@ -1,23 +1,105 @@
 import time
+import weakref
 import httpx
 import asyncio
+from typing import Dict
+from urllib.parse import urlsplit
 
 from maia_test_framework.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-async def wait_for_service(host: str, timeout=60):
-    """Waits for a service at the given host to be available."""
-    logger.info(f"Waiting for service at {host} to be available...")
-    start_time = time.time()
-    url = f"{host}/"
-    while time.time() - start_time < timeout:
-        try:
-            async with httpx.AsyncClient() as client:
+
+class ServiceReadinessRegistry:
+    """Process-wide cache of service availability keyed by host.
+
+    A host is probed once and then treated as healthy for `ttl` seconds.
+    Providers call `invalidate` when a request fails so the next call re-probes.
+    """
+
+    def __init__(self, ttl: float = 300.0, retry_interval: float = 1.0):
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self.probe_count = 0
+        self._healthy_until: Dict[str, float] = {}
+        # httpx clients and asyncio locks are bound to the loop they were created in
+        self._loop_state = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _host_key(host: str) -> str:
+        parts = urlsplit(host)
+        return parts.netloc or host
+
+    def _get_loop_state(self):
+        loop = asyncio.get_running_loop()
+        state = self._loop_state.get(loop)
+        if state is None:
+            state = {"client": httpx.AsyncClient(), "locks": {}}
+            self._loop_state[loop] = state
+        return state
+
+    def is_ready(self, host: str) -> bool:
+        return self._healthy_until.get(self._host_key(host), 0.0) > time.monotonic()
+
+    def mark_ready(self, host: str):
+        self._healthy_until[self._host_key(host)] = time.monotonic() + self.ttl
+
+    def invalidate(self, host: str):
+        """Forget cached health so the next wait re-probes the host."""
+        self._healthy_until.pop(self._host_key(host), None)
+
+    async def wait_until_ready(self, host: str, timeout: float = 60):
+        if self.is_ready(host):
+            return
+
+        state = self._get_loop_state()
+        lock = state["locks"].setdefault(self._host_key(host), asyncio.Lock())
+        async with lock:
+            # Another caller may have probed the host while we were waiting
+            if self.is_ready(host):
+                return
+            await self._probe(state["client"], host, timeout)
+
+    async def _probe(self, client: httpx.AsyncClient, host: str, timeout: float):
+        logger.info(f"Waiting for service at {host} to be available...")
+        start_time = time.time()
+        url = f"{host}/"
+        while time.time() - start_time < timeout:
+            self.probe_count += 1
+            try:
                 response = await client.get(url)
                 if response.status_code == 200:
                     logger.info(f"Service at {host} is available.")
+                    self.mark_ready(host)
                     return
-        except httpx.ConnectError:
-            await asyncio.sleep(1)
-    raise TimeoutError(f"Service at {host} not available after {timeout} seconds.")
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(self.retry_interval)
+        raise TimeoutError(f"Service at {host} not available after {timeout} seconds.")
+
+    def close_clients(self):
+        """Close the pooled clients of event loops that are not running.
+
+        Called by the pytest plugin after each test, before the test's event loop
+        is closed. Clients of loops already closed can only be dropped.
+        """
+        for loop, state in list(self._loop_state.items()):
+            if loop.is_running():
+                continue
+            self._loop_state.pop(loop, None)
+            if not loop.is_closed():
+                loop.run_until_complete(state["client"].aclose())
+
+    async def aclose(self):
+        """Close the pooled client of the running event loop."""
+        state = self._loop_state.pop(asyncio.get_running_loop(), None)
+        if state:
+            await state["client"].aclose()
+
+
+service_registry = ServiceReadinessRegistry()
+
+
+async def wait_for_service(host: str, timeout=60):
+    """Waits for a service at the given host to be available."""
+    await service_registry.wait_until_ready(host, timeout)
@@ -0,0 +1,102 @@
+import asyncio
+import time
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.providers.generic_lite_llm import GenericLiteLLMProvider
+from maia_test_framework.testing.stub_server import StubChatServer
+
+STUB_DELAY = 0.5
+CONCURRENT_SESSIONS = 5
+
+
+class TestAsyncGeneration(MaiaTest):
+    """LiteLLM calls must not block the event loop while waiting on the network."""
+
+    @pytest.fixture(autouse=True)
+    def stub_api_key(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-stub")
+
+    def create_stub_agent(self, name: str, server: StubChatServer, **config):
+        return self.create_agent(
+            name=name,
+            provider=GenericLiteLLMProvider(config={
+                "model": "openai/stub",
+                "api_base": f"{server.url}/v1",
+                **config,
+            }),
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_generations_overlap(self):
+        async with StubChatServer(reply="pong", delay=STUB_DELAY) as server:
+            for i in range(CONCURRENT_SESSIONS):
+                self.create_stub_agent(f"Agent{i}", server)
+            sessions = [self.create_session([f"Agent{i}"]) for i in range(CONCURRENT_SESSIONS)]
+
+            # Warm up LiteLLM so one-off import/setup cost is not measured
+            await sessions[0].user_says("warm up")
+            await sessions[0].agent_responds("Agent0")
+
+            async def converse(i, session):
+                await session.user_says("ping")
+                return await session.agent_responds(f"Agent{i}")
+
+            start = time.perf_counter()
+            responses = await asyncio.gather(*(converse(i, s) for i, s in enumerate(sessions)))
+            elapsed = time.perf_counter() - start
+
+        assert [r.content for r in responses] == ["pong"] * CONCURRENT_SESSIONS
+        # Serial execution would take CONCURRENT_SESSIONS * STUB_DELAY
+        assert elapsed < STUB_DELAY * 2, f"{CONCURRENT_SESSIONS} generations took {elapsed:.2f}s"
+
+    @pytest.mark.asyncio
+    async def test_generation_timeout(self):
+        async with StubChatServer(delay=STUB_DELAY) as server:
+            self.create_stub_agent("Slow", server, timeout=0.1)
+            session = self.create_session(["Slow"])
+            await session.user_says("ping")
+            response = await session.agent_responds("Slow")
+
+        assert response.content == ""
+        assert "Timed out" in response.raw_response["error"]
+
+    @pytest.mark.asyncio
+    async def test_cancellation_propagates_from_agent_responds(self):
+        async with StubChatServer(delay=5) as server:
+            self.create_stub_agent("Slow", server)
+            session = self.create_session(["Slow"])
+            await session.user_says("ping")
+
+            task = asyncio.create_task(session.agent_responds("Slow"))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            start = time.perf_counter()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert time.perf_counter() - start < 1
+            assert len(session.message_history) == 1
+
+    @pytest.mark.asyncio
+    async def test_service_probed_once_per_host(self):
+        async with StubChatServer(reply="pong") as server:
+            self.create_stub_agent("Alice", server)
+            self.create_stub_agent("Bob", server)
+            session = self.create_session(["Alice", "Bob"])
+            for _ in range(3):
+                await session.user_says("ping")
+                await session.agent_responds("Alice")
+                await session.agent_responds("Bob")
+
+        assert server.request_counts[("GET", "/v1/")] == 1
+        assert server.request_counts[("POST", "/v1/chat/completions")] == 6
+
+    @pytest.mark.asyncio
+    async def test_service_reprobed_after_failure(self):
+        async with StubChatServer(delay=STUB_DELAY) as server:
+            self.create_stub_agent("Slow", server, timeout=0.1)
+            session = self.create_session(["Slow"])
+            for _ in range(2):
+                await session.user_says("ping")
+                await session.agent_responds("Slow")
+
+        assert server.request_counts[("GET", "/v1/")] == 2
@@ -0,0 +1,77 @@
+import time
+
+import pytest
+from maia_test_framework.core.message import IGNORE_MESSAGE
+from maia_test_framework.core.types.broadcast_mode import BroadcastMode
+from maia_test_framework.core.types.orchestration_policy import OrchestrationPolicy
+from maia_test_framework.providers.mock import MockProvider
+from maia_test_framework.testing.base import MaiaTest
+
+
+def delayed(reply: str, seconds: float) -> MockProvider:
+    return MockProvider(config={
+        "response_function": lambda prompt: reply,
+        "latency": {"distribution": "fixed", "value": seconds},
+    })
+
+
+class TestBroadcastModes(MaiaTest):
+
+    def setup_agents(self):
+        self.create_agent(name="Slow", provider=delayed("Slow answer", 0.4))
+        self.create_agent(name="Ignorer", provider=delayed(IGNORE_MESSAGE, 0.05))
+        self.create_agent(name="Fast", provider=delayed("Fast answer", 0.15))
+
+    def broadcast_session(self, mode: BroadcastMode):
+        return self.create_session(orchestration_policy=OrchestrationPolicy.IGNORE_MESSAGE, broadcast_mode=mode)
+
+    @pytest.mark.asyncio
+    async def test_sequential_records_latencies(self):
+        session = self.broadcast_session(BroadcastMode.SEQUENTIAL)
+        response, responder = await session.user_says_and_broadcast("Hello")
+
+        assert responder == "Slow"
+        stats = session.broadcast_stats[-1]
+        assert stats["winners"] == ["Slow"]
+        assert list(stats["latencies"]) == ["Slow"]
+
+    @pytest.mark.asyncio
+    async def test_first_response_wins(self):
+        """The first answer that is not ignored wins, slower agents are cancelled."""
+        session = self.broadcast_session(BroadcastMode.FIRST_RESPONSE)
+        start = time.perf_counter()
+        response, responder = await session.user_says_and_broadcast("Hello")
+
+        assert time.perf_counter() - start < 0.35
+        assert (response.content, responder) == ("Fast answer", "Fast")
+        stats = session.broadcast_stats[-1]
+        assert stats["latencies"]["Slow"] is None
+        assert stats["latencies"]["Ignorer"] < stats["latencies"]["Fast"]
+        assert [m.sender for m in session.message_history] == ["user", "Fast"]
+
+    @pytest.mark.asyncio
+    async def test_registration_order_wins(self):
+        """Same winner as a sequential broadcast, in the time of the slowest agent needed."""
+        session = self.broadcast_session(BroadcastMode.REGISTRATION_ORDER)
+        start = time.perf_counter()
+        response, responder = await session.user_says_and_broadcast("Hello")
+
+        assert time.perf_counter() - start < 0.55
+        assert responder == "Slow"
+        assert response.metadata["broadcast_latency"] >= 0.4
+
+    @pytest.mark.asyncio
+    async def test_collect_all(self):
+        """Every answer that is not ignored joins the conversation in registration order."""
+        session = self.broadcast_session(BroadcastMode.COLLECT_ALL)
+        response, responder = await session.user_says_and_broadcast("Hello")
+
+        assert responder == "Slow"
+        assert [m.sender for m in session.message_history] == ["user", "Slow", "Fast"]
+        assert session.broadcast_stats[-1]["winners"] == ["Slow", "Fast"]
+
+    @pytest.mark.asyncio
+    async def test_mode_override_per_call(self):
+        session = self.broadcast_session(BroadcastMode.SEQUENTIAL)
+        _, responder = await session.user_says_and_broadcast("Hello", mode=BroadcastMode.FIRST_RESPONSE)
+        assert responder == "Fast"
@@ -0,0 +1,76 @@
+import json
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.core.exceptions import CassetteMissError
+from maia_test_framework.providers.cassette import CassetteProvider
+from maia_test_framework.providers.mock import MockProvider
+
+
+class CountingEcho:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, prompt: str) -> str:
+        self.calls += 1
+        return f"Echo #{self.calls}: {prompt}"
+
+
+class TestCassetteProvider(MaiaTest):
+
+    def create_cassette_agent(self, name, path, mode, echo, strict=False):
+        return self.create_agent(
+            name=name,
+            provider=CassetteProvider(config={
+                "provider": MockProvider(config={"response_function": echo}),
+                "path": str(path),
+                "mode": mode,
+                "strict": strict,
+            }),
+            system_message="You echo things.",
+        )
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay(self, tmp_path):
+        path = tmp_path / "cassette.jsonl"
+        recorder = CountingEcho()
+        self.create_cassette_agent("Recorder", path, "record", recorder)
+        session = self.create_session(["Recorder"])
+        await session.user_says("Hello")
+        recorded = await session.agent_responds("Recorder")
+        assert recorder.calls == 1
+
+        replayer = CountingEcho()
+        self.create_cassette_agent("Replayer", path, "replay", replayer, strict=True)
+        # Sender names are part of the request, so replay the same conversation shape
+        replay_session = self.create_session(["Replayer"])
+        await replay_session.user_says("Hello")
+        replayed = await replay_session.agent_responds("Replayer")
+
+        assert replayer.calls == 0
+        assert replayed.content == recorded.content
+        assert replayed.metadata["cassette"] == "replayed"
+
+    @pytest.mark.asyncio
+    async def test_strict_replay_miss_raises(self, tmp_path):
+        self.create_cassette_agent("Agent", tmp_path / "empty.jsonl", "replay", CountingEcho(), strict=True)
+        session = self.create_session(["Agent"])
+        await session.user_says("Never recorded")
+        with pytest.raises(CassetteMissError):
+            await session.agent_responds("Agent")
+
+    @pytest.mark.asyncio
+    async def test_replay_records_misses_and_appends(self, tmp_path):
+        path = tmp_path / "cassette.jsonl"
+        echo = CountingEcho()
+        self.create_cassette_agent("Agent", path, "replay", echo)
+        session = self.create_session(["Agent"])
+
+        await session.user_says("One")
+        await session.agent_responds("Agent")
+        await session.user_says("Two")
+        await session.agent_responds("Agent")
+        assert echo.calls == 2
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["request"]["history"][-1]["content"] == "Two"
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from maia_test_framework.providers.existing import ExistingAgentProvider
+from maia_test_framework.testing.base import MaiaTest
+
+
+class SlowSyncAgent:
+    """A blocking agent that records the thread it ran on."""
+    def __init__(self):
+        self.threads = []
+
+    def run(self, prompt: str) -> str:
+        self.threads.append(threading.current_thread().name)
+        time.sleep(0.2)
+        return f"Slow: {prompt}"
+
+
+class StreamingAgent:
+    """An agent that yields its answer word by word."""
+    async def run(self, prompt: str):
+        for word in ["Streamed", " answer", f" to {prompt}"]:
+            await asyncio.sleep(0.01)
+            yield word
+
+
+class HangingAgent:
+    async def run(self, prompt: str) -> str:
+        await asyncio.sleep(5)
+        return "too late"
+
+
+class TestExistingAgentOffload(MaiaTest):
+    """Tests for offloading, streaming and timeouts of existing agents."""
+
+    @pytest.mark.asyncio
+    async def test_sync_agent_does_not_block_the_loop(self):
+        """Two slow synchronous agents run side by side in the provider's pool."""
+        agent = SlowSyncAgent()
+        self.create_agent(
+            name="SlowAgent",
+            provider=ExistingAgentProvider(config={"agent_instance": agent, "executor": {"max_workers": 2}})
+        )
+        sessions = [self.create_session(["SlowAgent"]) for _ in range(2)]
+        for session in sessions:
+            await session.user_says("Hi")
+
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(session.agent_responds("SlowAgent") for session in sessions))
+        elapsed = time.perf_counter() - start
+
+        assert [r.content for r in responses] == ["Slow: Hi", "Slow: Hi"]
+        assert elapsed < 0.35
+        assert all(name.startswith("maia-Existing") for name in agent.threads)
+
+    @pytest.mark.asyncio
+    async def test_async_generator_agent_streams(self):
+        """An async generator agent is consumed as a stream."""
+        self.create_agent(
+            name="StreamingAgent",
+            provider=ExistingAgentProvider(config={"agent_instance": StreamingAgent(), "stream": True})
+        )
+        session = self.create_session(["StreamingAgent"])
+        await session.user_says("you")
+        response = await session.agent_responds("StreamingAgent")
+
+        assert response.content == "Streamed answer to you"
+        streaming = response.metadata["streaming"]
+        assert streaming["chunks"] == 3
+        assert streaming["time_to_first_token"] is not None
+
+    @pytest.mark.asyncio
+    async def test_async_generator_agent_without_streaming(self):
+        """Without streaming the chunks are joined into one response."""
+        self.create_agent(
+            name="StreamingAgent",
+            provider=ExistingAgentProvider(config={"agent_instance": StreamingAgent()})
+        )
+        session = self.create_session(["StreamingAgent"])
+        await session.user_says("you")
+        response = await session.agent_responds("StreamingAgent")
+
+        assert response.content == "Streamed answer to you"
+        assert response.raw_response == ["Streamed", " answer", " to you"]
+
+    @pytest.mark.asyncio
+    async def test_call_timeout(self):
+        """A call exceeding the timeout returns an error response."""
+        self.create_agent(
+            name="HangingAgent",
+            provider=ExistingAgentProvider(config={"agent_instance": HangingAgent(), "timeout": 0.1})
+        )
+        session = self.create_session(["HangingAgent"])
+        await session.user_says("Hello")
+
+        start = time.perf_counter()
+        response = await session.agent_responds("HangingAgent")
+
+        assert time.perf_counter() - start < 1
+        assert response.metadata["error"] is True
+        assert "timed out after 0.1 seconds" in response.metadata["error_message"]
+
+    @pytest.mark.asyncio
+    async def test_timed_out_sync_call_is_not_retried(self):
+        """Retrying would queue behind the abandoned call still holding the only worker."""
+        agent = SlowSyncAgent()
+        self.create_agent(
+            name="SlowAgent",
+            provider=ExistingAgentProvider(config={"agent_instance": agent, "timeout": 0.05, "executor": {"max_workers": 1}})
+        )
+        session = self.create_session(["SlowAgent"])
+        await session.user_says("Hi")
+
+        start = time.perf_counter()
+        response = await session.agent_responds("SlowAgent")
+
+        assert time.perf_counter() - start < 0.15
+        assert response.metadata["error"] is True
+        assert response.metadata["retries"] == 0
+        assert len(agent.threads) == 1
@@ -0,0 +1,69 @@
+import pytest
+from maia_test_framework.core.orchestration_agent import OrchestrationAgent
+from maia_test_framework.core.types.orchestration_policy import OrchestrationPolicy
+from maia_test_framework.providers.mock import MockProvider
+from maia_test_framework.testing.base import MaiaTest
+
+
+class TestFastRouting(MaiaTest):
+
+    def setup_agents(self):
+        self.create_agent(name="Weather", provider=MockProvider(config={"response_function": lambda p: "Sunny"}))
+        self.create_agent(name="Clothes", provider=MockProvider(config={"response_function": lambda p: "Wear a hat"}))
+        self.llm_prompts = []
+
+    def llm_route(self, prompt: str) -> str:
+        self.llm_prompts.append(prompt)
+        return "Weather" if "weather" in prompt.lower() else "Clothes"
+
+    def routed_session(self, routing):
+        self.orchestrator = OrchestrationAgent(provider=MockProvider(config={"response_function": self.llm_route}), routing=routing)
+        return self.create_session(orchestration_agent=self.orchestrator, orchestration_policy=OrchestrationPolicy.ORCHESTRATION_AGENT)
+
+    @pytest.mark.asyncio
+    async def test_cache_answers_repeated_messages(self):
+        session = self.routed_session({"cache": True})
+        for prompt in ("What's the weather?", "what's   the WEATHER", "What should I wear?"):
+            await session.user_says_and_broadcast(prompt)
+
+        assert self.llm_prompts == ["What's the weather?", "What should I wear?"]
+        stats = self.orchestrator.get_routing_stats()
+        assert (stats["cache"], stats["llm"]) == (1, 2)
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+    @pytest.mark.asyncio
+    async def test_keyword_rules(self):
+        session = self.routed_session({"rules": {"Clothes": [r"\b(wear|jacket)\b"], "Weather": [r"\b(rain|sunny)\b"]}})
+        _, responder = await session.user_says_and_broadcast("Do I need a jacket?")
+        assert responder == "Clothes"
+        # Matching both agents is ambiguous and goes to the LLM
+        _, responder = await session.user_says_and_broadcast("What do I wear when it is sunny, weather-wise?")
+        assert responder == "Weather"
+        assert len(self.llm_prompts) == 1
+
+    @pytest.mark.asyncio
+    async def test_classifier_learns_from_llm_decisions(self):
+        session = self.routed_session({"classifier": {"min_examples": 4, "threshold": 0.2}})
+        for prompt in ("Weather in London today", "Weather forecast for Paris", "Should I wear a coat", "What shoes should I wear to dinner"):
+            await session.user_says_and_broadcast(prompt)
+        assert len(self.llm_prompts) == 4
+
+        _, responder = await session.user_says_and_broadcast("Weather for Rome")
+        assert responder == "Weather"
+        _, responder = await session.user_says_and_broadcast("Should I wear boots")
+        assert responder == "Clothes"
+        assert len(self.llm_prompts) == 4
+        assert session.message_history[-1].sender == "Clothes"
+
+        # Nothing in common with past messages, not confident enough
+        await session.user_says_and_broadcast("Tell me a joke")
+        assert self.llm_prompts[-1] == "Tell me a joke"
+        assert self.orchestrator.get_routing_stats()["classifier"] == 2
+
+    @pytest.mark.asyncio
+    async def test_without_routing_config_every_decision_uses_the_llm(self):
+        session = self.routed_session(None)
+        for _ in range(2):
+            await session.user_says_and_broadcast("What's the weather?")
+        assert len(self.llm_prompts) == 2
+        assert self.orchestrator.get_routing_stats() == {}
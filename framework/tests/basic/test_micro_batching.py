@@ -0,0 +1,77 @@
+import asyncio
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.providers.batching import MicroBatcher
+
+
+class TestMicroBatching(MaiaTest):
+
+    @pytest.mark.asyncio
+    async def test_concurrent_items_share_a_batch(self):
+        calls = []
+
+        async def batch_func(items):
+            calls.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(batch_func, max_batch_size=16, max_wait=0.01)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+        assert results == [(i * 2, 5) for i in range(5)]
+        assert calls == [[0, 1, 2, 3, 4]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting(self):
+        sizes = []
+
+        async def batch_func(items):
+            sizes.append(len(items))
+            return items
+
+        batcher = MicroBatcher(batch_func, max_batch_size=3, max_wait=10)
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(6))), timeout=1)
+
+        assert [r for r, _ in results] == list(range(6))
+        assert sizes == [3, 3]
+        assert batcher.get_stats()["mean_batch_size"] == 3
+
+    @pytest.mark.asyncio
+    async def test_item_errors_stay_with_their_caller(self):
+        async def batch_func(items):
+            return [ValueError(f"bad {item}") if item == "bad" else item for item in items]
+
+        batcher = MicroBatcher(batch_func)
+        good, bad = await asyncio.gather(batcher.submit("good"), batcher.submit("bad"), return_exceptions=True)
+
+        assert good == ("good", 2)
+        assert isinstance(bad, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_reaches_every_caller(self):
+        async def batch_func(items):
+            raise ConnectionError("backend down")
+
+        batcher = MicroBatcher(batch_func)
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_releases_callers(self):
+        started = asyncio.Event()
+
+        async def batch_func(items):
+            started.set()
+            await asyncio.sleep(10)
+            return items
+
+        batcher = MicroBatcher(batch_func, max_batch_size=2, max_wait=10)
+        callers = [asyncio.ensure_future(batcher.submit(i)) for i in range(2)]
+        await started.wait()
+
+        (task,) = batcher._tasks
+        task.cancel()
+        results = await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), timeout=1)
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+        assert not batcher._tasks
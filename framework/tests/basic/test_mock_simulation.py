@@ -0,0 +1,100 @@
+import asyncio
+import random
+import statistics
+import time
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.providers.mock import LatencyDistribution, MockProvider
+
+
+def sample(config, count=2000, seed=1):
+    distribution = LatencyDistribution(config, random.Random(seed))
+    return [distribution.sample() for _ in range(count)]
+
+
+class TestMockSimulation(MaiaTest):
+
+    def test_fixed_latency(self):
+        assert set(sample({"distribution": "fixed", "value": 0.25}, count=10)) == {0.25}
+
+    def test_normal_latency_is_clamped(self):
+        samples = sample({"distribution": "normal", "mean": 0.1, "stddev": 0.1, "min": 0.0})
+        assert min(samples) >= 0.0
+        assert statistics.mean(samples) == pytest.approx(0.1, abs=0.02)
+
+    def test_lognormal_latency(self):
+        samples = sample({"distribution": "lognormal", "mu": -2.0, "sigma": 0.5, "max": 1.0})
+        assert statistics.median(samples) == pytest.approx(0.135, abs=0.02)
+        assert max(samples) <= 1.0
+
+    def test_histogram_latency_replays_bucket_weights(self):
+        samples = sample({"distribution": "histogram", "buckets": [[0.1, 3], [0.5, 1]]}, count=4000)
+        fast = sum(s <= 0.1 for s in samples) / len(samples)
+        assert fast == pytest.approx(0.75, abs=0.03)
+        assert all(0.0 <= s <= 0.5 for s in samples)
+
+    def test_seed_makes_samples_reproducible(self):
+        config = {"distribution": "lognormal", "mu": -2.0, "sigma": 0.5}
+        assert sample(config, count=20, seed=7) == sample(config, count=20, seed=7)
+        assert sample(config, count=20, seed=7) != sample(config, count=20, seed=8)
+
+    @pytest.mark.asyncio
+    async def test_latency_and_tokens_per_second(self):
+        provider = MockProvider(config={
+            "responses": ["one two three four five"],
+            "latency": {"distribution": "fixed", "value": 0.1},
+            "tokens_per_second": 50,
+            "stream": True,
+        })
+        self.create_agent(name="Agent", provider=provider)
+        session = self.create_session(["Agent"])
+        await session.user_says("hi")
+        response = await session.agent_responds("Agent")
+
+        assert response.content == "one two three four five"
+        assert response.time_to_first_token == pytest.approx(0.1, abs=0.05)
+        # Four more words at 50 tokens per second
+        assert response.processing_time == pytest.approx(0.18, abs=0.06)
+
+    @pytest.mark.asyncio
+    async def test_error_injection_rate_is_seeded(self):
+        async def error_count(seed):
+            provider = MockProvider(config={
+                "response_function": lambda prompt: "ok",
+                "error_rate": 0.3,
+                "seed": seed,
+            })
+            responses = [await provider.base_generate([]) for _ in range(200)]
+            return sum(bool(r.metadata.get("error")) for r in responses)
+
+        errors = await error_count(seed=3)
+        assert 40 <= errors <= 80
+        assert errors == await error_count(seed=3)
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_are_retried(self):
+        provider = MockProvider(config={
+            "response_function": lambda prompt: "ok",
+            "error_rate": 0.3,
+            "seed": 1,
+            "retry": {"max_attempts": 10, "initial_delay": 0, "jitter": False},
+        })
+        responses = [await provider.base_generate([]) for _ in range(20)]
+
+        assert all(r.content == "ok" for r in responses)
+        assert sum(r.metadata["retries"] for r in responses) > 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_injection(self):
+        provider = MockProvider(config={
+            "response_function": lambda prompt: "ok",
+            "timeout_rate": 1.0,
+            "timeout": 0.05,
+        })
+        start = time.perf_counter()
+        response = await provider.base_generate([])
+
+        # A single injected timeout, not one per retry attempt
+        assert 0.05 <= time.perf_counter() - start < 0.1
+        assert response.metadata["error"] is True
+        assert "timeout" in response.metadata["error_message"]
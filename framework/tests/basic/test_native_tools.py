@@ -0,0 +1,124 @@
+import asyncio
+import json
+
+import pytest
+from maia_test_framework.providers.generic_lite_llm import GenericLiteLLMProvider
+from maia_test_framework.testing.base import MaiaTest
+from tests.tools.weather_api import WeatherAPITool
+
+LONDON_WEATHER = {"location": "London", "temperature": 25, "condition": "sunny"}
+
+
+class TestNativeTools(MaiaTest):
+
+    @pytest.fixture(autouse=True)
+    def stub_api_key(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-stub")
+
+    def setup_tools(self):
+        self.create_tool(name="weather_api", tool_class=WeatherAPITool, mock_responses={"london": LONDON_WEATHER})
+
+    def create_weather_agent(self, server, native_tools, **config):
+        self.create_agent(
+            name="Alice",
+            provider=GenericLiteLLMProvider(config={
+                "model": "openai/stub",
+                "api_base": f"{server.url}/v1",
+                "native_tools": native_tools,
+                **config,
+            }),
+            system_message="You are a weather assistant.",
+            tools=["weather_api"],
+        )
+
+    async def ask(self, prompt="What's the weather in London?"):
+        session = self.create_session(["Alice"])
+        await session.user_says(prompt)
+        return session, await session.agent_responds("Alice")
+
+    @pytest.mark.asyncio
+    async def test_native_tool_call(self, maia_stub_server):
+        maia_stub_server.reply = [
+            {"tool_calls": [{"name": "weather_api", "arguments": {"location": "London"}}]},
+            "It is sunny in London.",
+        ]
+        self.create_weather_agent(maia_stub_server, native_tools=True)
+
+        session, response = await self.ask()
+
+        assert response.content == "It is sunny in London."
+        assert self.get_tool("weather_api").get_last_call()["parameters"] == {"location": "London"}
+
+        first_request, follow_up_request = maia_stub_server.requests
+        # Schemas go to the tools parameter, not the system prompt
+        assert first_request["tools"][0]["function"]["name"] == "weather_api"
+        assert "tool_call" not in first_request["messages"][0]["content"]
+
+        assistant_message, tool_message = follow_up_request["messages"][-2:]
+        assert assistant_message["tool_calls"][0]["id"] == "call_0"
+        assert tool_message == {"role": "tool", "tool_call_id": "call_0", "content": json.dumps({"tool_output": LONDON_WEATHER})}
+        assert response.metadata["usage"]["total_tokens"] > 0
+        assert session.message_history[1].metadata["tool_calls"][0]["name"] == "weather_api"
+
+    @pytest.mark.asyncio
+    async def test_several_tool_calls_in_one_turn(self, maia_stub_server):
+        maia_stub_server.reply = [
+            {"tool_calls": [
+                {"name": "weather_api", "arguments": {"location": "London"}},
+                {"name": "weather_api", "arguments": {"location": "Paris"}},
+            ]},
+            "Sunny in both.",
+        ]
+        self.create_weather_agent(maia_stub_server, native_tools=True)
+
+        _, response = await self.ask("London or Paris?")
+
+        assert response.content == "Sunny in both."
+        assert self.get_tool("weather_api").get_call_count() == 2
+        tool_messages = [m for m in maia_stub_server.requests[1]["messages"] if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["call_0", "call_1"]
+
+    @pytest.mark.asyncio
+    async def test_prompt_protocol_fallback(self, maia_stub_server):
+        maia_stub_server.reply = [
+            json.dumps({"tool_call": {"name": "weather_api", "parameters": {"location": "London"}}}),
+            "It is sunny in London.",
+        ]
+        self.create_weather_agent(maia_stub_server, native_tools=False)
+
+        _, response = await self.ask()
+
+        assert response.content == "It is sunny in London."
+        assert self.get_tool("weather_api").get_call_count() == 1
+        first_request = maia_stub_server.requests[0]
+        assert "tools" not in first_request
+        assert '"tool_call"' in first_request["messages"][0]["content"]
+
+    @staticmethod
+    def weather_reply(messages):
+        if messages[-1]["role"] == "tool":
+            return "It is sunny in London."
+        return {"tool_calls": [{"name": "weather_api", "arguments": {"location": "London"}}]}
+
+    @pytest.mark.asyncio
+    async def test_cached_tool_call_responses_stay_intact(self, maia_stub_server):
+        maia_stub_server.reply = self.weather_reply
+        self.create_weather_agent(maia_stub_server, native_tools=True, temperature=0, cache=True)
+
+        _, first = await self.ask()
+        _, second = await self.ask()
+
+        assert first.content == second.content == "It is sunny in London."
+        assert len(maia_stub_server.requests) == 2
+        assert "tool_calls" not in second.metadata
+
+    @pytest.mark.asyncio
+    async def test_coalesced_tool_call_responses_stay_intact(self, maia_stub_server):
+        maia_stub_server.reply = self.weather_reply
+        maia_stub_server.delay = 0.1
+        self.create_weather_agent(maia_stub_server, native_tools=True, temperature=0, single_flight=True)
+
+        results = await asyncio.gather(*(self.ask() for _ in range(3)))
+
+        assert [response.content for _, response in results] == ["It is sunny in London."] * 3
+        assert len(maia_stub_server.requests) == 2
@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.providers.pool import EndpointPool
+from maia_test_framework.providers.pooled_lite_llm import PooledLiteLLMProvider
+from maia_test_framework.testing.stub_server import StubChatServer
+
+COMPLETIONS = ("POST", "/v1/chat/completions")
+
+
+class TestPooledProvider(MaiaTest):
+
+    @pytest.fixture(autouse=True)
+    def stub_api_key(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-stub")
+
+    def create_pooled_provider(self, servers, **config):
+        return PooledLiteLLMProvider(config={
+            "model": "openai/stub",
+            "endpoints": [f"{server.url}/v1" for server in servers],
+            "retry": False,
+            **config,
+        })
+
+    async def ask_concurrently(self, provider, count):
+        for i in range(count):
+            self.create_agent(name=f"Agent{i}", provider=provider)
+        sessions = [self.create_session([f"Agent{i}"]) for i in range(count)]
+
+        async def ask(i, session):
+            await session.user_says("hello")
+            return await session.agent_responds(f"Agent{i}")
+
+        return await asyncio.gather(*(ask(i, s) for i, s in enumerate(sessions)))
+
+    @pytest.mark.asyncio
+    async def test_least_outstanding_spreads_concurrent_calls(self):
+        async with StubChatServer(reply="a", delay=0.2) as first, StubChatServer(reply="b", delay=0.2) as second:
+            provider = self.create_pooled_provider([first, second])
+            responses = await self.ask_concurrently(provider, 6)
+
+        assert first.request_counts[COMPLETIONS] == 3
+        assert second.request_counts[COMPLETIONS] == 3
+        assert sorted(r.content for r in responses) == ["a"] * 3 + ["b"] * 3
+        assert {r.metadata["endpoint"] for r in responses} == {f"{first.url}/v1", f"{second.url}/v1"}
+
+    @pytest.mark.asyncio
+    async def test_failing_endpoint_fails_over_and_is_ejected(self):
+        async with StubChatServer(reply="down", failures=[503] * 2) as broken, StubChatServer(reply="up") as healthy:
+            provider = self.create_pooled_provider([broken, healthy], max_failures=2, eject_time=0.2)
+
+            responses = [r for _ in range(4) for r in await self.ask_concurrently(provider, 1)]
+            assert all(r.content == "up" for r in responses)
+            assert broken.request_counts[COMPLETIONS] == 2
+            assert provider.get_stats()["endpoints"][f"{broken.url}/v1"]["ejected"] is True
+
+            # After the ejection period the endpoint gets traffic again
+            await asyncio.sleep(0.25)
+            await self.ask_concurrently(provider, 2)
+            assert broken.request_counts[COMPLETIONS] == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_eject(self):
+        async with StubChatServer(failures=[400]) as first, StubChatServer(failures=[400]) as second:
+            provider = self.create_pooled_provider([first, second], max_failures=1)
+            response = (await self.ask_concurrently(provider, 1))[0]
+
+        assert response.metadata["error"] is True
+        # The request was at fault, so it is neither failed over nor held against the endpoint
+        assert first.request_counts[COMPLETIONS] + second.request_counts[COMPLETIONS] == 1
+        assert not any(stats["ejected"] for stats in provider.get_stats()["endpoints"].values())
+
+    def test_ewma_prefers_faster_endpoint(self):
+        pool = EndpointPool(["slow", "fast"], routing="ewma")
+        for url, latency in (("slow", 1.0), ("fast", 0.1)):
+            endpoint = next(e for e in pool.endpoints if e.url == url)
+            endpoint.in_flight += 1
+            pool.release(endpoint, latency)
+
+        picks = [pool.acquire().url for _ in range(5)]
+        # Fast stays preferred until its queue outweighs the latency gap
+        assert picks == ["fast"] * 5
@@ -0,0 +1,75 @@
+import asyncio
+import os
+import threading
+import time
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.core.message import AgentResponse
+from maia_test_framework.providers.base import BaseProvider
+
+
+def blocking_work(delay):
+    time.sleep(delay)
+    return threading.current_thread().name
+
+
+class BlockingProvider(BaseProvider):
+    """Wraps a synchronous SDK call, like the CrewAI and LangChain providers."""
+
+    def get_provider_name(self) -> str:
+        return "Blocking"
+
+    async def generate(self, history, system_message=""):
+        metadata = {}
+        thread_name = await self.run_blocking(blocking_work, self.config.get("delay", 0.1), metadata=metadata)
+        return AgentResponse(content=thread_name, metadata=metadata)
+
+
+class TestProviderExecutor(MaiaTest):
+
+    async def ask_concurrently(self, provider, count):
+        for i in range(count):
+            self.create_agent(name=f"Agent{i}", provider=provider)
+        sessions = [self.create_session([f"Agent{i}"]) for i in range(count)]
+
+        async def ask(i, session):
+            await session.user_says("go")
+            return await session.agent_responds(f"Agent{i}")
+
+        return await asyncio.gather(*(ask(i, s) for i, s in enumerate(sessions)))
+
+    @pytest.mark.asyncio
+    async def test_calls_run_in_named_pool(self):
+        provider = BlockingProvider(config={"executor": {"max_workers": 2}})
+        responses = await self.ask_concurrently(provider, 2)
+
+        assert all(r.content.startswith("maia-Blocking") for r in responses)
+        assert provider.get_stats()["executor"]["calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_reported_separately(self):
+        provider = BlockingProvider(config={"delay": 0.1, "executor": {"max_workers": 1}})
+        responses = await self.ask_concurrently(provider, 3)
+
+        waits = sorted(r.metadata["executor_queue_wait"] for r in responses)
+        assert waits[0] < 0.05
+        assert waits[2] >= 0.15
+        assert provider.get_stats()["executor"]["max_queue_wait"] >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        provider = BlockingProvider(config={"delay": 0.3, "executor": {"max_workers": 1}})
+        task = asyncio.create_task(self.ask_concurrently(provider, 1))
+        start = time.perf_counter()
+        await asyncio.sleep(0.05)
+        assert time.perf_counter() - start < 0.2
+        await task
+
+    @pytest.mark.asyncio
+    async def test_process_mode(self):
+        provider = BlockingProvider(config={"executor": {"mode": "process", "max_workers": 1}})
+        try:
+            pid, _ = await provider.get_executor().run(os.getpid)
+        finally:
+            provider.get_executor().shutdown()
+        assert pid != os.getpid()
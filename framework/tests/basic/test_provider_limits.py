@@ -0,0 +1,116 @@
+import asyncio
+import time
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.core.message import AgentResponse
+from maia_test_framework.providers.base import BaseProvider
+
+
+class SlowProvider(BaseProvider):
+    """Sleeps like a remote model and reports a fixed token usage."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get_provider_name(self) -> str:
+        return "Slow"
+
+    async def generate(self, history, system_message=""):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.config.get("delay", 0.05))
+        self.in_flight -= 1
+        return AgentResponse(content="done", metadata={"usage": {"prompt_tokens": self.config.get("tokens", 100), "completion_tokens": 0}})
+
+
+class UnavailableError(Exception):
+    status_code = 503
+
+
+class FlakyProvider(SlowProvider):
+    """Fails with a 503 on the first attempt of every call."""
+
+    async def generate(self, history, system_message=""):
+        attempts = []
+
+        async def attempt():
+            attempts.append(time.perf_counter())
+            if len(attempts) == 1:
+                raise UnavailableError("Service unavailable")
+            return await SlowProvider.generate(self, history, system_message)
+
+        metadata = {}
+        response = await self.call_with_retry(attempt, metadata)
+        response.metadata.update(metadata, attempts=attempts)
+        return response
+
+
+class TestProviderLimits(MaiaTest):
+
+    async def run_concurrent_turns(self, provider, count):
+        for i in range(count):
+            self.create_agent(name=f"Agent{i}", provider=provider)
+        sessions = [self.create_session([f"Agent{i}"]) for i in range(count)]
+
+        async def turn(i, session):
+            await session.user_says("go")
+            return await session.agent_responds(f"Agent{i}")
+
+        return await asyncio.gather(*(turn(i, s) for i, s in enumerate(sessions)))
+
+    @pytest.mark.asyncio
+    async def test_max_in_flight_shared_across_agents(self):
+        provider = SlowProvider(config={"limits": {"max_in_flight": 2}})
+        responses = await self.run_concurrent_turns(provider, 6)
+
+        assert provider.max_in_flight == 2
+        waits = sorted(r.metadata["limiter_wait_time"] for r in responses)
+        assert waits[0] < 0.01 and waits[-1] >= 0.09
+        # Provider latency excludes the time spent queueing in the limiter
+        assert all(r.processing_time < 0.09 for r in responses)
+        assert provider.get_stats()["limiter"]["requests"] == 6
+
+    @pytest.mark.asyncio
+    async def test_requests_per_second(self):
+        provider = SlowProvider(config={"delay": 0, "limits": {"requests_per_second": 20}})
+        start = time.perf_counter()
+        await self.run_concurrent_turns(provider, 5)
+        # One request goes straight through, the other four are spaced 50ms apart
+        assert time.perf_counter() - start >= 0.19
+
+    @pytest.mark.asyncio
+    async def test_tokens_per_minute(self):
+        provider = SlowProvider(config={"delay": 0, "tokens": 6100, "limits": {"tokens_per_minute": 6000}})
+        self.create_agent(name="Agent", provider=provider)
+        session = self.create_session(["Agent"])
+
+        await session.user_says("go")
+        first = await session.agent_responds("Agent")
+        await session.user_says("again")
+        # The first call overdrew the bucket by 100 tokens, refilled at 100 tokens/s
+        second = await session.agent_responds("Agent")
+
+        assert first.metadata["limiter_wait_time"] < 0.01
+        assert second.metadata["limiter_wait_time"] >= 0.9
+
+    @pytest.mark.asyncio
+    async def test_retries_take_their_own_request_token(self):
+        provider = FlakyProvider(config={
+            "delay": 0,
+            "limits": {"requests_per_second": 10},
+            "retry": {"initial_delay": 0, "jitter": False},
+        })
+        self.create_agent(name="Agent", provider=provider)
+        session = self.create_session(["Agent"])
+
+        await session.user_says("go")
+        response = await session.agent_responds("Agent")
+
+        first, retry = response.metadata["attempts"]
+        assert response.metadata["retries"] == 1
+        assert retry - first >= 0.09
+        assert response.metadata["limiter_wait_time"] >= 0.09
+        # The retry's wait for a request token is not provider latency
+        assert response.processing_time < 0.05
@@ -0,0 +1,192 @@
+import asyncio
+import socket
+import time
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.providers.existing import ExistingAgentProvider
+from maia_test_framework.providers.generic_lite_llm import GenericLiteLLMProvider
+from maia_test_framework.providers.retry import RetryPolicy, is_retryable
+from maia_test_framework.testing.stub_server import StubChatServer
+from maia_test_framework.utils.network import service_registry
+
+FAST_RETRY = {"max_attempts": 3, "initial_delay": 0.01, "jitter": False}
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FlakyAgent:
+    """Raises the queued errors one call at a time, then answers."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def run(self, prompt):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return f"answer to {prompt}"
+
+
+class TestProviderRetry(MaiaTest):
+
+    @pytest.fixture(autouse=True)
+    def stub_api_key(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-stub")
+
+    async def ask(self, provider, name="Agent"):
+        self.create_agent(name=name, provider=provider)
+        session = self.create_session([name])
+        await session.user_says("hello")
+        return await session.agent_responds(name)
+
+    def test_retry_classification(self):
+        assert is_retryable(asyncio.TimeoutError())
+        assert is_retryable(ConnectionResetError())
+        assert is_retryable(StatusError(503))
+        assert is_retryable(StatusError(429))
+        assert not is_retryable(StatusError(400))
+        assert not is_retryable(StatusError(404))
+        assert not is_retryable(ValueError("bad input"))
+
+    def test_backoff_grows_and_is_capped(self):
+        policy = RetryPolicy(initial_delay=1, multiplier=2, max_delay=5, jitter=False)
+        assert [policy.get_delay(n) for n in range(1, 5)] == [1, 2, 4, 5]
+        jittered = RetryPolicy(initial_delay=1, multiplier=2, max_delay=5)
+        assert all(0 <= jittered.get_delay(3) <= 4 for _ in range(20))
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self):
+        agent = FlakyAgent([asyncio.TimeoutError(), StatusError(503)])
+        response = await self.ask(ExistingAgentProvider(config={"agent_instance": agent, "retry": FAST_RETRY}))
+
+        assert response.content == "answer to hello"
+        assert response.metadata["retries"] == 2
+        assert agent.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        agent = FlakyAgent([StatusError(400)])
+        response = await self.ask(ExistingAgentProvider(config={"agent_instance": agent, "retry": FAST_RETRY}))
+
+        assert response.metadata["error"] is True
+        assert response.metadata["retries"] == 0
+        assert agent.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_fails_fast(self):
+        agent = FlakyAgent([StatusError(503)] * 10)
+        provider = ExistingAgentProvider(config={
+            "agent_instance": agent,
+            "retry": FAST_RETRY,
+            "circuit_breaker": {"failure_threshold": 3, "reset_timeout": 60},
+        })
+
+        first = await self.ask(provider, "First")
+        assert first.metadata["error"] is True
+        assert agent.calls == 3
+
+        # The endpoint is known to be down, the second call never reaches it
+        second = await self.ask(provider, "Second")
+        assert "Circuit open" in second.metadata["error_message"]
+        assert agent.calls == 3
+        assert provider.get_circuit_breaker().get_stats()["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_circuits_are_per_provider_instance(self):
+        """Wrapped agents of the same class are separate backends."""
+        breaker = {"failure_threshold": 1, "reset_timeout": 60}
+        failing = ExistingAgentProvider(config={"agent_instance": FlakyAgent([StatusError(503)] * 3), "retry": False, "circuit_breaker": breaker})
+        healthy = ExistingAgentProvider(config={"agent_instance": FlakyAgent([]), "retry": False, "circuit_breaker": breaker})
+
+        await self.ask(failing, "Failing")
+        assert failing.get_circuit_breaker().state == "open"
+
+        response = await self.ask(healthy, "Healthy")
+        assert response.content == "answer to hello"
+
+    @pytest.mark.asyncio
+    async def test_half_open_trial_closes_circuit(self):
+        agent = FlakyAgent([StatusError(503)] * 2)
+        provider = ExistingAgentProvider(config={
+            "agent_instance": agent,
+            "retry": {"max_attempts": 2, "initial_delay": 0, "jitter": False},
+            "circuit_breaker": {"failure_threshold": 2, "reset_timeout": 0.05},
+        })
+
+        await self.ask(provider, "First")
+        assert provider.get_circuit_breaker().state == "open"
+
+        await asyncio.sleep(0.06)
+        response = await self.ask(provider, "Second")
+        assert response.content == "answer to hello"
+        assert provider.get_circuit_breaker().state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_half_open_trial_lets_the_next_call_through(self):
+        agent = FlakyAgent([StatusError(503)] * 2)
+        provider = ExistingAgentProvider(config={
+            "agent_instance": agent,
+            "retry": False,
+            "circuit_breaker": {"failure_threshold": 2, "reset_timeout": 0.05},
+        })
+        await self.ask(provider, "First")
+        await self.ask(provider, "Second")
+        assert provider.get_circuit_breaker().state == "open"
+        await asyncio.sleep(0.06)
+
+        async def hang(prompt):
+            await asyncio.sleep(10)
+        agent.run = hang
+        trial = asyncio.ensure_future(self.ask(provider, "Trial"))
+        await asyncio.sleep(0.02)
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        del agent.run
+        response = await self.ask(provider, "Third")
+        assert response.content == "answer to hello"
+        assert provider.get_circuit_breaker().state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_litellm_retries_server_errors(self):
+        async with StubChatServer(reply="pong", failures=[503, 429]) as server:
+            provider = GenericLiteLLMProvider(config={
+                "model": "openai/stub",
+                "api_base": f"{server.url}/v1",
+                "retry": FAST_RETRY,
+            })
+            response = await self.ask(provider)
+
+        assert response.content == "pong"
+        assert response.metadata["retries"] == 2
+        assert provider.get_stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_readiness_probe(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        provider = GenericLiteLLMProvider(config={
+            "model": "openai/stub",
+            "api_base": f"http://127.0.0.1:{port}/v1",
+            "ready_timeout": 0.2,
+            "retry": False,
+            "circuit_breaker": {"failure_threshold": 1, "reset_timeout": 60},
+        })
+
+        first = await self.ask(provider, "First")
+        assert "not available" in first.metadata["error_message"]
+        assert provider.get_circuit_breaker(provider.api_base).state == "open"
+
+        probes = service_registry.probe_count
+        start = time.perf_counter()
+        second = await self.ask(provider, "Second")
+        assert time.perf_counter() - start < 0.1
+        assert "Circuit open" in second.metadata["error_message"]
+        assert service_registry.probe_count == probes
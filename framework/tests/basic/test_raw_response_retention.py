@@ -0,0 +1,104 @@
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.core.message import AgentResponse
+from maia_test_framework.providers.base import BaseProvider
+from maia_test_framework.providers.generic_lite_llm import GenericLiteLLMProvider
+from maia_test_framework.providers.raw_response import LazyRawResponse, load_raw_response
+from maia_test_framework.testing.stub_server import StubChatServer
+
+
+class NativeResponse:
+    """Stands in for an SDK response object that is costly to serialize."""
+
+    def __init__(self, size):
+        self.text = "x" * size
+
+
+class NativeProvider(BaseProvider):
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.serializations = 0
+
+    def get_provider_name(self) -> str:
+        return "Native"
+
+    def serialize_raw_response(self, raw_response):
+        self.serializations += 1
+        return {"text": raw_response.text}
+
+    async def generate(self, history, system_message=""):
+        return AgentResponse(
+            content="ok",
+            metadata={"finish_reason": "stop", "usage": {"prompt_tokens": 3, "completion_tokens": 1}},
+            raw_response=NativeResponse(self.config.get("size", 10)),
+        )
+
+
+class TestRawResponseRetention(MaiaTest):
+
+    async def ask(self, provider):
+        self.create_agent(name="Agent", provider=provider)
+        session = self.create_session(["Agent"])
+        await session.user_says("hello")
+        return await session.agent_responds("Agent")
+
+    @pytest.mark.asyncio
+    async def test_full_is_the_default(self):
+        response = await self.ask(NativeProvider(config={}))
+        assert response.raw_response == {"text": "x" * 10}
+
+    @pytest.mark.asyncio
+    async def test_none_drops_raw_response(self):
+        provider = NativeProvider(config={"raw_response": "none"})
+        response = await self.ask(provider)
+        assert response.raw_response is None
+        assert provider.serializations == 0
+
+    @pytest.mark.asyncio
+    async def test_summary_keeps_usage_and_finish_reason(self):
+        response = await self.ask(NativeProvider(config={"raw_response": "summary"}))
+        assert response.raw_response == {
+            "finish_reason": "stop",
+            "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4, "cost": 0.0},
+        }
+
+    @pytest.mark.asyncio
+    async def test_lazy_serializes_on_first_access(self):
+        provider = NativeProvider(config={"raw_response": "lazy"})
+        response = await self.ask(provider)
+
+        assert isinstance(response.raw_response, LazyRawResponse)
+        assert provider.serializations == 0
+        assert response.raw_response.get() == {"text": "x" * 10}
+        assert response.raw_response.get() == {"text": "x" * 10}
+        assert provider.serializations == 1
+
+    @pytest.mark.asyncio
+    async def test_large_payloads_spill_to_sidecar(self, tmp_path):
+        sidecar = tmp_path / "raw.jsonl.gz"
+        provider = NativeProvider(config={
+            "size": 5000,
+            "raw_response_spill": {"path": str(sidecar), "min_bytes": 1000},
+        })
+        spilled = await self.ask(provider)
+        provider.config["size"] = 10
+        kept = await self.ask(provider)
+
+        assert spilled.raw_response["spilled_to"] == str(sidecar)
+        assert spilled.raw_response["length"] < 1000
+        assert load_raw_response(spilled.raw_response) == {"text": "x" * 5000}
+        assert kept.raw_response == {"text": "x" * 10}
+
+    @pytest.mark.asyncio
+    async def test_litellm_keeps_model_response_lazily(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-stub")
+        async with StubChatServer(reply="pong") as server:
+            response = await self.ask(GenericLiteLLMProvider(config={
+                "model": "openai/stub",
+                "api_base": f"{server.url}/v1",
+                "raw_response": "lazy",
+            }))
+
+        assert response.metadata["finish_reason"] == "stop"
+        assert '"content":"pong"' in response.raw_response.get()
@@ -0,0 +1,82 @@
+import asyncio
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.providers.mock import MockProvider
+
+
+class CountingEcho:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, prompt: str) -> str:
+        self.calls += 1
+        return f"Echo: {prompt}"
+
+
+class TestResponseCache(MaiaTest):
+
+    def create_cached_agent(self, name, echo, **config):
+        return self.create_agent(
+            name=name,
+            provider=MockProvider(config={"response_function": echo, **config}),
+        )
+
+    async def ask_twice(self, agent_name, prompt="Hello"):
+        responses = []
+        for _ in range(2):
+            session = self.create_session([agent_name])
+            await session.user_says(prompt)
+            responses.append(await session.agent_responds(agent_name))
+        return responses
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_hit(self):
+        echo = CountingEcho()
+        agent = self.create_cached_agent("Alice", echo, temperature=0, cache={"max_entries": 8})
+
+        first, second = await self.ask_twice("Alice")
+
+        assert echo.calls == 1
+        assert second.content == first.content
+        assert second.metadata["cache"] == "hit"
+        stats = agent.provider.get_stats()["cache"]
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_provider_instances(self, tmp_path):
+        cache_config = {"path": str(tmp_path / "responses.sqlite")}
+        first_echo, second_echo = CountingEcho(), CountingEcho()
+        self.create_cached_agent("First", first_echo, seed=7, cache=cache_config)
+        self.create_cached_agent("Second", second_echo, seed=7, cache=cache_config)
+
+        for name in ("First", "Second"):
+            session = self.create_session([name])
+            await session.user_says("Hello")
+            await session.agent_responds(name)
+
+        assert first_echo.calls == 1
+        assert second_echo.calls == 0
+        assert self.agents["Second"].provider.get_stats()["cache"]["disk_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_entries_expire(self):
+        echo = CountingEcho()
+        self.create_cached_agent("Alice", echo, deterministic=True, cache={"ttl": 0.05})
+
+        session = self.create_session(["Alice"])
+        await session.user_says("Hello")
+        await session.agent_responds("Alice")
+        await asyncio.sleep(0.1)
+        await self.ask_twice("Alice")
+
+        assert echo.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_requires_deterministic_sampling(self):
+        echo = CountingEcho()
+        agent = self.create_cached_agent("Alice", echo, temperature=0.7, cache={"max_entries": 8})
+
+        await self.ask_twice("Alice")
+
+        assert agent.provider.response_cache is None
+        assert echo.calls == 2
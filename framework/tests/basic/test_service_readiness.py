@@ -0,0 +1,29 @@
+import asyncio
+
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.testing.stub_server import StubChatServer
+from maia_test_framework.utils.network import ServiceReadinessRegistry
+
+
+class TestServiceReadiness(MaiaTest):
+
+    def test_pooled_clients_are_closed_with_their_loop(self):
+        registry = ServiceReadinessRegistry(retry_interval=0.01)
+        loop = asyncio.new_event_loop()
+
+        async def probe():
+            async with StubChatServer() as server:
+                await registry.wait_until_ready(server.url, timeout=2)
+            return registry._get_loop_state()["client"]
+
+        try:
+            client = loop.run_until_complete(probe())
+            assert not client.is_closed
+
+            registry.close_clients()
+            assert client.is_closed
+            # A later probe on the same loop opens a new client
+            assert loop.run_until_complete(probe()) is not client
+            registry.close_clients()
+        finally:
+            loop.close()
@@ -0,0 +1,88 @@
+import asyncio
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.core.message import AgentResponse, Message
+from maia_test_framework.providers.base import BaseProvider
+
+
+class CountingProvider(BaseProvider):
+    """Answers after a short delay and counts upstream calls."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = 0
+
+    def get_provider_name(self) -> str:
+        return "Counting"
+
+    async def generate(self, history, system_message=""):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return AgentResponse(
+            content=f"echo {history[-1].content}",
+            metadata={"usage": {"prompt_tokens": 10, "completion_tokens": 5}},
+        )
+
+
+class TestSingleFlight(MaiaTest):
+
+    async def ask_concurrently(self, provider, prompts):
+        self.create_agent(name="Agent", provider=provider, system_message="Be brief.")
+        sessions = [self.create_session(["Agent"]) for _ in prompts]
+
+        async def ask(session, prompt):
+            await session.user_says(prompt)
+            return await session.agent_responds("Agent")
+
+        return await asyncio.gather(*(ask(s, p) for s, p in zip(sessions, prompts)))
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_call(self):
+        provider = CountingProvider(config={"single_flight": True, "deterministic": True})
+        responses = await self.ask_concurrently(provider, ["hello"] * 5)
+
+        assert provider.calls == 1
+        assert all(r.content == "echo hello" for r in responses)
+        coalesced = [r for r in responses if r.metadata.get("single_flight") == "coalesced"]
+        assert len(coalesced) == 4
+        # The shared call is paid for once
+        assert all("usage" not in r.metadata and r.metadata["saved_usage"]["total_tokens"] == 15 for r in coalesced)
+        assert provider.get_stats()["single_flight"] == {"calls": 1, "coalesced": 4}
+
+    @pytest.mark.asyncio
+    async def test_different_requests_are_not_coalesced(self):
+        provider = CountingProvider(config={"single_flight": True, "deterministic": True})
+        responses = await self.ask_concurrently(provider, ["hello", "world", "hello"])
+
+        assert provider.calls == 2
+        assert [r.content for r in responses] == ["echo hello", "echo world", "echo hello"]
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_are_not_coalesced(self):
+        provider = CountingProvider(config={"single_flight": True, "deterministic": True})
+        await self.ask_concurrently(provider, ["hello"])
+        await self.ask_concurrently(provider, ["hello"])
+
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_for_non_deterministic_sampling(self):
+        provider = CountingProvider(config={"single_flight": True, "temperature": 0.7})
+        await self.ask_concurrently(provider, ["hello"] * 3)
+
+        assert provider.single_flight is None
+        assert provider.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_caller_keeps_the_shared_call(self):
+        provider = CountingProvider(config={"single_flight": True, "deterministic": True})
+        history = [Message(content="hello", sender="user", sender_type="user")]
+
+        first = asyncio.create_task(provider.base_generate(history, "sys"))
+        second = asyncio.create_task(provider.base_generate(history, "sys"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        response = await second
+        assert response.content == "echo hello"
+        assert provider.calls == 1
@@ -0,0 +1,91 @@
+import time
+
+import pytest
+from maia_test_framework.core.orchestration_agent import OrchestrationAgent
+from maia_test_framework.core.types.orchestration_policy import OrchestrationPolicy
+from maia_test_framework.providers.mock import MockProvider
+from maia_test_framework.testing.base import MaiaTest
+
+USAGE = {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+
+
+class UsageMockProvider(MockProvider):
+    """MockProvider reporting a fixed token usage per call."""
+
+    async def generate(self, history: list, system_message: str = ""):
+        response = await super().generate(history, system_message)
+        response.metadata["usage"] = dict(USAGE)
+        return response
+
+
+def delayed(reply: str, seconds: float) -> MockProvider:
+    return UsageMockProvider(config={
+        "response_function": lambda prompt: reply,
+        "latency": {"distribution": "fixed", "value": seconds},
+    })
+
+
+def route(prompt: str) -> str:
+    return "Weather" if "weather" in prompt.lower() else "Clothes"
+
+
+class TestSpeculativeRouting(MaiaTest):
+
+    def setup_agents(self):
+        self.orchestrator = OrchestrationAgent(provider=MockProvider(config={
+            "response_function": route,
+            "latency": {"distribution": "fixed", "value": 0.2},
+        }))
+
+    def routed_session(self, weather_latency=0.2, clothes_latency=0.2, speculative_agents=1):
+        self.create_agent(name="Weather", provider=delayed("Sunny", weather_latency))
+        self.create_agent(name="Clothes", provider=delayed("Wear a hat", clothes_latency))
+        return self.create_session(
+            orchestration_agent=self.orchestrator,
+            orchestration_policy=OrchestrationPolicy.ORCHESTRATION_AGENT,
+            speculative_agents=speculative_agents,
+        )
+
+    @pytest.mark.asyncio
+    async def test_hit_overlaps_router_and_agent(self):
+        session = self.routed_session()
+        response, responder = await session.user_says_and_broadcast("What's the weather?")
+
+        assert (response.content, responder) == ("Sunny", "Weather")
+        stats = session.routing_stats[-1]
+        assert stats["hit"] is True
+        # Run one after the other, the router and the agent could not finish faster than both together
+        assert stats["wall_time"] < stats["router_time"] + response.processing_time
+        assert stats["wasted_usage"]["total_tokens"] == 0
+
+    @pytest.mark.asyncio
+    async def test_miss_reports_wasted_tokens(self):
+        """A speculative answer that was not routed to is discarded and its tokens reported."""
+        session = self.routed_session(weather_latency=0.05)
+        response, responder = await session.user_says_and_broadcast("What should I wear?")
+
+        assert (response.content, responder) == ("Wear a hat", "Clothes")
+        assert [m.sender for m in session.message_history] == ["user", "Clothes"]
+        stats = session.routing_stats[-1]
+        assert stats["speculated"] == ["Weather"]
+        assert stats["hit"] is False
+        assert stats["wasted_usage"]["total_tokens"] == 15
+
+    @pytest.mark.asyncio
+    async def test_slow_speculation_is_cancelled(self):
+        session = self.routed_session(weather_latency=2)
+        start = time.perf_counter()
+        _, responder = await session.user_says_and_broadcast("What should I wear?")
+
+        assert time.perf_counter() - start < 1
+        assert responder == "Clothes"
+        assert session.routing_stats[-1]["cancelled"] == ["Weather"]
+
+    @pytest.mark.asyncio
+    async def test_likelihood_follows_routing_history(self):
+        session = self.routed_session(weather_latency=0.05, clothes_latency=0.05)
+        for prompt in ("What should I wear?", "Shoes or boots?", "And now?"):
+            await session.user_says_and_broadcast(prompt)
+
+        assert self.orchestrator.routing_counts["Clothes"] == 3
+        assert [stats["hit"] for stats in session.routing_stats] == [False, True, True]
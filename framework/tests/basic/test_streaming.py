@@ -0,0 +1,69 @@
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.providers.generic_lite_llm import GenericLiteLLMProvider
+from maia_test_framework.providers.mock import MockProvider
+from maia_test_framework.testing.validators.performance import time_to_first_token_validator
+from maia_test_framework.testing.stub_server import StubChatServer
+
+
+class TestStreaming(MaiaTest):
+
+    def setup_agents(self):
+        self.create_agent(
+            name="Streamer",
+            provider=MockProvider(config={
+                "responses": ["one two three four"],
+                "stream": True,
+                "chunk_delay": 0.02,
+            }),
+        )
+
+    @pytest.mark.asyncio
+    async def test_mock_stream_chunks(self):
+        provider = MockProvider(config={"responses": ["Hello there, general Kenobi"]})
+        chunks = [chunk.content async for chunk in provider.stream_generate([])]
+        assert chunks == ["Hello ", "there, ", "general ", "Kenobi"]
+
+    @pytest.mark.asyncio
+    async def test_streamed_turn_records_latency_metrics(self):
+        session = self.create_session(["Streamer"])
+        await session.user_says("Count to four")
+        response = await session.agent_responds("Streamer")
+
+        assert response.content == "one two three four"
+        streaming = session.message_history[-1].metadata["streaming"]
+        assert streaming["chunks"] == 4
+        assert 0.01 < streaming["time_to_first_token"] < 0.5
+        assert streaming["inter_token_latency"] > 0.01
+        assert streaming["tokens_per_second"] > 0
+        assert response.time_to_first_token == streaming["time_to_first_token"]
+
+    @pytest.mark.asyncio
+    async def test_time_to_first_token_validator(self):
+        session = self.create_session(["Streamer"])
+        await session.user_says("Count to four")
+        await session.agent_responds("Streamer")
+
+        self.run_validator(time_to_first_token_validator(threshold=1, unit="seconds"), session)
+        with pytest.raises(AssertionError, match=r"Time to first token .* exceeded the threshold"):
+            self.run_validator(time_to_first_token_validator(threshold=1, unit="milliseconds"), session)
+
+    @pytest.mark.asyncio
+    async def test_litellm_stream(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-stub")
+        async with StubChatServer(reply="streamed from the stub", chunk_delay=0.02) as server:
+            self.create_agent(
+                name="LiteStreamer",
+                provider=GenericLiteLLMProvider(config={
+                    "model": "openai/stub",
+                    "api_base": f"{server.url}/v1",
+                    "stream": True,
+                }),
+            )
+            session = self.create_session(["LiteStreamer"])
+            await session.user_says("Stream please")
+            response = await session.agent_responds("LiteStreamer")
+
+        assert response.content == "streamed from the stub"
+        assert response.metadata["finish_reason"] == "stop"
+        assert response.metadata["streaming"]["chunks"] == 4
@@ -0,0 +1,66 @@
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.providers.generic_lite_llm import GenericLiteLLMProvider
+from maia_test_framework.providers.ollama import OllamaProvider
+from maia_test_framework.testing.stub_server import StubChatServer
+
+
+class TestStubServer(MaiaTest):
+
+    @pytest.fixture(autouse=True)
+    def stub_api_key(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-stub")
+
+    async def ask(self, provider, prompt="hello"):
+        self.create_agent(name="Agent", provider=provider)
+        session = self.create_session(["Agent"])
+        await session.user_says(prompt)
+        return await session.agent_responds("Agent")
+
+    @pytest.mark.asyncio
+    async def test_fixture_serves_openai_protocol(self, maia_stub_server):
+        maia_stub_server.reply = "pong"
+        response = await self.ask(GenericLiteLLMProvider(config={
+            "model": "openai/stub",
+            "api_base": f"{maia_stub_server.url}/v1",
+        }))
+
+        assert response.content == "pong"
+        assert response.metadata["usage"]["completion_tokens"] == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stream", [False, True])
+    async def test_ollama_protocol(self, maia_stub_server, stream):
+        maia_stub_server.reply = "hello from ollama"
+        response = await self.ask(OllamaProvider(config={
+            "model": "stub",
+            "host": maia_stub_server.url,
+            "stream": stream,
+        }))
+
+        assert response.content == "hello from ollama"
+        assert any(path.startswith("/api/") for _, path in maia_stub_server.request_counts)
+
+    @pytest.mark.asyncio
+    async def test_scripted_and_rule_based_replies(self):
+        server = StubChatServer(reply=["first", "second"], rules=[(r"(?i)weather", "sunny")])
+        async with server:
+            provider = GenericLiteLLMProvider(config={"model": "openai/stub", "api_base": f"{server.url}/v1"})
+            self.create_agent(name="Agent", provider=provider)
+            session = self.create_session(["Agent"])
+            replies = []
+            for prompt in ("hi", "What's the weather?", "and now?", "again"):
+                await session.user_says(prompt)
+                replies.append((await session.agent_responds("Agent")).content)
+
+        assert replies == ["first", "sunny", "second", "second"]
+
+    @pytest.mark.asyncio
+    async def test_latency_injection(self):
+        async with StubChatServer(latency={"distribution": "fixed", "value": 0.2}) as server:
+            response = await self.ask(GenericLiteLLMProvider(config={
+                "model": "openai/stub",
+                "api_base": f"{server.url}/v1",
+            }))
+
+        assert response.processing_time >= 0.2
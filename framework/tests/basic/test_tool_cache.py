@@ -0,0 +1,80 @@
+import json
+import time
+
+import pytest
+from maia_test_framework.providers.mock import MockProvider
+from maia_test_framework.testing.base import MaiaTest
+from tests.tools.weather_api import WeatherAPITool
+
+
+def weather_call(location: str) -> str:
+    return json.dumps({"tool_call": {"name": "weather_api", "parameters": {"location": location}}})
+
+
+class CountingWeatherTool(WeatherAPITool):
+    def __init__(self, name: str, **kwargs):
+        super().__init__(name, **kwargs)
+        self.executions = 0
+
+    async def _execute(self, location: str, **kwargs):
+        self.executions += 1
+        return await super()._execute(location, **kwargs)
+
+
+class TestToolCache(MaiaTest):
+
+    @pytest.mark.asyncio
+    async def test_repeated_calls_across_sessions_are_cached(self):
+        """The same parameters are answered from the cache in a later session."""
+        tool = self.create_tool(name="weather_api", tool_class=CountingWeatherTool, cache=True)
+        self.create_agent(
+            name="Alice",
+            provider=MockProvider(config={"responses": [weather_call("London"), "Sunny", weather_call("London"), "Still sunny"]}),
+            tools=["weather_api"],
+        )
+
+        for _ in range(2):
+            session = self.create_session(["Alice"])
+            await session.user_says("Weather in London?")
+            await session.agent_responds("Alice")
+
+        assert tool.executions == 1
+        assert tool.get_call_count() == 2
+        assert tool.get_call_count(include_cached=False) == 1
+        assert tool.get_last_call()["cached"] is True
+        assert tool.get_stats()["cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_parameter_order_does_not_matter(self):
+        tool = CountingWeatherTool("weather_api")
+        tool.enable_cache()
+        await tool.execute(location="Paris", units="metric")
+        await tool.execute(units="metric", location="Paris")
+        assert tool.executions == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        tool = CountingWeatherTool("weather_api")
+        tool.enable_cache({"max_entries": 2})
+        for location in ("Paris", "Rome", "Paris", "Oslo", "Paris", "Rome"):
+            await tool.execute(location=location)
+        # Rome was the least recently used when Oslo arrived
+        assert tool.executions == 4
+        assert len(tool.cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        tool = CountingWeatherTool("weather_api")
+        tool.enable_cache({"ttl": 0.05})
+        await tool.execute(location="Paris")
+        time.sleep(0.1)
+        await tool.execute(location="Paris")
+        assert tool.executions == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_opt_in(self):
+        tool = CountingWeatherTool("weather_api")
+        await tool.execute(location="Paris")
+        await tool.execute(location="Paris")
+        assert tool.executions == 2
+        assert tool.get_last_call()["cached"] is False
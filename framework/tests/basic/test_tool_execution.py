@@ -0,0 +1,109 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict
+
+import pytest
+from maia_test_framework.core.tools.base import BaseTool
+from maia_test_framework.providers.mock import MockProvider
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.testing.validators.performance import tool_latency_validator
+
+
+class SleepTool(BaseTool):
+    """Sleeps for the requested time, failing on negative values."""
+
+    def __init__(self, name: str):
+        super().__init__(name, "Sleep for a while")
+
+    async def _execute(self, seconds: float, **kwargs) -> Dict[str, Any]:
+        if seconds < 0:
+            raise ValueError("seconds must not be negative")
+        await asyncio.sleep(seconds)
+        return {"slept": seconds}
+
+    def get_schema(self) -> Dict[str, Any]:
+        return {"name": self.name, "description": self.description, "parameters": {"type": "object", "properties": {"seconds": {"type": "number"}}}}
+
+
+class BlockingSleepTool(SleepTool):
+    """Same as SleepTool, implemented with a blocking call."""
+
+    def _execute(self, seconds: float, **kwargs) -> Dict[str, Any]:
+        time.sleep(seconds)
+        return {"slept": seconds}
+
+
+class TestToolExecution(MaiaTest):
+
+    @pytest.mark.asyncio
+    async def test_call_is_timed(self):
+        tool = SleepTool("sleep")
+        await tool.execute(seconds=0.05)
+
+        call = tool.get_last_call()
+        assert call["outcome"] == "ok"
+        assert call["duration"] >= 0.05
+        assert call["started_at"] < call["ended_at"]
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        tool = SleepTool("sleep").configure(timeout=0.1)
+        start = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError, match="timed out after 0.1 seconds"):
+            await tool.execute(seconds=5)
+
+        assert time.perf_counter() - start < 1
+        assert tool.get_last_call()["outcome"] == "timeout"
+        assert tool.get_stats()["outcomes"]["timeout"] == 1
+
+    @pytest.mark.asyncio
+    async def test_error_outcome(self):
+        tool = SleepTool("sleep")
+        with pytest.raises(ValueError):
+            await tool.execute(seconds=-1)
+
+        call = tool.get_last_call()
+        assert call["outcome"] == "error"
+        assert "must not be negative" in call["error"]
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency(self):
+        tool = SleepTool("sleep").configure(max_concurrency=1)
+        start = time.perf_counter()
+        await asyncio.gather(*(tool.execute(seconds=0.1) for _ in range(3)))
+
+        assert time.perf_counter() - start >= 0.3
+        assert max(call["queue_wait"] for call in tool.call_history) >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_sync_tool_is_offloaded(self):
+        tool = BlockingSleepTool("sleep")
+        start = time.perf_counter()
+        await asyncio.gather(*(tool.execute(seconds=0.2) for _ in range(2)))
+
+        assert time.perf_counter() - start < 0.35
+        assert tool.get_call_count() == 2
+
+    @pytest.mark.asyncio
+    async def test_agent_reports_tool_timeout(self):
+        """A hanging tool does not hang the turn, its outcome and duration land in the bus."""
+        self.create_tool(name="sleep", tool_class=SleepTool, tool_options={"timeout": 0.1})
+        self.create_agent(
+            name="Agent",
+            provider=MockProvider(config={"responses": [
+                json.dumps({"tool_call": {"name": "sleep", "parameters": {"seconds": 5}}}),
+                "Gave up waiting",
+            ]}),
+            tools=["sleep"],
+        )
+        session = self.create_session(["Agent"])
+        await session.user_says("Take a nap")
+        response = await session.agent_responds("Agent")
+
+        assert response.content == "Gave up waiting"
+        tool_message = next(m for m in session.message_history if m.sender_type == "tool")
+        assert tool_message.metadata["outcome"] == "timeout"
+        with pytest.raises(AssertionError, match="Call to tool sleep took"):
+            tool_latency_validator(threshold=50)(session)
+        tool_latency_validator(threshold=1, unit="seconds")(session)
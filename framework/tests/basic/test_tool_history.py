@@ -0,0 +1,52 @@
+import pytest
+from maia_test_framework.core.tools.history import DistinctCounter
+from maia_test_framework.testing.base import MaiaTest
+from tests.tools.weather_api import WeatherAPITool
+
+
+class TestToolHistory(MaiaTest):
+
+    @pytest.mark.asyncio
+    async def test_bounded_history_keeps_counts(self):
+        """Only the last calls are kept while counters cover all of them."""
+        tool = self.create_tool(name="weather_api", tool_class=WeatherAPITool, mock_responses={"paris": {}}, tool_options={"max_history": 3})
+        for i in range(10):
+            await tool.execute(location=f"City {i % 4}")
+
+        assert len(tool.call_history) == 3
+        assert tool.get_call_count() == 10
+        assert tool.get_last_call()["parameters"] == {"location": "City 1"}
+
+        stats = tool.get_stats()
+        assert stats["calls"] == 10
+        assert stats["errors"] == 0
+        assert stats["distinct_parameters"] == 4
+        assert sum(count for _, count in stats["latency_histogram"]) == 10
+
+    @pytest.mark.asyncio
+    async def test_history_streamed_to_disk(self, tmp_path):
+        path = str(tmp_path / "tools" / "calls.jsonl")
+        tool = WeatherAPITool("weather_api", mock_responses={"paris": {"condition": "rain"}})
+        tool.configure(max_history=1, history_path=path)
+        for location in ("Paris", "Rome", "Oslo"):
+            await tool.execute(location=location)
+
+        logged = tool.history_log.read("weather_api")
+        assert [call["parameters"]["location"] for call in logged] == ["Paris", "Rome", "Oslo"]
+        assert logged[0]["result"] == {"condition": "rain"}
+        assert tool.get_stats()["history_path"] == path
+
+    @pytest.mark.asyncio
+    async def test_unbounded_by_default(self):
+        tool = WeatherAPITool("weather_api", mock_responses={"paris": {}})
+        for _ in range(5):
+            await tool.execute(location="Paris")
+
+        assert len(tool.call_history) == 5
+        assert tool.get_stats()["distinct_parameters"] == 1
+
+    def test_distinct_counter_estimate(self):
+        counter = DistinctCounter()
+        for i in range(20000):
+            counter.add(f"value-{i % 5000}")
+        assert abs(counter.count() - 5000) < 5000 * 0.1
@@ -0,0 +1,126 @@
+import asyncio
+import json
+from typing import Any, Dict
+
+import pytest
+from maia_test_framework.core.tools.base import BaseTool
+from maia_test_framework.providers.generic_lite_llm import GenericLiteLLMProvider
+from maia_test_framework.providers.mock import MockProvider
+from maia_test_framework.testing.base import MaiaTest
+
+
+class SlowLookupTool(BaseTool):
+    """Looks a key up after a fixed delay."""
+
+    def __init__(self, name: str, delay: float = 0.0):
+        super().__init__(name, "Look up a value by key")
+        self.delay = delay
+
+    async def _execute(self, key: str, **kwargs) -> Dict[str, Any]:
+        await asyncio.sleep(self.delay)
+        return {"key": key, "value": key.upper()}
+
+    def get_schema(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "parameters": {
+                "type": "object",
+                "properties": {"key": {"type": "string"}},
+                "required": ["key"],
+            },
+        }
+
+
+def prompt_tool_call(key: str) -> str:
+    return json.dumps({"tool_call": {"name": "lookup", "parameters": {"key": key}}})
+
+
+class TestToolLoop(MaiaTest):
+
+    @pytest.fixture(autouse=True)
+    def stub_api_key(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-stub")
+
+    async def ask(self, prompt="Look things up"):
+        session = self.create_session(["Agent"])
+        await session.user_says(prompt)
+        return session, await session.agent_responds("Agent")
+
+    @pytest.mark.asyncio
+    async def test_multi_step_tool_calls(self):
+        """Tool calls are run until the model answers, each step recorded in the bus."""
+        self.create_tool(name="lookup", tool_class=SlowLookupTool)
+        self.create_agent(
+            name="Agent",
+            provider=MockProvider(config={"responses": [prompt_tool_call("a"), prompt_tool_call("b"), "A and B"]}),
+            tools=["lookup"],
+        )
+
+        session, response = await self.ask()
+
+        assert response.content == "A and B"
+        assert response.metadata["tool_steps"] == 2
+        assert self.get_tool("lookup").get_call_count() == 2
+        tool_messages = [m for m in session.message_history if m.sender_type == "tool"]
+        assert [m.metadata["tool_step"] for m in tool_messages] == [1, 2]
+        assert all(m.metadata["duration"] >= 0 for m in tool_messages)
+
+    @pytest.mark.asyncio
+    async def test_max_tool_steps(self):
+        """Requests beyond max_tool_steps are left unanswered."""
+        self.create_tool(name="lookup", tool_class=SlowLookupTool)
+        self.create_agent(
+            name="Agent",
+            provider=MockProvider(config={"response_function": lambda prompt: prompt_tool_call("again")}),
+            tools=["lookup"],
+            max_tool_steps=2,
+        )
+
+        _, response = await self.ask()
+
+        assert response.metadata["tool_steps"] == 2
+        assert response.metadata["unanswered_tool_calls"] == [{"name": "lookup", "parameters": {"key": "again"}}]
+        assert self.get_tool("lookup").get_call_count() == 2
+
+    @pytest.mark.asyncio
+    async def test_tool_timeout(self):
+        """A tool exceeding tool_timeout reports an error to the model instead of hanging."""
+        self.create_tool(name="lookup", tool_class=SlowLookupTool, delay=5)
+        self.create_agent(
+            name="Agent",
+            provider=MockProvider(config={"responses": [prompt_tool_call("a"), "Lookup failed"]}),
+            tools=["lookup"],
+            tool_timeout=0.1,
+        )
+
+        session, response = await self.ask()
+
+        assert response.content == "Lookup failed"
+        tool_message = next(m for m in session.message_history if m.sender_type == "tool")
+        assert "timed out after 0.1 seconds" in json.loads(tool_message.content)["tool_output"]["error"]
+
+    @pytest.mark.asyncio
+    async def test_parallel_native_tool_calls(self, maia_stub_server):
+        """Tool calls requested in the same turn run concurrently."""
+        maia_stub_server.reply = [
+            {"tool_calls": [{"name": "lookup", "arguments": {"key": key}} for key in ("a", "b", "c")]},
+            "A, B and C",
+        ]
+        self.create_tool(name="lookup", tool_class=SlowLookupTool, delay=0.3)
+        self.create_agent(
+            name="Agent",
+            provider=GenericLiteLLMProvider(config={
+                "model": "openai/stub",
+                "api_base": f"{maia_stub_server.url}/v1",
+                "native_tools": True,
+            }),
+            tools=["lookup"],
+        )
+
+        session, response = await self.ask()
+
+        assert response.content == "A, B and C"
+        tool_messages = [m for m in session.message_history if m.sender_type == "tool"]
+        assert [m.metadata["tool_call_id"] for m in tool_messages] == ["call_0", "call_1", "call_2"]
+        assert tool_messages[0].metadata["step_duration"] < 0.6
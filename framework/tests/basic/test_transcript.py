@@ -0,0 +1,83 @@
+import time
+
+import pytest
+from maia_test_framework.core.message import Message
+from maia_test_framework.core.transcript import Transcript
+from maia_test_framework.providers.mock import MockProvider
+from maia_test_framework.testing.base import MaiaTest
+
+
+def reference_text(messages) -> str:
+    return "\n".join(f"{m.sender}: {m.content}" for m in messages)
+
+
+def make_history(n: int):
+    return [
+        Message(content=f"Message number {i} " + "lorem ipsum " * 10, sender="user" if i % 2 else "Agent", sender_type="user" if i % 2 else "agent")
+        for i in range(n)
+    ]
+
+
+class TestTranscript(MaiaTest):
+
+    def setup_agents(self):
+        self.create_agent(name="Echo", provider=MockProvider(config={"response_function": lambda p: "Echo: " + p.splitlines()[-1]}))
+
+    @pytest.mark.asyncio
+    async def test_session_text_follows_new_messages(self):
+        session = self.create_session(["Echo"])
+        await session.user_says("Hello")
+        assert session.get_conversation_text() == reference_text(session.message_history)
+
+        await session.agent_responds("Echo")
+        assert session.get_conversation_text() == reference_text(session.message_history)
+        assert session.get_conversation_text("tagged").splitlines() == ["[user] user: Hello", "[agent] Echo: Echo: Hello"]
+
+    def test_formats(self):
+        history = [Message(content="x" * 20, sender="user", sender_type="user")]
+        transcript = Transcript(history)
+
+        assert transcript.get_text("truncated", max_chars=5) == "user: xxxxx..."
+        assert transcript.get_text("truncated", max_chars=50) == "user: " + "x" * 20
+        assert transcript.get_text("tagged") == "[user] user: " + "x" * 20
+        with pytest.raises(ValueError):
+            transcript.get_text("markdown")
+
+    def test_direct_appends_and_rewrites(self):
+        history = make_history(3)
+        transcript = Transcript(history)
+        transcript.get_text()
+
+        # Agents append tool steps to the history list without going through the bus
+        history.append(Message(content="tool result", sender="weather_api", sender_type="tool"))
+        assert transcript.get_text() == reference_text(history)
+
+        history[-1] = Message(content="replaced", sender="weather_api", sender_type="tool")
+        assert transcript.get_text() == reference_text(history)
+        del history[1:]
+        assert transcript.get_text() == reference_text(history)
+        history.clear()
+        assert transcript.get_text() == ""
+
+    def test_benchmark_10k_messages(self):
+        """Repeated reads of a long conversation cost a lookup instead of a full rebuild."""
+        history = make_history(10000)
+        transcript = Transcript(history)
+        reads = 50
+
+        start = time.perf_counter()
+        for _ in range(reads):
+            expected = reference_text(history)
+        rebuild_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(reads):
+            text = transcript.get_text()
+        cached_time = time.perf_counter() - start
+
+        assert text == expected
+        assert cached_time * 5 < rebuild_time
+
+        # A new message extends the cached text instead of rendering every message again
+        history.append(Message(content="One more", sender="user", sender_type="user"))
+        assert transcript.get_text() == reference_text(history)
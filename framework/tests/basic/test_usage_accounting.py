@@ -0,0 +1,99 @@
+import pytest
+from maia_test_framework.testing.base import MaiaTest
+from maia_test_framework.core.exceptions import BudgetExceededError
+from maia_test_framework.core.message import AgentResponse, IGNORE_MESSAGE
+from maia_test_framework.core.orchestration_agent import OrchestrationAgent
+from maia_test_framework.core.types.orchestration_policy import OrchestrationPolicy
+from maia_test_framework.core.usage import usage_tracker
+from maia_test_framework.providers.generic_lite_llm import GenericLiteLLMProvider
+from maia_test_framework.providers.mock import MockProvider
+from maia_test_framework.testing.stub_server import StubChatServer
+
+
+class UsageReportingProvider(MockProvider):
+    """Reports five tokens per call."""
+
+    async def generate(self, history, system_message=""):
+        response = await super().generate(history, system_message)
+        return AgentResponse(content=response.content, metadata={"usage": {"prompt_tokens": 3, "completion_tokens": 2}})
+
+
+class TestUsageAccounting(MaiaTest):
+    max_tokens_per_test = 20
+
+    @pytest.fixture(autouse=True)
+    def stub_api_key(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-stub")
+
+    def create_stub_agent(self, name, server, **config):
+        return self.create_agent(
+            name=name,
+            provider=GenericLiteLLMProvider(config={
+                "model": "openai/stub",
+                "api_base": f"{server.url}/v1",
+                "pricing": {"prompt": 1.0, "completion": 2.0},
+                **config,
+            }),
+        )
+
+    @pytest.mark.asyncio
+    async def test_usage_and_cost_per_turn_and_session(self):
+        async with StubChatServer(reply="three word reply") as server:
+            self.create_stub_agent("Alice", server)
+            session = self.create_session(["Alice"])
+            await session.user_says("two words")
+            response = await session.agent_responds("Alice")
+
+        # The stub counts words as tokens
+        assert response.metadata["usage"] == {
+            "prompt_tokens": 2,
+            "completion_tokens": 3,
+            "total_tokens": 5,
+            "cost": pytest.approx((2 * 1.0 + 3 * 2.0) / 1000),
+        }
+        assert session.get_usage().total_tokens == 5
+        assert self.usage_ledger.usage.total_tokens == 5
+
+    @pytest.mark.asyncio
+    async def test_streamed_usage(self):
+        async with StubChatServer(reply="three word reply") as server:
+            self.create_stub_agent("Alice", server, stream=True)
+            session = self.create_session(["Alice"])
+            await session.user_says("two words")
+            response = await session.agent_responds("Alice")
+
+        assert response.metadata["usage"]["total_tokens"] == 5
+
+    @pytest.mark.asyncio
+    async def test_test_budget_aborts_remaining_calls(self):
+        async with StubChatServer(reply="three word reply") as server:
+            self.create_stub_agent("Alice", server)
+            session = self.create_session(["Alice"])
+            with pytest.raises(BudgetExceededError, match="token budget exhausted"):
+                for _ in range(10):
+                    await session.user_says("two words")
+                    await session.agent_responds("Alice")
+
+        # Each turn resends the growing history, so the budget runs out after a few turns
+        assert server.request_counts[("POST", "/v1/chat/completions")] < 10
+        assert self.usage_ledger.usage.total_tokens >= self.max_tokens_per_test
+
+    @pytest.mark.asyncio
+    async def test_session_usage_covers_orchestration_and_ignored_responses(self):
+        self.create_agent(name="Alice", provider=UsageReportingProvider(config={"responses": [IGNORE_MESSAGE]}))
+        self.create_agent(name="Bob", provider=UsageReportingProvider(config={"responses": ["Hello"]}))
+        orchestrator = OrchestrationAgent(provider=UsageReportingProvider(config={"responses": ["Bob"]}))
+        routed = self.create_session(["Bob"], orchestration_agent=orchestrator, orchestration_policy=OrchestrationPolicy.ORCHESTRATION_AGENT)
+        broadcast = self.create_session(["Alice"], orchestration_policy=OrchestrationPolicy.IGNORE_MESSAGE)
+
+        await routed.user_says_and_broadcast("Hi")
+        assert await broadcast.user_says_and_broadcast("Hi") == (None, None)
+
+        assert routed.get_usage().total_tokens == 10
+        assert broadcast.get_usage().total_tokens == 5
+        assert self.usage_ledger.usage.total_tokens == 15
+
+    def test_test_ledger_ends_with_the_test(self):
+        assert usage_tracker.test is self.usage_ledger
+        self.teardown_method(None)
+        assert usage_tracker.test is None
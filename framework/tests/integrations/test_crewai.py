@@ -55,3 +55,8 @@ class TestCrewAIIntegration(MaiaTest):
         response = await session.agent_responds("CrewAgent")
 
         assert "Paris" in response.content
+
+    def test_process_executor_is_rejected(self):
+        crew = self.agents["CrewAgent"].provider.crew
+        with pytest.raises(ValueError, match="'process' executor mode"):
+            CrewAIProvider(config={"crew": crew, "executor": {"mode": "process"}})
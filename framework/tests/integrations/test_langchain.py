@@ -1,5 +1,7 @@
+import asyncio
 import pytest
 from langchain_ollama import OllamaLLM
+from langchain_core.output_parsers import StrOutputParser
 from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 from maia_test_framework.providers.langchain import LangChainProvider
@@ -40,3 +42,44 @@ class TestLangChainIntegration(MaiaTest):
         response = await session.agent_responds("LangChainAgent")
         
         assert "Warsaw" in response.content
+
+
+class TestLangChainRunnableIntegration(MaiaTest):
+    def setup_agents(self):
+        llm = OllamaLLM(model="mistral")
+        prompt = PromptTemplate.from_template("What is the capital of {place}? Answer with the city name only.")
+
+        self.runnable_provider = LangChainProvider(config={
+            "chain": prompt | llm | StrOutputParser(),
+            "input_mapper": simple_input_mapper,
+            "batch": {"max_batch_size": 8, "max_wait": 0.05},
+        })
+
+        self.create_agent(
+            name="RunnableAgent",
+            provider=self.runnable_provider,
+            system_message="You are a helpful assistant.",
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions_are_batched(self):
+        async def ask(place):
+            session = self.create_session(["RunnableAgent"])
+            await session.user_says(f"What is the capital of {place}?")
+            return await session.agent_responds("RunnableAgent")
+
+        poland, france = await asyncio.gather(ask("Poland"), ask("France"))
+
+        assert "Warsaw" in poland.content
+        assert "Paris" in france.content
+        assert poland.metadata["batch_size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_runnable_streaming(self):
+        self.runnable_provider.config["stream"] = True
+        session = self.create_session(["RunnableAgent"])
+        await session.user_says("What is the capital of Poland?")
+        response = await session.agent_responds("RunnableAgent")
+
+        assert "Warsaw" in response.content
+        assert response.time_to_first_token is not None